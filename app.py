@@ -17,6 +17,7 @@ from config.styles import get_custom_css
 
 # 유틸리티 임포트
 from utils.helpers import SessionManager
+from utils.reload_stamp import read_reload_stamp
 
 # 모델 임포트
 from models.job_matcher import AdvancedJobMatcher
@@ -51,13 +52,24 @@ def initialize_app():
         st.stop()
     
     # JobMatcher 초기화
+    stamp = read_reload_stamp(AppConfig.RELOAD_STAMP_PATH) if AppConfig.HOT_RELOAD_ENABLED else None
     if 'job_matcher' not in st.session_state:
         with st.spinner('🤖 AI 시스템을 초기화하고 있습니다...'):
             try:
                 st.session_state.job_matcher = AdvancedJobMatcher(AppConfig.DB_PATH)
+                st.session_state.job_matcher_stamp = stamp
             except Exception as e:
                 st.error(f"시스템 초기화 실패: {e}")
                 st.stop()
+    elif stamp != st.session_state.get('job_matcher_stamp'):
+        # ETL(연속 수집 데몬 포함)이 새 공고/아티팩트를 반영함: 새 매처로 교체
+        with st.spinner('🔄 새 공고 데이터를 불러오고 있습니다...'):
+            try:
+                st.session_state.job_matcher = st.session_state.job_matcher.reloaded()
+            except Exception as e:
+                # 불러오기 실패 시 기존 매처를 계속 쓰고 다음 스탬프 변경 때 다시 시도
+                st.warning(f"새 데이터 불러오기 실패 (기존 데이터 사용): {e}")
+            st.session_state.job_matcher_stamp = stamp
     
     return st.session_state.job_matcher
 
@@ -4,6 +4,7 @@
 import streamlit as st
 from typing import List, Dict, Any, Optional
 import pandas as pd
+from config.settings import AppConfig
 from utils.helpers import UIHelpers, SessionManager
 
 def show_job_matching_interface(matcher: Any):
@@ -17,6 +18,9 @@ def show_job_matching_interface(matcher: Any):
         st.warning("직무 데이터가 없습니다.")
         return
     
+    # 키워드 공고 검색
+    show_keyword_search(matcher)
+    
     # 직무 선택 UI (개선된 카드 스타일)
     st.markdown("### 💼 관심 직무를 선택하세요")
     
@@ -168,6 +172,13 @@ def show_job_matching_interface(matcher: Any):
                     ["전체", "대기업", "중견기업", "스타트업", "외국계"],
                     index=0
                 )
+            
+            keyword_query = st.text_input(
+                "키워드로 후보 공고 좁히기",
+                value=st.session_state.get('keyword_query', ''),
+                placeholder="예: Kafka 결제",
+                help="입력한 단어가 모두 포함된 공고만 매칭합니다 (비우면 전체 공고)"
+            )
     
     with col2:
         # 프로필 완성도 표시
@@ -250,6 +261,7 @@ def show_job_matching_interface(matcher: Any):
                 st.session_state.preferred_locations = preferred_locations
                 st.session_state.preferred_companies = preferred_companies
                 st.session_state.min_salary = min_salary
+                st.session_state.keyword_query = keyword_query
                 
                 with st.spinner("🤖 AI가 최적의 직무를 찾고 있습니다..."):
                     # 선호 조건 설정
@@ -265,7 +277,7 @@ def show_job_matching_interface(matcher: Any):
                     
                     # AI 매칭 실행
                     job_matches = matcher.calculate_advanced_match(
-                        selected_skills, spec_text, preferences
+                        selected_skills, spec_text, preferences, keyword_query=keyword_query
                     )
                     
                     # 선택된 직무 타입으로 필터링
@@ -291,6 +303,33 @@ def show_job_matching_interface(matcher: Any):
     if st.session_state.get('show_results') and 'job_matches' in st.session_state:
         show_matching_results(matcher, st.session_state.job_matches)
 
+def show_keyword_search(matcher: Any):
+    """키워드 공고 검색 (제목/설명/자격 요건/우대 사항)"""
+    with st.expander("🔎 공고 키워드 검색", expanded=False):
+        query = st.text_input(
+            "검색어",
+            key="keyword_search_query",
+            placeholder="예: 쿠버네티스 Go",
+            help="공백으로 구분한 단어가 모두 포함된 공고를 관련도순으로 보여줍니다"
+        )
+        if not query.strip():
+            return
+        
+        results = matcher.search_jobs(query)
+        if results.empty:
+            st.info("검색 결과가 없습니다.")
+            return
+        
+        st.markdown(f"**{len(results)}개 공고** (최대 {AppConfig.KEYWORD_SEARCH_LIMIT}개)")
+        st.dataframe(
+            results[['title', 'company', 'location', 'experience', 'job_type']].rename(columns={
+                'title': '공고명', 'company': '회사', 'location': '지역',
+                'experience': '경력', 'job_type': '직무'
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
+
 def show_matching_results(matcher: Any, job_matches: List[Dict[str, Any]]):
     """매칭 결과 표시"""
     st.markdown("---")
@@ -375,6 +414,7 @@ def show_results_as_cards(matcher: Any, matches: List[Dict[str, Any]]):
                 need_skills = match['missing_skills'][:3]
                 have_html = ''
                 need_html = ''
+                duplicate_text = f" • 유사 공고 {match['duplicate_count']}건 통합" if match.get('duplicate_count') else ''
                 if have_skills:
                     have_html = (
                         f"<div style='margin-top:0.7rem;'>"
@@ -398,6 +438,7 @@ def show_results_as_cards(matcher: Any, matches: List[Dict[str, Any]]):
                             </h4>
                             <p style="color: #a0a0a0;">
                                 {match['company']} • {match['location']} • {match['experience']}
+                                {duplicate_text}
                             </p>
                             <p style="color: #ffa500;">
                                 💰 예상 연봉: {match.get('estimated_salary', 0):,}만원
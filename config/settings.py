@@ -15,8 +15,23 @@ class AppConfig:
     # 데이터베이스 경로
     DB_PATH = "data/job_data.db"
     
-    # 모델 설정
-    EMBEDDING_MODEL = "snunlp/KR-SBERT-V40K-klueNLI-augSTS"
+    # 모델 설정: 질의 인코딩은 임베딩 아티팩트에 기록된 모델을 쓰고,
+    # 이 값은 런타임 코퍼스 인코딩(ALLOW_RUNTIME_CORPUS_ENCODING)에만 쓰인다
+    EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+    
+    # 공고 임베딩은 ETL embed 단계에서 만든다. True면 아티팩트가 없거나 빠진 공고를
+    # 앱에서 직접 인코딩한다 (개발용, 웹 노드에서 전체 코퍼스를 인코딩하게 됨)
+    ALLOW_RUNTIME_CORPUS_ENCODING = False
+    # 런타임 코퍼스 인코딩 프로세스 풀 (ETLConfig.EMBEDDING_WORKERS와 같은 방식)
+    EMBEDDING_WORKERS = 1
+    EMBEDDING_PARALLEL_MIN_TEXTS = 2000
+
+    # 질의 인코더 백엔드: "torch"(fp32), "torch-int8"(torch 동적 양자화), "onnx-int8"(ONNX Runtime 동적 양자화)
+    # 공고 벡터와 백엔드가 다르면 로드할 때 공고 일부를 다시 인코딩해 저장된 벡터와 코사인 일치도를 확인하고,
+    # 평균이 EMBEDDING_MIN_AGREEMENT 미만이면 fp32(torch)로 대체한다
+    EMBEDDING_BACKEND = "torch"
+    EMBEDDING_MIN_AGREEMENT = 0.98
+    EMBEDDING_AGREEMENT_SAMPLE = 32
     
     # UI 설정
     MAX_DISPLAY_JOBS = 20
@@ -25,6 +40,121 @@ class AppConfig:
     # 캐시 설정
     CACHE_TTL = 3600  # 1시간
 
+    # 매칭 결과에서 유사 중복 공고(같은 dup_cluster_id)는 최고 점수 하나만 표시
+    COLLAPSE_DUPLICATE_JOBS = True
+
+    # ETL 모델 아티팩트 경로 (ETLConfig.ARTIFACT_DIR와 같은 위치)
+    ARTIFACT_DIR = "data/artifacts"
+
+    # ETL 실행이 DB/아티팩트를 바꾸면 교체되는 스탬프 (ETLConfig.RELOAD_STAMP_PATH와 같은 위치)
+    # 바뀐 것을 보면 화면을 다시 그릴 때 매처를 새로 만든다
+    HOT_RELOAD_ENABLED = True
+    RELOAD_STAMP_PATH = "data/reload_stamp.json"
+
+    # 키워드 검색 (ETL이 만든 FTS5 인덱스, 없으면 LIKE 검색)
+    KEYWORD_SEARCH_LIMIT = 50
+
+    # 텍스트 유사도: "dense"는 임베딩만, "hybrid"는 ETL TF-IDF 공고 벡터의 어휘 유사도를 가중 합산,
+    # "lexical"은 TF-IDF 어휘 유사도만 (질의 인코더/임베딩을 로드하지 않아 torch 없이 동작, 저사양 노드용)
+    RETRIEVAL_MODE = "hybrid"
+    HYBRID_LEXICAL_WEIGHT = 0.3
+    # 공고가 이 수 이상이면 어휘 유사도 상위 HYBRID_PRUNE_CANDIDATES개만 후보로 점수 계산
+    HYBRID_PRUNE_MIN_JOBS = 20000
+    HYBRID_PRUNE_CANDIDATES = 2000
+
+@dataclass
+class ETLConfig:
+    """데이터 처리(ETL) 설정"""
+    # 데이터 경로
+    CSV_PATH = "data/job_infos.csv"
+    DB_PATH = "data/job_data.db"
+
+    # DB 쓰기 설정
+    DB_WRITE_BATCH_SIZE = 500     # 공고 UPSERT 배치 크기 (트랜잭션당 행 수)
+    LLM_RESULT_BATCH_SIZE = 50    # LLM 추출 결과 커밋 배치 크기
+    LLM_RESULT_FLUSH_SECONDS = 1.0  # 배치가 차지 않아도 첫 미기록 결과 후 이 시간이 지나면 커밋
+
+    # LLM 추출 설정
+    LLM_MODEL = "llama-3.3-70b"
+    LLM_TEMPERATURE = 0.0
+    LLM_CONCURRENCY = 8           # 동시에 처리 중인 최대 LLM 요청 수
+
+    # 패킹 모드: 여러 공고를 한 요청으로 묶어 분당 요청 수 한도 절약
+    LLM_PACKING = False
+    LLM_PACK_MAX_ITEMS = 8                 # 요청당 최대 공고 수
+    LLM_PACK_TOKEN_BUDGET = 4000           # 요청당 추정 토큰 예산 (입력 + 출력 여유분)
+    LLM_PACK_OUTPUT_TOKENS_PER_ITEM = 80   # 공고당 출력 토큰 여유분
+
+    # 텍스트 정제 (열 단위, 1보다 크면 행 구간별 프로세스 풀)
+    TEXT_NORMALIZATION_WORKERS = 1
+    TEXT_NORMALIZATION_CHUNK_SIZE = 20000
+
+    # 모델 아티팩트 (TF-IDF 모델/벡터, 주요 스킬 목록) 저장 경로와 보관 버전 수
+    ARTIFACT_DIR = "data/artifacts"
+    ARTIFACT_KEEP_VERSIONS = 3
+
+    # 공고 임베딩 (embed 단계, 앱의 질의 인코딩과 같은 모델)
+    EMBEDDING_ENABLED = True
+    EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+    EMBEDDING_BATCH_SIZE = 256      # 배치 최대 공고 수
+    EMBEDDING_TOKEN_BUDGET = 16384  # 배치 최대 토큰 수 × 배치 크기 상한 (토큰 길이순 버킷별 배치 크기)
+    # 1보다 크면 고유 텍스트가 EMBEDDING_PARALLEL_MIN_TEXTS개 이상일 때 프로세스 풀로 인코딩
+    # (워커마다 인코더 하나, 워커당 스레드 = CPU 수 // 워커 수)
+    EMBEDDING_WORKERS = 1
+    EMBEDDING_PARALLEL_MIN_TEXTS = 2000
+    # 인코더 백엔드: "torch"(fp32), "torch-int8"(torch 동적 양자화), "onnx-int8"(ONNX Runtime 동적 양자화)
+    # 바꾸면 전체 공고를 다시 인코딩한다
+    EMBEDDING_BACKEND = "torch"
+
+    # TF-IDF (TfidfVectorizer와 같은 min_df/max_df, 증분 갱신)
+    TFIDF_MIN_DF = 0.01
+    TFIDF_MAX_DF = 0.9
+    TFIDF_IDF_DRIFT_THRESHOLD = 0.05   # 평균 IDF 변화율이 이 값을 넘으면 전체 행 재가중
+
+    # 유사 중복 공고 탐지 (MinHash LSH, cleaned_text 단어 shingle)
+    DEDUP_ENABLED = True
+    DEDUP_NUM_PERM = 128          # MinHash 서명 길이
+    DEDUP_BANDS = 16              # LSH band 수 (band당 8행, 후보 기준 유사도 약 0.7)
+    DEDUP_SHINGLE_SIZE = 3        # 단어 k-gram 크기
+    DEDUP_THRESHOLD = 0.8         # 같은 클러스터로 묶을 최소 추정 Jaccard 유사도
+    DEDUP_SEED = 1
+
+    # CSV에서 빠진 공고 삭제 (DB/단계 상태/TF-IDF/중복 탐지/임베딩)
+    # 저장된 공고 중 이 비율보다 많이 빠지면 CSV 누락으로 보고 삭제하지 않는다
+    DELETE_MISSING_POSTINGS = True
+    DELETE_MAX_FRACTION = 0.5
+
+    # 공고 키워드 검색 인덱스 (FTS5 jobs_fts: title/description/requirements/preferred)
+    # trigram은 한글/영문 부분 문자열 검색용 (SQLite 3.34+, 없으면 unicode61로 대체)
+    FTS_ENABLED = True
+    FTS_TOKENIZER = "trigram"
+
+    # 실행 리포트 (단계별 시간/처리 속도, 최대 메모리, LLM 지연/재시도/토큰, 리미터 대기 JSON)
+    RUN_REPORT_DIR = "data/run_reports"
+
+    # 앱 핫 리로드 스탬프 (DB/아티팩트를 바꾼 실행 후 교체, AppConfig.RELOAD_STAMP_PATH와 같은 위치)
+    RELOAD_STAMP_PATH = "data/reload_stamp.json"
+
+    # 연속 수집 데몬 (scripts/ingest_daemon.py)
+    INGEST_DROP_DIR = "data/incoming"   # 새 CSV 파일을 떨어뜨리는 디렉터리
+    INGEST_POLL_SECONDS = 5.0           # 새 파일/추가 행 확인 주기
+    INGEST_MAX_BATCH_ROWS = 5000        # 마이크로 배치 하나의 최대 공고 수
+    INGEST_STATE_PATH = "data/ingest_state.json"   # 추가 전용 CSV의 처리한 위치(바이트 오프셋)
+    INGEST_MAX_ATTEMPTS = 3             # 처리에 연속 실패한 드롭 파일은 failed/로 이동
+    INGEST_FLUSH_SECONDS = 60.0         # 아티팩트 저장을 미루는 최대 시간 (새 공고가 없으면 바로 저장)
+
+    # 실패/폴백 결과 공고의 자동 재추출 최대 시도 횟수 (이후에는 --retry-fallback으로만 재시도)
+    EXTRACTION_MAX_ATTEMPTS = 3
+
+    # LLM 추출 캐시 (job_data.db를 재생성해도 유지)
+    LLM_CACHE_ENABLED = True
+    LLM_CACHE_PATH = "data/llm_cache.db"
+
+    # 사전 기반 빠른 경로: 학습 어휘는 LLM 캐시 파일에 함께 저장
+    LOCAL_EXTRACTION_ENABLED = True
+    LOCAL_MIN_OBSERVATIONS = 3    # 학습 토큰 판정에 필요한 최소 LLM 관측 횟수
+    LOCAL_MIN_CONFIDENCE = 0.95   # 학습 토큰 판정에 필요한 최소 일치 비율
+
 @dataclass
 class ColorTheme:
     """색상 테마"""
@@ -0,0 +1,400 @@
+"""
+직무 공고 임베딩
+
+ETL(scripts/data_processing.py)의 embed 단계가 새/변경 공고만 배치로 인코딩해
+모델 이름/차원 메타데이터와 함께 아티팩트로 저장한다.
+앱은 저장된 벡터를 읽기 전용(mmap)으로 불러오고 사용자 질의만 인코딩한다.
+
+벡터는 L2 정규화해 저장하므로 코사인 유사도는 내적으로 계산한다.
+유사 중복 공고는 대표 공고(dup_cluster_id)만 인코딩하고 대표 벡터를 함께 쓴다.
+
+인코더 백엔드 (AppConfig/ETLConfig.EMBEDDING_BACKEND):
+    - torch: SentenceTransformer fp32
+    - torch-int8: Linear 층을 torch 동적 int8 양자화 (CPU)
+    - onnx-int8: 트랜스포머를 ONNX로 내보내 가중치를 동적 int8 양자화하고 ONNX Runtime으로 실행
+      (처음 한 번 내보낼 때만 torch가 필요하고, 이후에는 onnxruntime + tokenizers만 쓴다)
+
+공고가 많으면 EncoderPool로 고유 텍스트를 여러 프로세스(워커마다 인코더 하나, 스레드 수 고정)에 나눠 인코딩한다.
+"""
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+EMBEDDING_IDS = 'job_embedding_ids'
+EMBEDDING_VECTORS = 'job_embeddings'
+EMBEDDING_META = 'embedding_meta'
+
+EMBEDDING_BACKENDS = ('torch', 'torch-int8', 'onnx-int8')
+ONNX_MODEL_FILE = 'model.onnx'
+ONNX_INT8_FILE = 'model_int8.onnx'
+ONNX_META_FILE = 'encoder.json'
+
+
+def embedding_text(description, requirements) -> str:
+    """공고 임베딩 입력 텍스트 (직무 설명 + 자격 요건)"""
+    return f"{description or ''} {requirements or ''}"
+
+
+def _encoder_cache_dir() -> str:
+    """모델 캐시 디렉토리 (고정)"""
+    cache_dir = os.path.expanduser('~/sentence_transformers_cache')
+    os.makedirs(cache_dir, exist_ok=True)
+    os.environ['SENTENCE_TRANSFORMERS_HOME'] = cache_dir
+    os.environ['HF_HOME'] = cache_dir
+    os.environ['TRANSFORMERS_CACHE'] = cache_dir
+    return cache_dir
+
+
+def load_encoder(model_name: str, backend: str = 'torch', threads: Optional[int] = None):
+    """질의/공고 인코더 (캐시 디렉토리 고정, 첫 사용 시 import)
+
+    반환 객체는 모두 encode()/get_sentence_embedding_dimension()을 제공한다.
+    threads를 주면 연산 스레드 수를 고정한다 (프로세스 풀 워커용).
+    """
+    if backend not in EMBEDDING_BACKENDS:
+        raise ValueError(f"알 수 없는 임베딩 백엔드: {backend} (가능: {', '.join(EMBEDDING_BACKENDS)})")
+    cache_dir = _encoder_cache_dir()
+    if backend == 'onnx-int8':
+        return OnnxEncoder.load(model_name, cache_dir, threads)
+
+    if threads:
+        import torch
+        torch.set_num_threads(threads)
+    from sentence_transformers import SentenceTransformer
+    if backend == 'torch':
+        return SentenceTransformer(model_name, cache_folder=cache_dir)
+
+    import torch
+    encoder = SentenceTransformer(model_name, cache_folder=cache_dir, device='cpu')
+    return torch.quantization.quantize_dynamic(encoder, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+
+
+def export_onnx_int8(model_name: str, cache_dir: str, model_dir: str):
+    """SentenceTransformer의 트랜스포머를 ONNX로 내보내고 가중치를 동적 int8 양자화 (torch, onnxruntime 필요)"""
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from sentence_transformers import SentenceTransformer
+
+    encoder = SentenceTransformer(model_name, cache_folder=cache_dir, device='cpu')
+    transformer, pooling = encoder[0], encoder[1]
+    if not getattr(pooling, 'pooling_mode_mean_tokens', False):
+        raise ValueError(f"onnx-int8 백엔드는 평균 풀링 모델만 지원합니다: {model_name}")
+
+    os.makedirs(model_dir, exist_ok=True)
+    transformer.tokenizer.save_pretrained(model_dir)
+    sample = transformer.tokenizer(['임베딩 모델 내보내기'], return_tensors='pt')
+    input_names = [name for name in ('input_ids', 'attention_mask', 'token_type_ids') if name in sample]
+    transformer.auto_model.config.return_dict = False
+    model_path = os.path.join(model_dir, ONNX_MODEL_FILE)
+    with torch.no_grad():
+        torch.onnx.export(
+            transformer.auto_model, tuple(sample[name] for name in input_names), model_path,
+            input_names=input_names, output_names=['last_hidden_state'], opset_version=14,
+            dynamic_axes={name: {0: 'batch', 1: 'sequence'} for name in input_names + ['last_hidden_state']}
+        )
+    quantize_dynamic(model_path, os.path.join(model_dir, ONNX_INT8_FILE), weight_type=QuantType.QInt8)
+    with open(os.path.join(model_dir, ONNX_META_FILE), 'w', encoding='utf-8') as f:
+        json.dump({
+            'model': model_name, 'dimension': encoder.get_sentence_embedding_dimension(),
+            'max_seq_length': encoder.max_seq_length, 'pad_token': transformer.tokenizer.pad_token,
+            'pad_id': transformer.tokenizer.pad_token_id
+        }, f, ensure_ascii=False, indent=2)
+
+
+class OnnxEncoder:
+    """ONNX Runtime int8 인코더 (SentenceTransformer.encode 호환, 평균 풀링)"""
+
+    def __init__(self, session, tokenizer, dimension: int):
+        self.session = session
+        self.tokenizer = tokenizer
+        self.dimension = dimension
+        self.input_names = {model_input.name for model_input in session.get_inputs()}
+
+    @staticmethod
+    def model_dir(model_name: str, cache_dir: str) -> str:
+        """양자화 모델 디렉토리 (없으면 처음 한 번 내보내기)"""
+        model_dir = os.path.join(cache_dir, 'onnx', model_name.replace('/', '__'))
+        if not os.path.exists(os.path.join(model_dir, ONNX_META_FILE)):
+            print(f"ONNX int8 모델 내보내기: {model_name} -> {model_dir}")
+            export_onnx_int8(model_name, cache_dir, model_dir)
+        return model_dir
+
+    @classmethod
+    def load(cls, model_name: str, cache_dir: str, threads: Optional[int] = None) -> 'OnnxEncoder':
+        """캐시의 양자화 모델 로드"""
+        import onnxruntime
+        from tokenizers import Tokenizer
+
+        model_dir = cls.model_dir(model_name, cache_dir)
+        with open(os.path.join(model_dir, ONNX_META_FILE), encoding='utf-8') as f:
+            meta = json.load(f)
+
+        tokenizer = Tokenizer.from_file(os.path.join(model_dir, 'tokenizer.json'))
+        tokenizer.enable_truncation(max_length=meta['max_seq_length'])
+        tokenizer.enable_padding(pad_id=meta['pad_id'], pad_token=meta['pad_token'])
+        options = onnxruntime.SessionOptions()
+        if threads:
+            options.intra_op_num_threads = threads
+            options.inter_op_num_threads = 1
+        session = onnxruntime.InferenceSession(os.path.join(model_dir, ONNX_INT8_FILE), options,
+                                               providers=['CPUExecutionProvider'])
+        return cls(session, tokenizer, meta['dimension'])
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dimension
+
+    def token_lengths(self, texts: List[str]) -> np.ndarray:
+        """텍스트별 토큰 수 (최대 길이에서 자름)"""
+        return np.array([sum(encoding.attention_mask) for encoding in self.tokenizer.encode_batch(list(texts))],
+                        dtype=np.int64)
+
+    def encode(self, texts: List[str], batch_size: int = 32, convert_to_numpy: bool = True,
+               normalize_embeddings: bool = False, show_progress_bar: bool = False) -> np.ndarray:
+        """문장 임베딩 (마스크 평균 풀링, 길이순 배치로 패딩 최소화)"""
+        texts = list(texts)
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        order = np.argsort([-len(text) for text in texts], kind='stable')
+        for start in range(0, len(texts), batch_size):
+            batch = order[start:start + batch_size]
+            encodings = self.tokenizer.encode_batch([texts[i] for i in batch])
+            mask = np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64)
+            feeds = {'input_ids': np.array([encoding.ids for encoding in encodings], dtype=np.int64),
+                     'attention_mask': mask}
+            if 'token_type_ids' in self.input_names:
+                feeds['token_type_ids'] = np.array([encoding.type_ids for encoding in encodings], dtype=np.int64)
+            hidden = self.session.run(None, feeds)[0]
+            summed = (hidden * mask[:, :, None]).sum(axis=1)
+            vectors[batch] = summed / np.clip(mask.sum(axis=1, keepdims=True), 1e-9, None)
+        if normalize_embeddings:
+            vectors /= np.clip(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12, None)
+        return vectors
+
+
+def encode_texts(encoder, texts: List[str], batch_size: int = 256,
+                 show_progress_bar: bool = False) -> np.ndarray:
+    """L2 정규화된 float32 임베딩 행렬"""
+    vectors = encoder.encode(list(texts), batch_size=batch_size, convert_to_numpy=True,
+                             normalize_embeddings=True, show_progress_bar=show_progress_bar)
+    return np.asarray(vectors, dtype=np.float32)
+
+
+def token_lengths(encoder, texts: List[str]) -> np.ndarray:
+    """인코더 토크나이저 기준 텍스트별 토큰 수 (토크나이저가 없으면 문자 수로 근사)"""
+    if isinstance(encoder, OnnxEncoder):
+        return encoder.token_lengths(texts)
+    tokenizer = getattr(encoder, 'tokenizer', None)
+    if tokenizer is None:
+        return np.array([len(text) for text in texts], dtype=np.int64)
+    input_ids = tokenizer(list(texts), truncation=True, max_length=getattr(encoder, 'max_seq_length', None))['input_ids']
+    return np.array([len(ids) for ids in input_ids], dtype=np.int64)
+
+
+def length_buckets(lengths: np.ndarray, token_budget: int, max_batch_size: int) -> List[np.ndarray]:
+    """토큰 길이 내림차순 위치 배치 (배치 최대 길이 × 배치 크기 <= token_budget, 최소 1개)"""
+    order = np.argsort(-np.asarray(lengths), kind='stable')
+    batches = []
+    start = 0
+    while start < len(order):
+        size = int(min(max(token_budget // max(int(lengths[order[start]]), 1), 1), max_batch_size))
+        batches.append(order[start:start + size])
+        start += size
+    return batches
+
+
+def encode_corpus(encoder, texts: List[str], token_budget: int = 16384, max_batch_size: int = 256,
+                  show_progress_bar: bool = False) -> np.ndarray:
+    """공고 코퍼스 인코딩 (입력 순서의 L2 정규화 float32 행렬)
+
+    같은 텍스트는 한 번만 인코딩하고, 토큰 길이 내림차순으로 묶어 배치마다 패딩을 줄인다.
+    배치 크기는 배치 최대 토큰 수 × 배치 크기가 token_budget을 넘지 않게 정한다 (짧은 텍스트는 큰 배치).
+    """
+    texts = list(texts)
+    unique_positions = {}
+    inverse = np.fromiter((unique_positions.setdefault(text, len(unique_positions)) for text in texts),
+                          dtype=np.int64, count=len(texts))
+    unique_texts = list(unique_positions)
+    if not unique_texts:
+        return np.zeros((0, encoder.get_sentence_embedding_dimension()), dtype=np.float32)
+
+    batches = length_buckets(token_lengths(encoder, unique_texts), token_budget, max_batch_size)
+    if show_progress_bar:
+        from tqdm import tqdm
+        batches = tqdm(batches, desc="Batches")
+    vectors = None
+    for batch in batches:
+        encoded = encode_texts(encoder, [unique_texts[i] for i in batch], batch_size=len(batch))
+        if vectors is None:
+            vectors = np.zeros((len(unique_texts), encoded.shape[1]), dtype=np.float32)
+        vectors[batch] = encoded
+    return vectors[inverse]
+
+
+# 풀 워커 프로세스의 인코더 (_init_pool_worker가 한 번 로드)
+_pool_encoder = None
+
+
+def _init_pool_worker(model_name: str, backend: str, threads: int):
+    """풀 워커 초기화: 스레드 수를 고정하고 인코더 로드"""
+    global _pool_encoder
+    os.environ['OMP_NUM_THREADS'] = str(threads)
+    os.environ['MKL_NUM_THREADS'] = str(threads)
+    os.environ['TOKENIZERS_PARALLELISM'] = 'false'
+    _pool_encoder = load_encoder(model_name, backend, threads)
+
+
+def _encode_shard(texts: List[str], token_budget: int, max_batch_size: int) -> np.ndarray:
+    return encode_corpus(_pool_encoder, texts, token_budget, max_batch_size)
+
+
+def _pool_encoder_dimension() -> int:
+    return _pool_encoder.get_sentence_embedding_dimension()
+
+
+class EncoderPool:
+    """공고 코퍼스 다중 프로세스 인코딩 (워커마다 인코더 하나, 워커당 스레드 수 고정)
+
+    torch/onnxruntime 스레드 풀은 fork 후 안전하지 않으므로 워커는 spawn으로 띄운다.
+    워커 인코더는 풀을 닫을 때까지 유지되므로 연속 수집 데몬은 배치마다 모델을 다시 로드하지 않는다.
+    """
+
+    def __init__(self, model_name: str, workers: int, backend: str = 'torch',
+                 threads_per_worker: Optional[int] = None):
+        self.workers = max(1, workers)
+        self.threads = threads_per_worker or max(1, (os.cpu_count() or 1) // self.workers)
+        self._dimension: Optional[int] = None
+        if backend == 'onnx-int8':
+            # 워커들이 동시에 내보내지 않도록 먼저 한 번 내보내기
+            OnnxEncoder.model_dir(model_name, _encoder_cache_dir())
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_pool_worker, initargs=(model_name, backend, self.threads)
+        )
+
+    def __enter__(self) -> 'EncoderPool':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def warm_up(self):
+        """워커 프로세스를 모두 띄워 인코더를 미리 로드"""
+        list(self._pool.map(_encode_shard, [['warm up']] * self.workers,
+                            [1024] * self.workers, [1] * self.workers))
+
+    @property
+    def dimension(self) -> int:
+        """워커 인코더의 임베딩 차원 (첫 조회 때 워커에 한 번 묻는다)"""
+        if self._dimension is None:
+            self._dimension = self._pool.submit(_pool_encoder_dimension).result()
+        return self._dimension
+
+    def encode(self, texts: List[str], token_budget: int = 16384, max_batch_size: int = 256) -> np.ndarray:
+        """encode_corpus와 같은 결과 (입력 순서의 L2 정규화 float32 행렬)
+
+        고유 텍스트를 길이순으로 번갈아 워커 수 × 4개 조각에 나눠, 조각마다 길이 분포가 비슷하고
+        먼저 끝난 워커가 남은 조각을 가져가게 한다.
+        """
+        texts = list(texts)
+        unique_positions = {}
+        inverse = np.fromiter((unique_positions.setdefault(text, len(unique_positions)) for text in texts),
+                              dtype=np.int64, count=len(texts))
+        unique_texts = list(unique_positions)
+        if not unique_texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+
+        order = np.argsort([-len(text) for text in unique_texts], kind='stable')
+        shards = [shard for shard in (order[i::self.workers * 4] for i in range(self.workers * 4)) if len(shard)]
+        futures = [self._pool.submit(_encode_shard, [unique_texts[i] for i in shard], token_budget, max_batch_size)
+                   for shard in shards]
+        vectors = None
+        for shard, future in zip(shards, futures):
+            encoded = future.result()
+            if vectors is None:
+                vectors = np.zeros((len(unique_texts), encoded.shape[1]), dtype=np.float32)
+            vectors[shard] = encoded
+        return vectors[inverse]
+
+    def close(self):
+        self._pool.shutdown()
+
+
+def cosine_agreement(reference: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+    """같은 입력을 두 인코더로 만든 벡터의 행별 코사인 유사도 (백엔드 간 일치도)"""
+    reference = np.asarray(reference, dtype=np.float64)
+    candidate = np.asarray(candidate, dtype=np.float64)
+    norms = np.linalg.norm(reference, axis=1) * np.linalg.norm(candidate, axis=1)
+    return (reference * candidate).sum(axis=1) / np.clip(norms, 1e-12, None)
+
+
+class JobEmbeddings:
+    """job_id에 정렬된 공고 임베딩 행렬"""
+
+    def __init__(self, model_name: str, dimension: int,
+                 job_ids: Optional[np.ndarray] = None, vectors: Optional[np.ndarray] = None,
+                 backend: str = 'torch'):
+        self.model_name = model_name
+        self.dimension = dimension
+        self.backend = backend
+        self.job_ids = job_ids if job_ids is not None else np.zeros(0, dtype=np.int64)
+        self.vectors = vectors if vectors is not None else np.zeros((0, dimension), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def update(self, job_ids: Iterable[int], vectors: np.ndarray):
+        """새/변경 공고 벡터 반영 (기존 행은 교체)"""
+        job_ids = np.asarray(list(job_ids), dtype=np.int64)
+        if vectors.shape[1:] != (self.dimension,):
+            raise ValueError(f"임베딩 차원이 다릅니다: {vectors.shape[1:]} != ({self.dimension},)")
+        keep = ~np.isin(self.job_ids, job_ids)
+        self.job_ids = np.concatenate([self.job_ids[keep], job_ids])
+        self.vectors = np.vstack([self.vectors[keep], vectors.astype(np.float32)])
+
+    def remove(self, job_ids: Iterable[int]) -> int:
+        """삭제된 공고 벡터 제거 (제거한 행 수)"""
+        dropped = np.isin(self.job_ids, np.fromiter(job_ids, dtype=np.int64))
+        if dropped.any():
+            self.job_ids = self.job_ids[~dropped]
+            self.vectors = self.vectors[~dropped]
+        return int(dropped.sum())
+
+    def rows_for(self, job_ids: Iterable[int]) -> np.ndarray:
+        """job_id → 벡터 행 위치 (없으면 -1)"""
+        position_by_id = {int(job_id): position for position, job_id in enumerate(self.job_ids)}
+        return np.fromiter((position_by_id.get(int(job_id), -1) for job_id in job_ids), dtype=np.int64)
+
+    def similarities(self, query: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """정규화된 질의 벡터와 rows 위치 벡터의 코사인 유사도 (행이 없으면 0)"""
+        query = np.asarray(query, dtype=np.float32)
+        if not len(self.vectors):
+            return np.zeros(len(rows))
+        if 2 * len(rows) < len(self.vectors):
+            # 후보가 일부(키워드 사전 필터)면 해당 행만 계산
+            scores = self.vectors[np.maximum(rows, 0)] @ query
+            return np.where(rows >= 0, scores, 0.0)
+        scores = self.vectors @ query
+        return np.where(rows >= 0, scores[np.maximum(rows, 0)], 0.0)
+
+    def save(self, writer):
+        """아티팩트로 저장 (ArtifactWriter)"""
+        writer.add_json(EMBEDDING_META, {
+            'model': self.model_name, 'dimension': self.dimension, 'backend': self.backend,
+            'normalized': True, 'count': len(self)
+        })
+        writer.add_array(EMBEDDING_IDS, self.job_ids)
+        writer.add_array(EMBEDDING_VECTORS, self.vectors)
+
+    @classmethod
+    def load(cls, store, mmap: bool = True) -> Optional['JobEmbeddings']:
+        """아티팩트에서 불러오기 (없으면 None, mmap=True면 읽기 전용)"""
+        if EMBEDDING_META not in store:
+            return None
+        meta = store.load_json(EMBEDDING_META)
+        return cls(meta['model'], meta['dimension'],
+                   store.load_array(EMBEDDING_IDS, mmap=mmap),
+                   store.load_array(EMBEDDING_VECTORS, mmap=mmap),
+                   meta.get('backend', 'torch'))
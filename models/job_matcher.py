@@ -9,31 +9,35 @@ from datetime import timedelta
 import pandas as pd
 import numpy as np
 from collections import Counter
-from sentence_transformers import SentenceTransformer, util
 import streamlit as st
 from sklearn.preprocessing import MinMaxScaler
-import torch
+from config.settings import AppConfig
+from models.embeddings import (EncoderPool, JobEmbeddings, cosine_agreement, embedding_text, encode_corpus,
+                               encode_texts, load_encoder)
+from models.lexical import LexicalIndex
+from utils.artifacts import ArtifactStore
+from utils.fts_search import search_job_ids
+from utils.skill_aliases import canonicalize_skills
 
 class AdvancedJobMatcher:
     """최적화된 직무 매칭 시스템"""
 
-    def __init__(self, db_path: str = 'data/job_data.db'):
-        # 캐시 디렉토리 강제 설정
-        cache_dir = os.path.expanduser('~/sentence_transformers_cache')
-        os.makedirs(cache_dir, exist_ok=True)
-        os.environ['SENTENCE_TRANSFORMERS_HOME'] = cache_dir
-        os.environ['HF_HOME'] = cache_dir
-        os.environ['TRANSFORMERS_CACHE'] = cache_dir
-        
+    def __init__(self, db_path: str = 'data/job_data.db', encoders: Optional[Dict[str, Any]] = None):
         self.db_path = db_path
+        # (모델 이름, 백엔드) → 질의 인코더 (reloaded()로 다시 만든 매처와 공유)
+        self._encoders = {} if encoders is None else encoders
         self._validate_database()
         self._initialize_data()
         
-        self.embedder = SentenceTransformer('all-MiniLM-L6-v2', cache_folder=cache_dir)
-        self._create_job_vectors()
+        self._load_job_vectors()
+        self._load_lexical_index()
         self.skill_clusters = self._create_skill_clusters()
         self.career_paths = self._create_career_paths()
 
+    def reloaded(self) -> 'AdvancedJobMatcher':
+        """DB/아티팩트를 다시 읽은 새 매처 (질의 인코더는 재사용)"""
+        return AdvancedJobMatcher(self.db_path, self._encoders)
+
     def _validate_database(self):
         """데이터베이스 유효성 검사"""
         if not os.path.exists(self.db_path):
@@ -48,9 +52,14 @@ class AdvancedJobMatcher:
         self.df['skills'] = self.df['skills'].apply(
             lambda x: json.loads(x) if pd.notna(x) else []
         )
+        # 이전 버전 ETL로 적재된 표기도 대표 표기로 통일
         self.df['llm_extracted_tech_skills'] = self.df['llm_extracted_tech_skills'].apply(
-            lambda x: json.loads(x) if pd.notna(x) else []
+            lambda x: canonicalize_skills(json.loads(x)) if pd.notna(x) else []
         )
+        # 유사 중복 클러스터 (이전 버전 DB는 모두 단독 공고로 취급)
+        if 'dup_cluster_id' not in self.df.columns:
+            self.df['dup_cluster_id'] = self.df['job_id']
+        self.df['dup_cluster_id'] = self.df['dup_cluster_id'].fillna(self.df['job_id']).astype(int)
 
         # 메타데이터 생성
         self._create_metadata()
@@ -74,10 +83,96 @@ class AdvancedJobMatcher:
             lambda x: 3000 + (x * 500) + np.random.randint(-500, 500)
         )
 
-    def _create_job_vectors(self):
-        """임베딩 벡터 생성"""
-        texts = self.df['description'].fillna('') + ' ' + self.df['requirements'].fillna('')
-        self.job_vectors = self.embedder.encode(list(texts), convert_to_tensor=True)
+    def _load_job_vectors(self):
+        """ETL embed 단계가 저장한 공고 임베딩을 읽기 전용으로 로드 (질의 인코더만 생성)
+
+        유사 중복 공고는 대표 공고(dup_cluster_id) 벡터를 쓴다.
+        어휘 모드는 임베딩/인코더를 쓰지 않으므로 sentence_transformers(torch)를 import하지 않는다.
+        """
+        self.embedder = None
+        self.job_embeddings = None
+        self.job_vector_rows = None
+        if AppConfig.RETRIEVAL_MODE == 'lexical':
+            return
+        store = ArtifactStore.open(AppConfig.ARTIFACT_DIR)
+        embeddings = JobEmbeddings.load(store) if store is not None else None
+        if embeddings is None and not AppConfig.ALLOW_RUNTIME_CORPUS_ENCODING:
+            raise FileNotFoundError(
+                f"공고 임베딩 아티팩트가 없습니다: {AppConfig.ARTIFACT_DIR} "
+                "(python scripts/data_processing.py 로 먼저 생성하세요)"
+            )
+
+        model_name = embeddings.model_name if embeddings is not None else AppConfig.EMBEDDING_MODEL
+        self.embedder = self._query_encoder(model_name, embeddings)
+        if embeddings is None:
+            embeddings = JobEmbeddings(model_name, self.embedder.get_sentence_embedding_dimension(),
+                                       backend=AppConfig.EMBEDDING_BACKEND)
+
+        rows = embeddings.rows_for(self.df['dup_cluster_id'])
+        missing = rows < 0
+        if missing.any() and AppConfig.ALLOW_RUNTIME_CORPUS_ENCODING:
+            # 개발용: 벡터가 없는 공고만 메모리에서 인코딩 (아티팩트는 읽기 전용)
+            targets = self.df[missing].drop_duplicates('dup_cluster_id')
+            texts = [embedding_text(description, requirements) for description, requirements
+                     in zip(targets['description'], targets['requirements'])]
+            if AppConfig.EMBEDDING_WORKERS > 1 and len(texts) >= AppConfig.EMBEDDING_PARALLEL_MIN_TEXTS:
+                with EncoderPool(embeddings.model_name, AppConfig.EMBEDDING_WORKERS, embeddings.backend) as pool:
+                    vectors = pool.encode(texts)
+            else:
+                vectors = encode_corpus(self.embedder, texts)
+            embeddings = JobEmbeddings(
+                embeddings.model_name, embeddings.dimension,
+                np.concatenate([embeddings.job_ids, targets['dup_cluster_id'].to_numpy(dtype=np.int64)]),
+                np.vstack([embeddings.vectors, vectors]),
+                embeddings.backend
+            )
+            rows = embeddings.rows_for(self.df['dup_cluster_id'])
+        elif missing.any():
+            print(f"경고: 임베딩이 없는 공고 {int(missing.sum())}개는 텍스트 유사도 0으로 계산됩니다. "
+                  "ETL을 다시 실행하세요.")
+
+        self.job_embeddings = embeddings
+        self.job_vector_rows = rows
+
+    def _query_encoder(self, model_name: str, embeddings: Optional[JobEmbeddings]):
+        """AppConfig.EMBEDDING_BACKEND 질의 인코더 (공고 벡터와 백엔드가 다르면 처음 한 번 일치도 확인)"""
+        backend = AppConfig.EMBEDDING_BACKEND
+        key = (model_name, backend)
+        if key in self._encoders:
+            return self._encoders[key]
+
+        encoder = load_encoder(model_name, backend)
+        if embeddings is not None and len(embeddings) and embeddings.backend != backend:
+            sample = self.df[self.df['job_id'].isin(embeddings.job_ids[:AppConfig.EMBEDDING_AGREEMENT_SAMPLE])]
+            texts = [embedding_text(description, requirements)
+                     for description, requirements in zip(sample['description'], sample['requirements'])]
+            if texts:
+                stored = embeddings.vectors[embeddings.rows_for(sample['job_id'])]
+                agreement = float(cosine_agreement(stored, encode_texts(encoder, texts)).mean())
+                if agreement < AppConfig.EMBEDDING_MIN_AGREEMENT:
+                    print(f"경고: {backend} 인코더와 공고 벡터({embeddings.backend})의 코사인 일치도 "
+                          f"{agreement:.4f} < {AppConfig.EMBEDDING_MIN_AGREEMENT}. fp32(torch) 인코더를 사용합니다.")
+                    encoder = self._encoders.get((model_name, 'torch')) or load_encoder(model_name)
+        self._encoders[key] = encoder
+        return encoder
+
+    def _load_lexical_index(self):
+        """하이브리드/어휘 모드: ETL tfidf 단계가 저장한 TF-IDF 공고 벡터 로드 (하이브리드는 없으면 임베딩만 사용)"""
+        self.lexical_index = None
+        self.lexical_rows = None
+        if AppConfig.RETRIEVAL_MODE not in ('hybrid', 'lexical'):
+            return
+        store = ArtifactStore.open(AppConfig.ARTIFACT_DIR)
+        self.lexical_index = LexicalIndex.load(store) if store is not None else None
+        if self.lexical_index is None and AppConfig.RETRIEVAL_MODE == 'lexical':
+            raise FileNotFoundError(
+                f"어휘 모드에 필요한 TF-IDF 아티팩트가 없습니다: {AppConfig.ARTIFACT_DIR} "
+                "(python scripts/data_processing.py 로 먼저 생성하세요)"
+            )
+        if self.lexical_index is None:
+            print("경고: TF-IDF 아티팩트가 없어 임베딩 유사도만 사용합니다.")
+            return
+        self.lexical_rows = self.lexical_index.rows_for(self.df['job_id'])
 
     def _create_skill_clusters(self) -> Dict[str, List[str]]:
         """스킬 클러스터 생성"""
@@ -151,19 +246,78 @@ class AdvancedJobMatcher:
             }
         }
     
+    def search_job_ids(self, query: str, limit: Optional[int] = None, ranked: bool = True) -> List[int]:
+        """키워드 검색 (FTS5 인덱스, 관련도순 job_id)
+
+        Streamlit 재실행은 다른 스레드에서 돌 수 있으므로 검색마다 읽기 전용 연결을 연다.
+        """
+        conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        try:
+            return search_job_ids(conn, query, limit, ranked)
+        finally:
+            conn.close()
+
+    def search_jobs(self, query: str, limit: int = AppConfig.KEYWORD_SEARCH_LIMIT) -> pd.DataFrame:
+        """키워드 검색 결과 공고 (관련도순, 매처를 만든 뒤 추가된 공고 제외)"""
+        job_ids = self.search_job_ids(query, limit)
+        positions = pd.Index(self.df['job_id']).get_indexer(job_ids)
+        return self.df.iloc[positions[positions >= 0]]
+
     def calculate_advanced_match(self, user_skills: List[str], 
                                spec_text: str, 
-                               preferences: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        """개선된 매칭 알고리즘"""
-        # 사용자 프로필 벡터화
+                               preferences: Optional[Dict[str, Any]] = None,
+                               keyword_query: Optional[str] = None) -> List[Dict[str, Any]]:
+        """개선된 매칭 알고리즘
+
+        keyword_query가 있으면 키워드 검색에 걸린 공고만 후보로 점수를 계산한다.
+        하이브리드 모드에서는 TF-IDF 어휘 유사도와 임베딩 유사도를 가중 합산하고,
+        공고가 많으면 어휘 점수 상위 공고만 후보로 남긴다. 어휘 모드는 TF-IDF 어휘 유사도만 쓴다.
+        """
+        user_skills = canonicalize_skills(user_skills)
+        
+        # 키워드 사전 필터 (후보 공고만 유사도/점수 계산)
+        candidates = None
+        if keyword_query and keyword_query.strip():
+            candidates = self.df['job_id'].isin(self.search_job_ids(keyword_query, ranked=False)).to_numpy()
+            if not candidates.any():
+                return []
+
         user_text = ' '.join(user_skills) + ' ' + spec_text
-        user_vector = self.embedder.encode(user_text, convert_to_tensor=True)
         
-        # 코사인 유사도 계산
-        similarities = util.cos_sim(user_vector, self.job_vectors)[0].cpu().numpy()
+        # 하이브리드 1단계: TF-IDF 어휘 유사도 (희소 행렬-벡터 곱 한 번)
+        lexical = None
+        if self.lexical_index is not None:
+            lexical_query = self.lexical_index.query_vector(user_text)
+            if lexical_query.any():
+                lexical = self.lexical_index.similarities(lexical_query, self.lexical_rows)
+        if lexical is not None and len(self.df) >= AppConfig.HYBRID_PRUNE_MIN_JOBS:
+            # 큰 코퍼스: 어휘 점수 상위 공고만 임베딩 유사도/나머지 점수 계산
+            pool = np.flatnonzero(candidates) if candidates is not None else np.arange(len(self.df))
+            keep = AppConfig.HYBRID_PRUNE_CANDIDATES
+            if len(pool) > keep:
+                top = pool[np.argpartition(-lexical[pool], keep - 1)[:keep]]
+                candidates = np.zeros(len(self.df), dtype=bool)
+                candidates[top] = True
+        
+        result_df = self.df.copy() if candidates is None else self.df[candidates].copy()
+        if lexical is not None and candidates is not None:
+            lexical = lexical[candidates]
+
+        if self.job_embeddings is None:
+            # 어휘 모드: 질의에 어휘 단어가 없으면 텍스트 유사도 0 (스킬/경력 등 규칙 점수로만 정렬)
+            similarities = lexical if lexical is not None else np.zeros(len(result_df))
+        else:
+            # 사용자 프로필 벡터화
+            user_vector = encode_texts(self.embedder, [user_text])[0]
+
+            # 코사인 유사도 계산 (정규화된 벡터의 내적)
+            vector_rows = self.job_vector_rows if candidates is None else self.job_vector_rows[candidates]
+            similarities = self.job_embeddings.similarities(user_vector, vector_rows)
+            if lexical is not None:
+                weight = AppConfig.HYBRID_LEXICAL_WEIGHT
+                similarities = (1 - weight) * similarities + weight * lexical
         
         # 결과 데이터프레임 생성
-        result_df = self.df.copy()
         result_df['similarity'] = similarities
         
         # 다양한 매칭 점수 계산
@@ -214,10 +368,17 @@ class AdvancedJobMatcher:
         
         # 정렬 및 정규화
         sorted_df = result_df.sort_values('final_score', ascending=False)
+        if AppConfig.COLLAPSE_DUPLICATE_JOBS:
+            sorted_df = self._collapse_duplicates(sorted_df)
         
         # 상위 결과 포맷팅
         return self._format_job_matches(sorted_df, user_skills, preferences)
     
+    def _collapse_duplicates(self, sorted_df: pd.DataFrame) -> pd.DataFrame:
+        """유사 중복 공고는 클러스터별 최고 점수 공고만 남기기 (정렬된 입력)"""
+        cluster_sizes = sorted_df['dup_cluster_id'].map(sorted_df['dup_cluster_id'].value_counts())
+        return sorted_df.assign(duplicate_count=cluster_sizes - 1).drop_duplicates('dup_cluster_id')
+
     def _calculate_skill_match(self, user_skills: List[str], job_skills: List[str]) -> float:
         """개선된 스킬 매칭 점수"""
         if not job_skills:
@@ -336,6 +497,8 @@ class AdvancedJobMatcher:
                 'skill_count': row['skill_count'],
                 'estimated_salary': row.get('estimated_salary', 0),
                 'job_type': row.get('job_type', ''),
+                'dup_cluster_id': row['dup_cluster_id'],
+                'duplicate_count': int(row.get('duplicate_count', 0)),
                 'description': row.get('description', ''),
                 'requirements': row.get('requirements', '')
             }
@@ -356,6 +519,8 @@ class AdvancedJobMatcher:
     def get_skill_recommendations(self, current_skills: List[str], 
                                 top_n: int = 10) -> List[Dict[str, Any]]:
         """개선된 스킬 추천"""
+        current_skills = canonicalize_skills(current_skills)
+
         # 현재 스킬과 함께 나타나는 스킬 분석
         skill_pairs = []
         for skills in self.df['llm_extracted_tech_skills']:
@@ -469,6 +634,8 @@ class AdvancedJobMatcher:
     def get_career_path_analysis(self, current_skills: List[str], 
                                experience_years: int) -> Dict[str, Any]:
         """경력 경로 분석"""
+        current_skills = canonicalize_skills(current_skills)
+
         # 현재 레벨 결정
         current_level = self._determine_career_level(experience_years)
         current_path = self.career_paths.get(current_level, {})
@@ -0,0 +1,73 @@
+"""
+공고 TF-IDF 어휘 점수 (하이브리드 검색의 어휘 단계)
+
+ETL tfidf 단계가 저장한 job_vectors(L2 정규화 CSR), feature_names, tfidf_idf를 읽기 전용(mmap)으로 불러와
+사용자 질의(스킬 + 경력 설명)를 같은 가중치로 벡터화하고, 희소 행렬-벡터 곱 한 번으로 전체 공고 점수를 구한다.
+
+앱은 형태소 분석기(JVM)를 띄우지 않으므로 어휘에 없는 한글 어절은
+어휘에 있는 가장 긴 접두어(2글자 이상)로 맞춘다 ('개발자로' → '개발자').
+"""
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from sklearn.feature_extraction.text import CountVectorizer
+
+# ETL IncrementalTfidf와 같은 분석기 (소문자화 + 2글자 이상 단어)
+_analyzer = CountVectorizer().build_analyzer()
+
+
+class LexicalIndex:
+    """job_id에 정렬된 TF-IDF 공고 벡터 (읽기 전용)"""
+
+    def __init__(self, vocabulary: Dict[str, int], idf: np.ndarray, job_ids: np.ndarray, vectors):
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.job_ids = job_ids
+        self.vectors = vectors
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    @classmethod
+    def load(cls, store) -> Optional['LexicalIndex']:
+        """아티팩트에서 불러오기 (TF-IDF 아티팩트가 없으면 None)"""
+        if 'job_vectors' not in store or 'tfidf_idf' not in store:
+            return None
+        vocabulary = {term: index for index, term in enumerate(store.load_vocabulary('feature_names'))}
+        return cls(vocabulary, store.load_array('tfidf_idf'), store.load_array('job_vector_ids'),
+                   store.load_csr('job_vectors'))
+
+    def rows_for(self, job_ids: Iterable[int]) -> np.ndarray:
+        """job_id → 벡터 행 위치 (없으면 -1)"""
+        position_by_id = {int(job_id): position for position, job_id in enumerate(self.job_ids)}
+        return np.fromiter((position_by_id.get(int(job_id), -1) for job_id in job_ids), dtype=np.int64)
+
+    def _terms(self, text: str) -> List[str]:
+        """질의 텍스트 → 어휘 단어 (모르는 단어는 한글 접두어로 맞추거나 버림)"""
+        terms = []
+        for token in _analyzer(text or ''):
+            if token in self.vocabulary:
+                terms.append(token)
+            elif not token.isascii():
+                prefix = next((token[:end] for end in range(len(token) - 1, 1, -1)
+                               if token[:end] in self.vocabulary), None)
+                if prefix is not None:
+                    terms.append(prefix)
+        return terms
+
+    def query_vector(self, text: str) -> np.ndarray:
+        """L2 정규화된 질의 TF-IDF 벡터 (어휘에 있는 단어가 없으면 0 벡터)"""
+        query = np.zeros(len(self.vocabulary), dtype=np.float64)
+        for term, count in Counter(self._terms(text)).items():
+            index = self.vocabulary[term]
+            query[index] = count * self.idf[index]
+        norm = np.linalg.norm(query)
+        return query / norm if norm > 0 else query
+
+    def similarities(self, query: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """질의 벡터와 rows 위치 공고 벡터의 코사인 유사도 (행이 없으면 0)"""
+        if not len(self.job_ids) or not query.any():
+            return np.zeros(len(rows))
+        scores = self.vectors @ query
+        return np.where(rows >= 0, scores[np.maximum(rows, 0)], 0.0)
@@ -0,0 +1,576 @@
+"""
+ETL 성능 벤치마크
+
+사용법:
+    python scripts/benchmarks.py writes --rows 20000
+    python scripts/benchmarks.py tfidf --docs 50000 --changed 500
+    python scripts/benchmarks.py normalize --postings 100000 --workers 4
+    python scripts/benchmarks.py search --postings 50000
+    python scripts/benchmarks.py matching --modes lexical hybrid dense
+    python scripts/benchmarks.py embedding --backends torch-int8 onnx-int8 --postings 2000
+    python scripts/benchmarks.py encode --postings 5000
+    python scripts/benchmarks.py encode-workers --postings 20000 --workers 1 2 4 8
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from config.settings import AppConfig, ETLConfig
+from scripts.db_writer import BatchWriter, configure_connection
+from scripts.incremental_tfidf import IncrementalTfidf
+from scripts.text_normalization import clean_texts, combined_posting_text, extract_years_column
+from utils.fts_search import FTS_COLUMNS, create_fts_index, search_job_ids
+
+JOBS_DDL = '''
+CREATE TABLE jobs (
+    job_id INTEGER PRIMARY KEY,
+    title TEXT, company TEXT, location TEXT, experience TEXT, years INTEGER,
+    description TEXT, requirements TEXT, preferred TEXT, job_type TEXT,
+    cleaned_text TEXT, tokens_str TEXT, skills TEXT,
+    llm_extracted_tech_skills TEXT DEFAULT NULL
+)
+'''
+UPSERT_SQL = '''
+    INSERT OR REPLACE INTO jobs
+    (job_id, title, company, location, experience, years, description,
+    requirements, preferred, job_type, cleaned_text, tokens_str, skills)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+UPDATE_SQL = 'UPDATE jobs SET llm_extracted_tech_skills = ? WHERE job_id = ?'
+
+
+def _synthetic_job_rows(n):
+    """합성 공고 행 생성"""
+    description = "대규모 트래픽 처리 백엔드 개발 Python Django AWS " * 8
+    for job_id in range(1, n + 1):
+        yield (
+            job_id, f"백엔드 개발자 {job_id}", f"회사{job_id % 300}", "서울", "경력 3년", 3,
+            description, "Python 3년 이상", "Kubernetes 경험", "백엔드",
+            description, "python django aws", '["python", "django", "aws"]'
+        )
+
+
+def _timed(label, rows, fn):
+    """실행 시간 측정 후 결과 출력"""
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<40} {elapsed:8.2f}초  {rows / elapsed:12,.0f}행/초")
+    return rows / elapsed
+
+
+def bench_writes(args):
+    """행 단위 execute/commit vs 배치 executemany 비교"""
+    rows = list(_synthetic_job_rows(args.rows))
+    updates = [('["Python", "Django", "AWS"]', job_id) for job_id in range(1, args.rows + 1)]
+    # 행 단위 커밋은 매우 느리므로 일부만 측정
+    commit_rows = updates[:args.commit_rows]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        def connect(name, wal):
+            conn = sqlite3.connect(os.path.join(tmp, name))
+            if wal:
+                configure_connection(conn)
+            conn.execute(JOBS_DDL)
+            conn.commit()
+            return conn
+
+        print(f"공고 UPSERT ({args.rows}행)")
+        legacy = connect('legacy_upsert.db', wal=False)
+
+        def legacy_upsert():
+            for row in rows:
+                legacy.execute(UPSERT_SQL, row)
+            legacy.commit()
+
+        before = _timed("before: 행 단위 execute + 1회 커밋", len(rows), legacy_upsert)
+
+        batched = connect('batched_upsert.db', wal=True)
+
+        def batched_upsert():
+            with BatchWriter(batched, batch_size=args.batch_size) as writer:
+                writer.add_many(UPSERT_SQL, rows)
+
+        after = _timed(f"after: executemany (배치 {args.batch_size})", len(rows), batched_upsert)
+        print(f"  → {after / before:.1f}배")
+
+        print(f"LLM 결과 UPDATE ({len(commit_rows)}행)")
+        legacy_update_conn = connect('legacy_update.db', wal=False)
+        legacy_update_conn.executemany(UPSERT_SQL, rows)
+        legacy_update_conn.commit()
+
+        def legacy_update():
+            for params in commit_rows:
+                legacy_update_conn.execute(UPDATE_SQL, params)
+                legacy_update_conn.commit()
+
+        before = _timed("before: 행마다 UPDATE + 커밋", len(commit_rows), legacy_update)
+
+        batched_update_conn = connect('batched_update.db', wal=True)
+        batched_update_conn.executemany(UPSERT_SQL, rows)
+        batched_update_conn.commit()
+
+        def batched_update():
+            with BatchWriter(batched_update_conn, batch_size=args.result_batch_size) as writer:
+                writer.add_many(UPDATE_SQL, commit_rows)
+
+        after = _timed(f"after: executemany (배치 {args.result_batch_size})",
+                       len(commit_rows), batched_update)
+        print(f"  → {after / before:.1f}배")
+
+        for conn in (legacy, batched, legacy_update_conn, batched_update_conn):
+            conn.close()
+
+
+def _synthetic_token_docs(n, vocabulary_size, seed):
+    """지프 분포를 따르는 합성 tokens_str 생성"""
+    rng = random.Random(seed)
+    words = [f"tok{i}" for i in range(vocabulary_size)]
+    weights = [1 / (rank + 1) for rank in range(vocabulary_size)]
+    return [' '.join(rng.choices(words, weights=weights, k=60)) for _ in range(n)]
+
+
+def bench_tfidf(args):
+    """전체 재fit vs 증분 TF-IDF 갱신 비교"""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    docs = _synthetic_token_docs(args.docs, args.vocabulary, seed=1)
+    changed_ids = list(range(args.changed))
+    changed_docs = _synthetic_token_docs(args.changed, args.vocabulary, seed=2)
+
+    model = IncrementalTfidf()
+    model.update(range(args.docs), docs)
+    for job_id, text in zip(changed_ids, changed_docs):
+        docs[job_id] = text
+
+    print(f"TF-IDF 갱신 (문서 {args.docs}개 중 {args.changed}개 변경)")
+    vectorizer = TfidfVectorizer(min_df=0.01, max_df=0.9)
+    before = _timed("before: 전체 fit_transform", args.docs, lambda: vectorizer.fit_transform(docs))
+
+    report = {}
+    after = _timed("after: 증분 갱신 (변경 행만)", args.docs,
+                   lambda: report.update(model.update(changed_ids, changed_docs)))
+    print(f"  → {after / before:.1f}배 ({IncrementalTfidf.format_report(report)})")
+
+
+EXPERIENCE_SAMPLES = ['경력 3-5년', '신입', '', '경력 무관', '10년 이상', '경력 2~4년', '신입/경력', '7년↑']
+
+
+def _synthetic_postings(n, seed):
+    """URL/특수문자/다양한 경력 표기를 섞은 합성 공고 DataFrame"""
+    import pandas as pd
+
+    rng = random.Random(seed)
+    phrases = ["대규모 트래픽 처리 (MSA) 경험!", "Python/Django, AWS(EC2·S3) 운영",
+               "자세한 내용: https://careers.example.com/jobs?id=", "CI/CD & 테스트 자동화 @팀",
+               "www.example.co.kr 참고 — 우대", "Kubernetes, Docker; React.js + TypeScript"]
+    rows = []
+    for job_id in range(1, n + 1):
+        rows.append({
+            'job_id': job_id,
+            'experience': rng.choice(EXPERIENCE_SAMPLES),
+            'description': ' '.join(rng.choices(phrases, k=6)) + str(job_id),
+            'requirements': ' '.join(rng.choices(phrases, k=3)),
+            'preferred': ' '.join(rng.choices(phrases, k=2)),
+        })
+    return pd.DataFrame(rows)
+
+
+def _legacy_clean_text(text):
+    """기존 행 단위 정제 (URL 제거 → 특수문자 → 공백, 정규식 3회)"""
+    text = re.sub(r'https?://\S+|www\.\S+', '', str(text))
+    text = re.sub(r'[^\w\s]', ' ', text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def _legacy_extract_years(experience_text):
+    """기존 행 단위 경력 연차 추출"""
+    if experience_text == '':
+        return 0
+    match = re.search(r'(\d+)[-~]?(\d+)?년?', experience_text)
+    return int(match.group(1)) if match else 0
+
+
+def bench_normalize(args):
+    """행 단위 정제/연차 추출 vs 열 단위 처리 (+ 프로세스 풀) 비교"""
+    df = _synthetic_postings(args.postings, seed=1)
+    results = {}
+
+    def legacy():
+        results['legacy'] = (
+            df.apply(lambda row: _legacy_clean_text(
+                f"{row['description']} {row['requirements']} {row['preferred']}"), axis=1).tolist(),
+            df['experience'].apply(_legacy_extract_years).tolist(),
+        )
+
+    def vectorized(workers):
+        def run():
+            results[workers] = (
+                clean_texts(combined_posting_text(df), workers, args.chunk_size).tolist(),
+                extract_years_column(df['experience']).tolist(),
+            )
+        return run
+
+    print(f"텍스트 정제 / 경력 연차 추출 ({args.postings}건, CPU {os.cpu_count()}개)")
+    before = _timed("before: df.apply(axis=1) + 정규식 3회", args.postings, legacy)
+    after = _timed("after: 열 단위 (일괄 문자 치환, 고유 표기)", args.postings, vectorized(1))
+    print(f"  → {after / before:.1f}배")
+    if args.workers > 1:
+        pooled = _timed(f"after: 열 단위 + 프로세스 {args.workers}개", args.postings, vectorized(args.workers))
+        print(f"  → {pooled / before:.1f}배")
+
+    for key, output in results.items():
+        if output != results['legacy']:
+            raise AssertionError(f"결과 불일치: {key}")
+    print("  결과 일치 확인")
+
+
+# 흔한 표기(문서 대부분), 중간 빈도, 드문 토큰, 3글자 미만(LIKE 경로) 섞어서
+SEARCH_QUERIES = ['트래픽', 'tok20', 'tok300', 'tok2500', 'tok40 tok70', 'CI tok900']
+
+
+def bench_search(args):
+    """LIKE 전체 스캔 vs FTS5(trigram) 키워드 검색 비교"""
+    df = _synthetic_postings(args.postings, seed=1)
+    df['title'] = "백엔드 개발자 " + df['job_id'].astype(str)
+    df['requirements'] = _synthetic_token_docs(args.postings, 5000, seed=2)
+    like_sql = ('SELECT job_id FROM jobs WHERE '
+                + ' AND '.join('(' + ' OR '.join(f"{column} LIKE ?" for column in FTS_COLUMNS) + ')'
+                               for _ in range(2)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(os.path.join(tmp, 'search.db'))
+        conn.execute('CREATE TABLE jobs (job_id INTEGER PRIMARY KEY, title TEXT, description TEXT, '
+                     'requirements TEXT, preferred TEXT)')
+        conn.executemany('INSERT INTO jobs VALUES (?, ?, ?, ?, ?)',
+                         df[['job_id'] + FTS_COLUMNS].itertuples(index=False, name=None))
+        conn.commit()
+        start = time.perf_counter()
+        tokenizer = create_fts_index(conn.cursor())
+        conn.commit()
+        print(f"키워드 검색 (공고 {args.postings}건, 인덱스 구성 {time.perf_counter() - start:.2f}초, {tokenizer})")
+
+        def legacy():
+            for query in SEARCH_QUERIES:
+                terms = (query.split() * 2)[:2]
+                params = [f"%{term}%" for term in terms for _ in FTS_COLUMNS]
+                # LIKE는 대소문자 무시 부분 문자열이므로 'tok20'은 'tok200'도 찾는다 (FTS trigram과 같음)
+                results[('like', query)] = sorted(job_id for (job_id,) in conn.execute(like_sql, params))
+
+        def indexed():
+            for query in SEARCH_QUERIES:
+                results[('fts', query)] = sorted(search_job_ids(conn, query))
+
+        results = {}
+        queries = len(SEARCH_QUERIES) * args.repeat
+        before = _timed("before: LIKE 전체 스캔", queries, lambda: [legacy() for _ in range(args.repeat)])
+        after = _timed("after: FTS5 MATCH", queries, lambda: [indexed() for _ in range(args.repeat)])
+        print(f"  → {after / before:.1f}배 (단위: 검색/초)")
+        for query in SEARCH_QUERIES:
+            if results[('like', query)] != results[('fts', query)]:
+                raise AssertionError(f"결과 불일치: {query}")
+        print("  결과 일치 확인")
+        conn.close()
+
+
+# 매칭 벤치마크 질의 (사용자 스킬, 경력 설명)
+MATCH_PROFILES = [
+    (['Python', 'Django', 'AWS'], '백엔드 개발 3년, 대규모 트래픽 API 서버 운영'),
+    (['Java', 'Spring', 'MySQL'], '결제 시스템 서버 개발 5년'),
+    (['React', 'TypeScript'], '프론트엔드 개발자로 웹 서비스 UI 개발'),
+    (['Kubernetes', 'Docker', 'Terraform'], 'DevOps 엔지니어, CI/CD 파이프라인 구축 경험'),
+    (['Python', 'PyTorch', 'SQL'], '머신러닝 모델 학습과 데이터 분석'),
+    (['Kotlin', 'Android'], '모바일 앱 개발 신입'),
+    (['Go', 'Kafka', 'Redis'], '실시간 데이터 처리 플랫폼 개발'),
+    (['Excel'], '영업 관리 및 고객 응대'),
+]
+
+
+def bench_matching_worker(args):
+    """한 모드로 매처 로드/질의 (benchmarks.py matching이 모드마다 새 프로세스로 실행, 결과는 마지막 줄 JSON)"""
+    import resource
+
+    import numpy as np
+
+    AppConfig.RETRIEVAL_MODE = args.mode
+    AppConfig.ARTIFACT_DIR = args.artifacts
+    # 매처의 가상 등록일/급여가 모드마다 같도록 고정
+    np.random.seed(0)
+    start = time.perf_counter()
+    from models.job_matcher import AdvancedJobMatcher
+    matcher = AdvancedJobMatcher(args.db)
+    load_seconds = time.perf_counter() - start
+
+    latencies, tops = [], []
+    for skills, spec_text in MATCH_PROFILES:
+        start = time.perf_counter()
+        matches = matcher.calculate_advanced_match(skills, spec_text, {})
+        latencies.append(time.perf_counter() - start)
+        tops.append([int(match['job_id']) for match in matches[:args.top_k]])
+
+    # ru_maxrss 단위: Linux KB, macOS 바이트
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    print(json.dumps({
+        'peak_rss_mb': peak_mb, 'load_seconds': load_seconds, 'latencies': latencies, 'tops': tops,
+        'torch_loaded': 'torch' in sys.modules, 'jobs': len(matcher.df)
+    }))
+
+
+def bench_matching(args):
+    """매칭 모드별 메모리/로드 시간/질의 지연/결과 차이 (모드마다 별도 프로세스로 최대 RSS 측정)"""
+    results = {}
+    for mode in args.modes:
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), 'matching-worker', '--mode', mode,
+             '--db', args.db, '--artifacts', args.artifacts, '--top-k', str(args.top_k)],
+            capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            error = (proc.stderr.strip().splitlines() or ['알 수 없는 오류'])[-1]
+            print(f"  {mode}: 실패 ({error})")
+            continue
+        results[mode] = json.loads(proc.stdout.strip().splitlines()[-1])
+    if not results:
+        return
+
+    jobs = next(iter(results.values()))['jobs']
+    print(f"매칭 모드 비교 (공고 {jobs}건, 질의 {len(MATCH_PROFILES)}개, 상위 {args.top_k}개 비교)")
+    print(f"  {'모드':<10} {'최대 RSS':>10} {'로드':>8} {'질의 p50':>10} {'torch':>6}")
+    for mode, result in results.items():
+        latency = sorted(result['latencies'])[len(result['latencies']) // 2]
+        print(f"  {mode:<10} {result['peak_rss_mb']:8.0f}MB {result['load_seconds']:7.2f}초 "
+              f"{latency * 1000:8.1f}ms {'예' if result['torch_loaded'] else '아니오':>6}")
+
+    baseline = results.get(args.baseline)
+    if baseline is None:
+        print(f"  기준 모드 '{args.baseline}' 결과가 없어 품질 비교를 생략합니다.")
+        return
+    for mode, result in results.items():
+        if mode == args.baseline:
+            continue
+        overlaps = [len(set(top) & set(reference)) / max(len(reference), 1)
+                    for top, reference in zip(result['tops'], baseline['tops'])]
+        memory = result['peak_rss_mb'] - baseline['peak_rss_mb']
+        print(f"  {mode} vs {args.baseline}: 상위 {args.top_k}개 평균 일치율 {sum(overlaps) / len(overlaps):.0%} "
+              f"(최저 {min(overlaps):.0%}), 최대 RSS {memory:+.0f}MB")
+
+
+def bench_embedding(args):
+    """임베딩 백엔드별 공고 인코딩 처리량/질의 지연과 fp32(torch) 대비 코사인 일치도 (DB의 실제 공고)"""
+    import numpy as np
+    from models.embeddings import cosine_agreement, embedding_text, encode_texts, load_encoder
+
+    conn = sqlite3.connect(args.db)
+    rows = conn.execute('SELECT description, requirements FROM jobs ORDER BY job_id LIMIT ?',
+                        (args.postings,)).fetchall()
+    conn.close()
+    texts = [embedding_text(description, requirements) for description, requirements in rows]
+    queries = [' '.join(skills) + ' ' + spec_text for skills, spec_text in MATCH_PROFILES]
+    print(f"임베딩 백엔드 ({args.model}, 공고 {len(texts)}건, 배치 {args.batch_size}, 질의 {len(queries)}개)")
+
+    results = {}
+    for backend in ['torch'] + [backend for backend in args.backends if backend != 'torch']:
+        start = time.perf_counter()
+        encoder = load_encoder(args.model, backend)
+        load_seconds = time.perf_counter() - start
+        encode_texts(encoder, queries[:1])  # 첫 호출 준비 비용 제외
+        corpus = {}
+        throughput = _timed(f"{backend}: 공고 인코딩 (로드 {load_seconds:.1f}초)", len(texts),
+                            lambda: corpus.update(vectors=encode_texts(encoder, texts, args.batch_size)))
+        latencies = []
+        for _ in range(args.repeat):
+            for query in queries:
+                start = time.perf_counter()
+                encode_texts(encoder, [query])
+                latencies.append(time.perf_counter() - start)
+        results[backend] = {
+            'throughput': throughput, 'latency': sorted(latencies)[len(latencies) // 2],
+            'corpus': corpus['vectors'], 'queries': encode_texts(encoder, queries),
+        }
+
+    reference = results['torch']
+    print(f"  {'백엔드':<12} {'공고/초':>10} {'질의 p50':>10} {'일치도 평균':>10} {'최저':>8} {'상위 일치':>8}")
+    for backend, result in results.items():
+        agreement = cosine_agreement(reference['corpus'], result['corpus'])
+        # 질의별 공고 순위 상위 top_k가 fp32와 얼마나 겹치는지
+        overlaps = []
+        for query, reference_query in zip(result['queries'], reference['queries']):
+            top = set(np.argsort(-(result['corpus'] @ query))[:args.top_k])
+            reference_top = set(np.argsort(-(reference['corpus'] @ reference_query))[:args.top_k])
+            overlaps.append(len(top & reference_top) / max(len(reference_top), 1))
+        print(f"  {backend:<12} {result['throughput']:10,.0f} {result['latency'] * 1000:8.1f}ms "
+              f"{agreement.mean():10.4f} {agreement.min():8.4f} {sum(overlaps) / len(overlaps):8.0%}")
+    for backend, result in results.items():
+        if backend != 'torch':
+            print(f"  → {backend}: 공고 인코딩 {result['throughput'] / reference['throughput']:.1f}배, "
+                  f"질의 지연 {reference['latency'] / result['latency']:.1f}배 빠름")
+
+
+def bench_encode(args):
+    """공고 코퍼스 인코딩: 전체 목록 한 번에 encode vs 중복 제거 + 토큰 길이 버킷 배치 (DB의 실제 공고)"""
+    import numpy as np
+    from models.embeddings import (embedding_text, encode_corpus, encode_texts, length_buckets, load_encoder,
+                                   token_lengths)
+
+    conn = sqlite3.connect(args.db)
+    rows = conn.execute('SELECT description, requirements FROM jobs ORDER BY job_id LIMIT ?',
+                        (args.postings,)).fetchall()
+    conn.close()
+    texts = [embedding_text(description, requirements) for description, requirements in rows]
+    encoder = load_encoder(args.model, args.backend)
+    encode_texts(encoder, texts[:1])  # 첫 호출 준비 비용 제외
+
+    # 패딩 포함 토큰 수: 기존은 SentenceTransformer가 문자 길이순으로 batch_size씩 묶음
+    lengths = token_lengths(encoder, texts)
+    legacy_order = np.argsort([-len(text) for text in texts], kind='stable')
+    legacy_padded = sum(int(lengths[batch].max()) * len(batch)
+                        for batch in np.array_split(legacy_order, range(args.batch_size, len(texts), args.batch_size)))
+    unique_lengths = token_lengths(encoder, list(dict.fromkeys(texts)))
+    bucketed_padded = sum(int(unique_lengths[batch].max()) * len(batch)
+                          for batch in length_buckets(unique_lengths, args.token_budget, args.batch_size))
+
+    print(f"공고 코퍼스 인코딩 ({args.model}, {args.backend}, 공고 {len(texts)}건, "
+          f"고유 텍스트 {len(unique_lengths)}개, 실제 토큰 {int(lengths.sum()):,}개)")
+    print(f"  패딩 포함 토큰: before {legacy_padded:,}개 → after {bucketed_padded:,}개")
+    results = {}
+    before = _timed(f"before: encode (배치 {args.batch_size})", len(texts),
+                    lambda: results.update(before=encode_texts(encoder, texts, args.batch_size)))
+    after = _timed(f"after: 중복 제거 + 길이 버킷 (배치 토큰 {args.token_budget})", len(texts),
+                   lambda: results.update(after=encode_corpus(encoder, texts, args.token_budget, args.batch_size)))
+    print(f"  → {after / before:.1f}배")
+    difference = float(np.abs(results['before'] - results['after']).max()) if texts else 0.0
+    if difference > 1e-3:
+        raise AssertionError(f"결과 불일치: 최대 차이 {difference:.2e}")
+    print(f"  결과 일치 확인 (최대 차이 {difference:.1e}, 패딩 차이에 따른 부동소수 오차)")
+
+
+def bench_encode_workers(args):
+    """공고 코퍼스 인코딩: 단일 프로세스 vs 프로세스 풀 워커 1~N개 (워커당 스레드 = CPU 수 // 워커 수)"""
+    import numpy as np
+    from models.embeddings import EncoderPool, embedding_text, encode_corpus, load_encoder
+
+    conn = sqlite3.connect(args.db)
+    rows = conn.execute('SELECT description, requirements FROM jobs ORDER BY job_id LIMIT ?',
+                        (args.postings,)).fetchall()
+    conn.close()
+    texts = [embedding_text(description, requirements) for description, requirements in rows]
+    cpus = os.cpu_count() or 1
+    workers_list = args.workers or sorted({min(2 ** i, cpus) for i in range(cpus.bit_length() + 1)})
+    print(f"공고 코퍼스 인코딩 확장성 ({args.model}, {args.backend}, 공고 {len(texts)}건, CPU {cpus}개)")
+
+    results = {}
+    encoder = load_encoder(args.model, args.backend)
+    encode_corpus(encoder, texts[:1])  # 첫 호출 준비 비용 제외
+    baseline = _timed("단일 프로세스 (기본 스레드)", len(texts), lambda: results.update(
+        single=encode_corpus(encoder, texts, args.token_budget, args.batch_size)))
+    encoder = None  # 풀 측정 중에는 단일 프로세스 모델 해제
+
+    for workers in workers_list:
+        start = time.perf_counter()
+        with EncoderPool(args.model, workers, args.backend) as pool:
+            pool.warm_up()
+            startup = time.perf_counter() - start
+            label = f"워커 {workers}개 × 스레드 {pool.threads}개 (시작 {startup:.1f}초)"
+            rate = _timed(label, len(texts), lambda: results.update(
+                pooled=pool.encode(texts, args.token_budget, args.batch_size)))
+        difference = float(np.abs(results['single'] - results['pooled']).max()) if texts else 0.0
+        if difference > 1e-3:
+            raise AssertionError(f"결과 불일치 (워커 {workers}개): 최대 차이 {difference:.2e}")
+        print(f"  → {rate / baseline:.2f}배 (워커당 효율 {rate / baseline / workers:.0%})")
+    print("  결과 일치 확인")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ETL 성능 벤치마크")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    writes = subparsers.add_parser('writes', help="DB 쓰기 계층 (행 단위 vs 배치)")
+    writes.add_argument('--rows', type=int, default=20000)
+    writes.add_argument('--commit-rows', type=int, default=2000)
+    writes.add_argument('--batch-size', type=int, default=500)
+    writes.add_argument('--result-batch-size', type=int, default=50)
+    writes.set_defaults(func=bench_writes)
+
+    tfidf = subparsers.add_parser('tfidf', help="TF-IDF (전체 재fit vs 증분 갱신)")
+    tfidf.add_argument('--docs', type=int, default=50000)
+    tfidf.add_argument('--changed', type=int, default=500)
+    tfidf.add_argument('--vocabulary', type=int, default=5000)
+    tfidf.set_defaults(func=bench_tfidf)
+
+    normalize = subparsers.add_parser('normalize', help="텍스트 정제/연차 추출 (행 단위 vs 열 단위)")
+    normalize.add_argument('--postings', type=int, default=100000)
+    normalize.add_argument('--workers', type=int, default=4)
+    normalize.add_argument('--chunk-size', type=int, default=20000)
+    normalize.set_defaults(func=bench_normalize)
+
+    search = subparsers.add_parser('search', help="키워드 검색 (LIKE 스캔 vs FTS5)")
+    search.add_argument('--postings', type=int, default=50000)
+    search.add_argument('--repeat', type=int, default=5)
+    search.set_defaults(func=bench_search)
+
+    matching = subparsers.add_parser('matching', help="매칭 모드 (어휘 / 하이브리드 / 임베딩) 메모리와 결과 차이")
+    matching.add_argument('--modes', nargs='+', default=['lexical', 'hybrid', 'dense'],
+                          choices=['lexical', 'hybrid', 'dense'])
+    matching.add_argument('--baseline', default='hybrid', help="결과 일치율 기준 모드")
+    matching.add_argument('--db', default=AppConfig.DB_PATH)
+    matching.add_argument('--artifacts', default=AppConfig.ARTIFACT_DIR)
+    matching.add_argument('--top-k', type=int, default=10)
+    matching.set_defaults(func=bench_matching)
+
+    embedding = subparsers.add_parser('embedding', help="임베딩 백엔드 (fp32 torch vs int8 양자화) 속도/일치도")
+    embedding.add_argument('--backends', nargs='+', default=['torch-int8', 'onnx-int8'],
+                           choices=['torch', 'torch-int8', 'onnx-int8'])
+    embedding.add_argument('--model', default=ETLConfig.EMBEDDING_MODEL)
+    embedding.add_argument('--db', default=ETLConfig.DB_PATH)
+    embedding.add_argument('--postings', type=int, default=2000)
+    embedding.add_argument('--batch-size', type=int, default=ETLConfig.EMBEDDING_BATCH_SIZE)
+    embedding.add_argument('--repeat', type=int, default=5)
+    embedding.add_argument('--top-k', type=int, default=10)
+    embedding.set_defaults(func=bench_embedding)
+
+    encode = subparsers.add_parser('encode', help="공고 코퍼스 인코딩 (한 번에 encode vs 중복 제거 + 길이 버킷)")
+    encode.add_argument('--model', default=ETLConfig.EMBEDDING_MODEL)
+    encode.add_argument('--backend', default=ETLConfig.EMBEDDING_BACKEND, choices=['torch', 'torch-int8', 'onnx-int8'])
+    encode.add_argument('--db', default=ETLConfig.DB_PATH)
+    encode.add_argument('--postings', type=int, default=5000)
+    encode.add_argument('--batch-size', type=int, default=ETLConfig.EMBEDDING_BATCH_SIZE)
+    encode.add_argument('--token-budget', type=int, default=ETLConfig.EMBEDDING_TOKEN_BUDGET)
+    encode.set_defaults(func=bench_encode)
+
+    encode_workers = subparsers.add_parser('encode-workers', help="공고 코퍼스 인코딩 (단일 프로세스 vs 프로세스 풀)")
+    encode_workers.add_argument('--workers', type=int, nargs='+', default=None,
+                                help="비교할 워커 수 (기본: 1, 2, 4, ... CPU 수)")
+    encode_workers.add_argument('--model', default=ETLConfig.EMBEDDING_MODEL)
+    encode_workers.add_argument('--backend', default=ETLConfig.EMBEDDING_BACKEND,
+                                choices=['torch', 'torch-int8', 'onnx-int8'])
+    encode_workers.add_argument('--db', default=ETLConfig.DB_PATH)
+    encode_workers.add_argument('--postings', type=int, default=20000)
+    encode_workers.add_argument('--batch-size', type=int, default=ETLConfig.EMBEDDING_BATCH_SIZE)
+    encode_workers.add_argument('--token-budget', type=int, default=ETLConfig.EMBEDDING_TOKEN_BUDGET)
+    encode_workers.set_defaults(func=bench_encode_workers)
+
+    worker = subparsers.add_parser('matching-worker')
+    worker.add_argument('--mode', required=True)
+    worker.add_argument('--db', required=True)
+    worker.add_argument('--artifacts', required=True)
+    worker.add_argument('--top-k', type=int, default=10)
+    worker.set_defaults(func=bench_matching_worker)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
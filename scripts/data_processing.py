@@ -6,10 +6,8 @@ import json
 import sqlite3
 import os
 from konlpy.tag import Okt
-from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 from collections import Counter
-import pickle
 import time
 from tqdm import tqdm
 import requests
@@ -17,66 +15,41 @@ from dotenv import load_dotenv
 from cerebras.cloud.sdk import Cerebras
 import asyncio
 import math
-from cerebras.cloud.sdk import AsyncCerebras, RateLimitError, APIConnectionError, APIStatusError
+from cerebras.cloud.sdk import AsyncCerebras, RateLimitError, APIConnectionError, APIStatusError, APITimeoutError
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from config.settings import ETLConfig
+from models.embeddings import EncoderPool, JobEmbeddings, embedding_text, encode_corpus, load_encoder
+from scripts.db_writer import BackgroundWriter, BatchWriter, configure_connection, select_in
+from scripts.incremental_tfidf import IncrementalTfidf
+from scripts.near_duplicates import NearDuplicateIndex
+from scripts.pipeline import PipelineRun, content_hash, create_stage_table
+from scripts.extraction_journal import (
+    STATUS_BY_SOURCE, create_journal_table, delete_entries, journal_summary, mark_pending, result_statement,
+    select_fallback_job_ids, select_resumable_job_ids
+)
+from scripts.llm_cache import LLMExtractionCache
+from scripts.llm_metrics import LLMCallStats
+from scripts.rate_limiter import AsyncRateLimiter
+from scripts.run_report import build_run_report, write_run_report
+from scripts.skill_dictionary import DictionarySkillExtractor, TokenVocabulary
+from scripts.text_normalization import (
+    clean_text, clean_texts, combined_posting_text, extract_years, extract_years_column
+)
+from utils.artifacts import ArtifactStore, ArtifactWriter, current_version
+from utils.fts_search import create_fts_index, drop_fts_index
+from utils.reload_stamp import write_reload_stamp
+from utils.skill_aliases import SKILL_ALIASES, SKILL_CANONICALIZER, TECH_KEYWORDS, VERSIONED_SKILLS
 
 # 환경 변수 로드
 load_dotenv()
 
 # NLTK 자원 다운로드
 nltk.download('punkt', quiet=True)
-TECH_KEYWORDS = [
-    # 프로그래밍 언어
-    'Python', '파이썬', 'Java', '자바', 'JavaScript', '자바스크립트', 'TypeScript', 'C', 'C++', '씨플러스플러스',
-    'C#', '씨샵', 'Go', 'Golang', 'Kotlin', 'Swift', 'Ruby', 'R', 'Scala', 'Dart', 'Objective-C', 'Perl',
-    'PHP', 'MATLAB', 'Rust', 'Groovy', 'Delphi', 'VBA',
-
-    # 프론트엔드 프레임워크/라이브러리
-    'React', 'Vue', 'Angular', 'Next.js', 'Nuxt.js', 'Svelte', 'jQuery', 'Bootstrap', 'TailwindCSS', 'Material-UI', 'Redux',
-    'Recoil', 'Styled-Components',
-
-    # 백엔드 프레임워크/라이브러리
-    'Spring', 'SpringBoot', '스프링', 'Express', 'Django', 'Flask', 'FastAPI', 'NestJS', 'Node.js', 'Koa', 'Ruby on Rails',
-    'ASP.NET', 'JSP', 'Tibero', 'nexacro',
-
-    # 데이터베이스
-    'MySQL', 'MariaDB', 'PostgreSQL', 'Oracle', 'MSSQL', 'MongoDB', 'Redis', 'Elasticsearch', 'Cassandra', 'DynamoDB',
-    'SQLite', 'Amazon RDS', 'Google BigQuery', 'HBase', 'CouchDB',
-
-    # DevOps/Infra/클라우드
-    'AWS', '에이더블유에스', 'Amazon Web Services', 'Azure', 'GCP', 'Google Cloud', 'Google Cloud Platform', 'Kubernetes',
-    'Docker', 'Jenkins', 'Git', 'GitHub', 'GitLab', 'Travis CI', 'CircleCI', 'Ansible', 'Terraform', 'Nginx', 'Apache',
-    'Tomcat', 'CI/CD', 'CDN', 'S3', 'EC2', 'ECS', 'Lambda', 'VPC', 'Firebase', 'CloudFront', 'ELB', 'Route53', 'SQS', 'Kafka',
-    'RabbitMQ', 'Zookeeper', 'Prometheus', 'Grafana', 'Logstash', 'Filebeat', 'Datadog', 'New Relic', 'OpenStack',
-
-    # 빅데이터/머신러닝/AI
-    'TensorFlow', '텐서플로우', 'PyTorch', '사이킷런', 'scikit-learn', 'Keras', 'XGBoost', 'LightGBM', 'CatBoost', 'HuggingFace',
-    'Transformers', 'OpenCV', 'MXNet', 'Torch', 'ONNX', 'DNN', 'MLlib', 'Pandas', 'NumPy', 'Matplotlib', 'Seaborn', 'Plotly',
-    'DataRobot', 'Dataiku', 'MLflow',
-
-    # 데이터 엔지니어링/분석/ETL
-    'Airflow', 'Luigi', 'NiFi', 'Talend', 'Pentaho', 'Informatica', 'Spark', '하둡', 'Hadoop', 'Hive', 'Pig', 'Presto', 'Superset',
-    'Tableau', 'PowerBI', 'QlikView', 'Metabase', 'Redash', 'Data Studio', 'Looker', 'Google Analytics',
-
-    # API/통신/보안
-    'REST', 'RESTful', 'GraphQL', 'gRPC', 'SOAP', 'WebSocket', 'JWT', 'OAuth', 'OpenAPI', 'Swagger', 'SAML', 'SFTP', 'SSL', 'TLS',
-
-    # 기타 도구/기술/용어
-    'Linux', 'Ubuntu', 'CentOS', 'RedHat', 'Windows Server', 'MacOS', 'VSCode', 'IntelliJ', 'PyCharm', 'Eclipse', 'JIRA',
-    'Confluence', 'Slack', 'Notion', 'Zoom', 'Teams', 'Figma', 'Zeplin', 'Sketch', 'Adobe XD', 'Photoshop', 'Illustrator',
-    'Firebase', 'Notion', 'GitBook', 'Trello', 'Asana', 'Miro',
-
-    # 테스트/품질/협업
-    'Jest', 'Mocha', 'Chai', 'JUnit', 'Mockito', 'Selenium', 'Cypress', 'Appium', 'TestNG', 'QUnit', 'SonarQube', 'Allure',
-
-    # 산업별 솔루션/ERP/CRM/특수 시스템 (예시)
-    'SAP', 'ERP', 'CRM', 'Salesforce', 'SAP HANA', 'Oracle EBS', 'PeopleSoft', 'Workday',
-
-    # 자연어처리/챗봇
-    'BERT', 'GPT', 'ChatGPT', 'KoBERT', 'ELECTRA', 'spaCy', 'NLTK', 'SentencePiece',
-
-    # 금융/핀테크 특화
-    'OpenBanking', 'ISO20022', 'FIDO', 'NICE', 'KISA', 'VAN', 'PG사', 'CMS', '핀테크', '제로페이'
-]
 STOPWORDS = [
     # 한글 불용어 (일반 명사, 잡단어)
     '경험', '업무', '프로젝트', '기술', '역량', '이상', '기반', '수행', '결과', '관련', '구축', '처리',
@@ -101,16 +74,48 @@ STOPWORDS = [
 ]
 
 
+# 공고 원문 칼럼 (content_hash 대상)
+SOURCE_COLUMNS = ['title', 'company', 'location', 'experience', 'description', 'requirements', 'preferred', 'job_type']
+UPSERT_JOB_COLUMNS = [
+    'job_id', 'title', 'company', 'location', 'experience', 'years', 'description',
+    'requirements', 'preferred', 'job_type', 'cleaned_text', 'tokens_str', 'skills', 'dup_cluster_id',
+    'content_hash'
+]
+# 기존 행은 LLM 추출 결과(llm_extracted_tech_skills)를 유지한 채 갱신 (재추출 여부는 llm 단계가 판단)
+UPSERT_JOB_SQL = f'''
+    INSERT INTO jobs ({', '.join(UPSERT_JOB_COLUMNS)})
+    VALUES ({', '.join('?' * len(UPSERT_JOB_COLUMNS))})
+    ON CONFLICT(job_id) DO UPDATE SET
+    {', '.join(f'{column} = excluded.{column}' for column in UPSERT_JOB_COLUMNS[1:])}
+'''
+UPDATE_TECH_SKILLS_SQL = 'UPDATE jobs SET llm_extracted_tech_skills = ? WHERE job_id = ?'
+DELETE_JOB_SQL = 'DELETE FROM jobs WHERE job_id = ?'
+UPDATE_DUP_CLUSTER_SQL = 'UPDATE jobs SET dup_cluster_id = ? WHERE job_id = ?'
+
+
+def _skill_set(skills_json):
+    """skills JSON → 토큰 집합 (없으면 None)"""
+    return frozenset(json.loads(skills_json)) if isinstance(skills_json, str) else None
+
+
 class JobDataProcessor:
-    def __init__(self, csv_path='data/job_infos.csv', db_path='data/job_data.db'):
+    def __init__(self, csv_path=ETLConfig.CSV_PATH, db_path=ETLConfig.DB_PATH):
         self.csv_path = csv_path
         self.db_path = db_path
-        self.okt = Okt()
-        self.url_pattern = re.compile(r'https?://\S+|www\.\S+')
-        self.special_char_pattern = re.compile(r'[^\w\s]')
+        self._okt = None  # 형태소 분석기(JVM)는 토큰화 시점에 초기화
+
+        # 기술 스택 표기 정규화 (매처와 같은 공용 인스턴스: 별칭 테이블 + TECH_KEYWORDS + 버전 규칙)
+        self.skill_canonicalizer = SKILL_CANONICALIZER
         
-        # TF-IDF 벡터화 설정
-        self.tfidf_vectorizer = TfidfVectorizer(min_df=0.01, max_df=0.9)
+        # TF-IDF 모델 (process_data에서 저장된 모델을 불러와 증분 갱신)
+        self.tfidf_model = None
+        
+        # 임베딩 인코더/프로세스 풀 (인코딩할 공고가 있을 때만 로드, 연속 수집 시 배치 사이에 유지)
+        self._embedding_encoder = None
+        self._embedding_pool = None
+        
+        # 직전 실행이 저장한 아티팩트 객체 (연속 수집 시 다음 실행에서 다시 읽지 않음)
+        self._warm_artifacts = {}
         
         # Cerebras API 키 로드
         self.cerebras_api_key = os.getenv("CEREBRAS_API_KEY")
@@ -134,30 +139,32 @@ class JobDataProcessor:
             }
         }
         
-        # 토큰 사용량 추적
-        self.token_usage = {
-            'minute': {'count': 0, 'reset_time': time.time()},
-            'hour': {'count': 0, 'reset_time': time.time()},
-            'day': {'count': 0, 'reset_time': time.time()}
-        }
+        # 분/시간/일 × 요청/토큰 토큰 버킷 (응답 usage로 보정)
+        self.rate_limiter = AsyncRateLimiter(self.rate_limits)
         
-        # 요청 횟수 추적
-        self.request_usage = {
-            'minute': {'count': 0, 'reset_time': time.time()},
-            'hour': {'count': 0, 'reset_time': time.time()},
-            'day': {'count': 0, 'reset_time': time.time()}
-        }
+        # LLM 요청 통계 (지연 시간, 재시도, 토큰 사용량)
+        self.llm_stats = LLMCallStats()
         
+        # 토큰 집합 기반 LLM 추출 캐시
+        self.llm_cache = LLMExtractionCache(ETLConfig.LLM_CACHE_PATH) if ETLConfig.LLM_CACHE_ENABLED else None
+
+        # 사전 기반 빠른 경로 (모르는 토큰이 있는 공고만 LLM 요청)
+        self.local_extractor = DictionarySkillExtractor(
+            TECH_KEYWORDS, STOPWORDS, TokenVocabulary(ETLConfig.LLM_CACHE_PATH),
+            min_observations=ETLConfig.LOCAL_MIN_OBSERVATIONS,
+            min_confidence=ETLConfig.LOCAL_MIN_CONFIDENCE
+        ) if ETLConfig.LOCAL_EXTRACTION_ENABLED else None
+        
+    @property
+    def okt(self):
+        """Okt 형태소 분석기 (첫 사용 시 생성)"""
+        if self._okt is None:
+            self._okt = Okt()
+        return self._okt
+
     def _clean_text(self, text):
-        """텍스트 클린징: URL 제거, 특수문자 제거, 소문자화"""
-        text = str(text)
-        # URL 제거
-        text = self.url_pattern.sub('', text)
-        # 특수문자 제거
-        text = self.special_char_pattern.sub(' ', text)
-        # 여러 공백을 하나로 치환
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
+        """텍스트 클린징: URL 제거, 특수문자 제거, 공백 정리"""
+        return clean_text(text)
     
     def tokenize_mixed_skills(self, text):
         """
@@ -174,8 +181,10 @@ class JobDataProcessor:
             pattern = r'(?i)(?:\b|[^a-zA-Z0-9_])' + re.escape(kw.lower()) + r'(?:\b|[^a-zA-Z0-9_])'
             if re.search(pattern, f' {lowered_text} '):  # 앞뒤 공백 추가
                 found_keywords.add(kw)
-        tokens = set(korean_tokens) | found_keywords
-        filtered_tokens = [tok for tok in tokens if tok not in STOPWORDS and len(tok) > 1]
+        # 3. 별칭/버전 표기를 대표 표기로 통일 ('파이썬' -> 'Python')
+        tokens = {self.skill_canonicalizer.canonicalize(tok) for tok in set(korean_tokens) | found_keywords}
+        # 집합 순서는 프로세스마다(PYTHONHASHSEED) 달라지므로 정렬해 skills JSON/단계 해시를 고정
+        filtered_tokens = sorted(tok for tok in tokens if tok not in STOPWORDS and len(tok) > 1)
         return filtered_tokens
 
 
@@ -195,48 +204,6 @@ class JobDataProcessor:
         estimated_tokens = total_chars // 3  # 한영 혼용 고려
         return estimated_tokens
 
-    def _check_and_update_limits(self, messages):
-        """레이트 리밋 체크 및 대기"""
-        current_time = time.time()
-        estimated_tokens = self._estimate_tokens(messages)
-        
-        # 시간 간격별 초기화 및 체크
-        intervals = {
-            'minute': {'seconds': 60, 'token_limit': 60000, 'request_limit': 30},
-            'hour': {'seconds': 3600, 'token_limit': 1000000, 'request_limit': 900},
-            'day': {'seconds': 86400, 'token_limit': 1000000, 'request_limit': 14400}
-        }
-        
-        for interval, limits in intervals.items():
-            elapsed_time = current_time - self.token_usage[interval]['reset_time']
-            
-            # 시간 간격이 지났으면 카운터 초기화
-            if elapsed_time >= limits['seconds']:
-                self.token_usage[interval] = {'count': 0, 'reset_time': current_time}
-                self.request_usage[interval] = {'count': 0, 'reset_time': current_time}
-                continue
-            
-            # 토큰 또는 요청 한도 체크
-            if (self.token_usage[interval]['count'] + estimated_tokens > limits['token_limit'] or
-                self.request_usage[interval]['count'] + 1 > limits['request_limit']):
-                
-                # 다음 리셋 시간까지 남은 시간 계산
-                wait_time = limits['seconds'] - elapsed_time
-                
-                if wait_time > 0:
-                    print(f"\n{interval} 한도 도달. {wait_time:.1f}초 대기 중...")
-                    time.sleep(wait_time)
-                    # 대기 후 카운터 초기화
-                    self.token_usage[interval] = {'count': 0, 'reset_time': time.time()}
-                    self.request_usage[interval] = {'count': 0, 'reset_time': time.time()}
-        
-        # 사용량 업데이트
-        for interval in intervals:
-            self.token_usage[interval]['count'] += estimated_tokens
-            self.request_usage[interval]['count'] += 1
-        
-        return True
-
     def _get_tech_skills_schema(self):
         """기술 스택 추출을 위한 JSON 스키마 정의"""
         return {
@@ -252,6 +219,45 @@ class JobDataProcessor:
             "additionalProperties": False
         }
 
+    def _get_packed_tech_skills_schema(self):
+        """여러 공고를 한 요청으로 묶을 때의 JSON 스키마 (job_id별 기술 스택 배열)"""
+        return {
+            "type": "object",
+            "properties": {
+                "results": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "job_id": {
+                                "type": "string",
+                                "description": "The job_id given in the request, copied exactly"
+                            },
+                            "tech_skills": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "List of technical skills and technologies extracted from the tokens"
+                            }
+                        },
+                        "required": ["job_id", "tech_skills"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["results"],
+            "additionalProperties": False
+        }
+
+    # 프롬프트 문구를 바꾸면 올려서 이전 캐시 결과를 무효화한다
+    LLM_PROMPT_VERSION = 1
+
+    LLM_SYSTEM_PROMPT = """당신은 직무 공고에서 기술 스택을 정확하게 추출하는 전문가입니다.
+주의사항:
+1. 기술 스택은 원문의 표기를 정확히 유지할 것
+2. 확실한 기술 스택만 포함하고 애매한 것은 제외
+3. 일반적인 용어나 개념은 모두 제외
+4. 기술스택의 버전 정보가 있다면 함께 포함"""
+
     def _prepare_llm_messages(self, tokens, job_info):
         """LLM 요청을 위한 메시지 준비"""
         # 중복 제거 및 정렬
@@ -261,12 +267,7 @@ class JobDataProcessor:
         return [
             {
                 "role": "system", 
-                "content": """당신은 직무 공고에서 기술 스택을 정확하게 추출하는 전문가입니다.
-주의사항:
-1. 기술 스택은 원문의 표기를 정확히 유지할 것
-2. 확실한 기술 스택만 포함하고 애매한 것은 제외
-3. 일반적인 용어나 개념은 모두 제외
-4. 기술스택의 버전 정보가 있다면 함께 포함"""
+                "content": self.LLM_SYSTEM_PROMPT
             },
             {
                 "role": "user", 
@@ -277,41 +278,118 @@ class JobDataProcessor:
             }
         ]
 
+    def _format_packed_item(self, job_id, tokens):
+        """패킹 요청의 공고 한 줄"""
+        return f"[job_id={job_id}] {', '.join(sorted(set(tokens)))}"
+
+    def _prepare_packed_llm_messages(self, items):
+        """여러 공고의 토큰 목록을 하나의 요청으로 묶은 메시지 준비
+
+        Args:
+            items: (job_id 문자열, 토큰 목록) 리스트
+        """
+        lines = "\n".join(self._format_packed_item(job_id, tokens) for job_id, tokens in items)
+        return [
+            {
+                "role": "system",
+                "content": self.LLM_SYSTEM_PROMPT + """
+5. 공고별로 job_id를 그대로 적어 결과를 따로 반환하고, 공고 사이에 결과를 섞지 말 것"""
+            },
+            {
+                "role": "user",
+                "content": f"""
+다음 공고별 단어 목록 각각에 대하여 기술 스택을 추출해주세요.
+{lines}
+"""
+            }
+        ]
+
+    def _pack_units(self, units):
+        """토큰 예산과 최대 개수 기준으로 작업 단위를 요청 묶음으로 분할
+
+        Args:
+            units: (cache_key, 토큰 목록, 공고 행) 리스트
+        """
+        base_tokens = self.rate_limiter.scaled_estimate(
+            self._estimate_tokens(self._prepare_packed_llm_messages([]))
+        )
+        packs, current, current_tokens = [], [], base_tokens
+        for unit in units:
+            _, tokens, row = unit
+            line = self._format_packed_item(row['job_id'], tokens)
+            # 입력 토큰 추정치 + 응답에 필요한 출력 토큰 여유분
+            cost = (self.rate_limiter.scaled_estimate(len(line) // 3)
+                    + ETLConfig.LLM_PACK_OUTPUT_TOKENS_PER_ITEM)
+            if current and (len(current) >= ETLConfig.LLM_PACK_MAX_ITEMS or
+                            current_tokens + cost > ETLConfig.LLM_PACK_TOKEN_BUDGET):
+                packs.append(current)
+                current, current_tokens = [], base_tokens
+            current.append(unit)
+            current_tokens += cost
+        if current:
+            packs.append(current)
+        return packs
+
+    @staticmethod
+    def _validate_tech_skills(skills):
+        """기술 스택 유효성 검증"""
+        if not isinstance(skills, list):
+            return False
+                    
+        # 각 스킬이 일반 용어가 아닌지 확인
+        filtered_skills = [
+            skill for skill in skills 
+            if isinstance(skill, str) and 
+            skill.strip()]
+        
+        return len(filtered_skills) > 0
+
+    async def _create_completion(self, async_client, messages, temperature,
+                                 schema_name="tech_skills_schema", schema=None):
+        """레이트 리미터를 거쳐 chat completion 요청 (응답 usage로 토큰 추정치 보정)"""
+        charged_tokens = await self.rate_limiter.acquire(self._estimate_tokens(messages))
+        
+        start = time.perf_counter()
+        try:
+            chat_completion = await async_client.chat.completions.create(
+                model=ETLConfig.LLM_MODEL,
+                messages=messages,
+                response_format={
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": schema_name,
+                        "strict": True,
+                        "schema": schema or self._get_tech_skills_schema()
+                    }
+                },
+                temperature=temperature
+            )
+        except Exception as e:
+            self.llm_stats.record_request(time.perf_counter() - start, error=type(e).__name__)
+            if isinstance(e, APIConnectionError) and not isinstance(e, APITimeoutError):
+                # 연결 실패는 서버에 닿지 않은 요청이므로 차감량을 돌려준다 (시간 초과는 이미 보냈을 수 있음)
+                self.rate_limiter.refund(charged_tokens)
+            raise
+        
+        usage = getattr(chat_completion, 'usage', None)
+        self.llm_stats.record_request(time.perf_counter() - start, usage=usage)
+        self.rate_limiter.reconcile(charged_tokens, getattr(usage, 'total_tokens', None))
+        return chat_completion
+
     async def _call_llm_with_retry(self, async_client, messages, tokens):
-        """재시도 로직이 포함된 LLM 호출"""
+        """재시도 로직이 포함된 LLM 호출
+
+        Returns:
+            (기술 스택 목록, 출처) - 출처는 'llm' 또는 'fallback'
+        """
         max_retries = 5
         retry_delay = 1  # 초기 대기 시간 (초)
-        
-        def validate_tech_skills(skills):
-            """기술 스택 유효성 검증"""
-            if not isinstance(skills, list):
-                return False
-                        
-            # 각 스킬이 일반 용어가 아닌지 확인
-            filtered_skills = [
-                skill for skill in skills 
-                if isinstance(skill, str) and 
-                skill.strip()]
-            
-            return len(filtered_skills) > 0
+        validate_tech_skills = self._validate_tech_skills
         
         for attempt in range(max_retries):
             try:
-                # 레이트 리밋 체크
-                await asyncio.to_thread(self._check_and_update_limits, messages)
-                
-                chat_completion = await async_client.chat.completions.create(
-                    model="llama-3.3-70b",
-                    messages=messages,
-                    response_format={
-                        "type": "json_schema",
-                        "json_schema": {
-                            "name": "tech_skills_schema",
-                            "strict": True,
-                            "schema": self._get_tech_skills_schema()
-                        }
-                    },
-                    temperature=0.0
+                chat_completion = await self._create_completion(
+                    async_client, messages, temperature=ETLConfig.LLM_TEMPERATURE
                 )
                 
                 try:
@@ -321,11 +399,12 @@ class JobDataProcessor:
                     
                     # 추출된 기술 스택 유효성 검증
                     if validate_tech_skills(extracted_skills):
-                        return extracted_skills
+                        return extracted_skills, 'llm'
                     else:
                         print(f"Invalid tech skills format or empty result for job. Retrying...")
                         if attempt == max_retries - 1:
-                            return self._extract_fallback_tech_skills(tokens)
+                            return self._extract_fallback_tech_skills(tokens), 'fallback'
+                        self.llm_stats.record_retry('InvalidResponse')
                         continue
                         
                 except (json.JSONDecodeError, KeyError, AttributeError) as e:
@@ -333,39 +412,29 @@ class JobDataProcessor:
                     print("Retrying the same request immediately...")
                     
                     # 파싱 에러 발생 시 즉시 한 번 더 시도
+                    self.llm_stats.record_retry('ParseError')
                     try:
                         await asyncio.sleep(1)  # 1초 대기 후 재시도
-                        chat_completion = await async_client.chat.completions.create(
-                            model="llama-3.3-70b",
-                            messages=messages,
-                            response_format={
-                                "type": "json_schema",
-                                "json_schema": {
-                                    "name": "tech_skills_schema",
-                                    "strict": True,
-                                    "schema": self._get_tech_skills_schema()
-                                }
-                            },
-                            temperature=0.1
-                        )
+                        chat_completion = await self._create_completion(async_client, messages, temperature=0.1)
                         content = chat_completion.choices[0].message.content
                         tech_skills_data = json.loads(content)
                         extracted_skills = tech_skills_data.get("tech_skills", [])
                         
                         if validate_tech_skills(extracted_skills):
-                            return extracted_skills
+                            return extracted_skills, 'llm'
                     except Exception as retry_e:
                         print(f"Immediate retry also failed: {str(retry_e)}")
                     
                     if attempt == max_retries - 1:
-                        return self._extract_fallback_tech_skills(tokens)
+                        return self._extract_fallback_tech_skills(tokens), 'fallback'
                     continue
                 
             except RateLimitError as e:
                 if attempt == max_retries - 1:
                     print(f"Rate limit exceeded after {max_retries} attempts. Error: {str(e)}")
-                    return self._extract_fallback_tech_skills(tokens)
+                    return self._extract_fallback_tech_skills(tokens), 'fallback'
                 
+                self.llm_stats.record_retry('RateLimitError')
                 wait_time = retry_delay * (2 ** attempt)  # 지수 백오프
                 print(f"Rate limit hit, waiting {wait_time} seconds before retry...")
                 await asyncio.sleep(wait_time)
@@ -374,19 +443,73 @@ class JobDataProcessor:
                 print(f"Connection error: {str(e)}")
                 print(f"Underlying error: {e.__cause__}")
                 if attempt == max_retries - 1:
-                    return self._extract_fallback_tech_skills(tokens)
+                    return self._extract_fallback_tech_skills(tokens), 'fallback'
+                self.llm_stats.record_retry('APIConnectionError')
                 await asyncio.sleep(retry_delay)
                 
             except APIStatusError as e:
                 print(f"API error: Status {e.status_code}")
                 print(f"Response: {e.response}")
-                return self._extract_fallback_tech_skills(tokens)
+                return self._extract_fallback_tech_skills(tokens), 'fallback'
                 
             except Exception as e:
                 print(f"Unexpected error: {str(e)}")
-                return self._extract_fallback_tech_skills(tokens)
+                return self._extract_fallback_tech_skills(tokens), 'fallback'
         
-        return self._extract_fallback_tech_skills(tokens)  # 모든 재시도 실패 시
+        return self._extract_fallback_tech_skills(tokens), 'fallback'  # 모든 재시도 실패 시
+        
+    async def _call_llm_packed(self, async_client, units):
+        """여러 공고를 한 요청으로 추출하고, 검증에 실패한 항목만 개별 재요청
+
+        Returns:
+            units와 같은 순서의 (기술 스택 목록, 출처) 리스트
+        """
+        max_retries = 3
+        messages = self._prepare_packed_llm_messages(
+            [(str(row['job_id']), tokens) for _, tokens, row in units]
+        )
+        
+        parsed = {}
+        for attempt in range(max_retries):
+            try:
+                chat_completion = await self._create_completion(
+                    async_client, messages, temperature=ETLConfig.LLM_TEMPERATURE,
+                    schema_name="packed_tech_skills_schema",
+                    schema=self._get_packed_tech_skills_schema()
+                )
+                content = chat_completion.choices[0].message.content
+                for item in json.loads(content).get("results", []):
+                    if isinstance(item, dict):
+                        parsed[str(item.get("job_id"))] = item.get("tech_skills")
+                break
+            except (RateLimitError, APIConnectionError) as e:
+                # 일시적 오류는 묶음 그대로 백오프 후 재시도
+                print(f"Packed request error ({type(e).__name__}), retrying...")
+                self.llm_stats.record_retry(type(e).__name__)
+                await asyncio.sleep(2 ** attempt)
+            except Exception as e:
+                # 묶음 전체가 실패하면 모든 항목을 개별 재요청
+                print(f"Packed request failed for {len(units)} jobs: {str(e)}")
+                break
+        
+        outcomes = []
+        for _, tokens, row in units:
+            skills = parsed.get(str(row['job_id']))
+            if self._validate_tech_skills(skills):
+                outcomes.append((skills, 'llm'))
+                continue
+            
+            # 검증 실패 항목만 단건 요청으로 재시도
+            self.llm_stats.record_retry('PackedItemInvalid')
+            job_info = {
+                'title': row['title'],
+                'description': row['description'],
+                'requirements': row['requirements'],
+                'preferred': row['preferred']
+            }
+            single_messages = self._prepare_llm_messages(tokens, job_info)
+            outcomes.append(await self._call_llm_with_retry(async_client, single_messages, tokens))
+        return outcomes
         
     def _extract_fallback_tech_skills(self, tokens):
         """LLM 추출 실패 시 폴백 로직으로 기술 스택 추출"""
@@ -414,13 +537,21 @@ class JobDataProcessor:
         
         return list(set(tech_skills))  # 중복 제거
 
-    async def extract_tech_skills_batch(self, df):
-        """직무에 대한 기술 스택 토큰을 순차적으로 추출"""
+    async def extract_tech_skills_batch(self, df, pipeline_run=None):
+        """직무별 기술 스택 추출
+
+        캐시 적중분과 사전으로 해석되는 공고는 바로 기록하고,
+        나머지는 같은 토큰 집합당 한 번만 요청한다.
+        유사 중복 공고(dup_cluster_id가 다른 공고)는 요청하지 않고 대표 공고 결과를 그대로 쓴다.
+        pipeline_run이 주어지면 결과와 함께 llm 단계 상태(df['llm_input_hash'])를 기록한다.
+        패킹 모드에서는 여러 공고를 한 요청으로 묶으며, 최대 LLM_CONCURRENCY개
+        요청을 동시에 처리한다.
+        """
         if not self.cerebras_api_key:
             return df
         
         async_client = AsyncCerebras(api_key=self.cerebras_api_key)
-        conn = sqlite3.connect(self.db_path)
+        conn = configure_connection(sqlite3.connect(self.db_path))
         cursor = conn.cursor()
         
         # llm_extracted_tech_skills 컬럼이 없으면 추가
@@ -430,56 +561,193 @@ class JobDataProcessor:
             cursor.execute('ALTER TABLE jobs ADD COLUMN llm_extracted_tech_skills TEXT DEFAULT NULL')
             conn.commit()
         
-        all_results = []
+        # 결과/캐시 쓰기는 전용 스레드가 배치 단위로 커밋 (이벤트 루프는 커밋을 기다리지 않음)
+        writer = BackgroundWriter(self.db_path, batch_size=ETLConfig.LLM_RESULT_BATCH_SIZE,
+                                  flush_interval=ETLConfig.LLM_RESULT_FLUSH_SECONDS)
+        cache_writer = None
+        if self.llm_cache is not None:
+            cache_writer = BackgroundWriter(self.llm_cache.path, batch_size=ETLConfig.LLM_RESULT_BATCH_SIZE,
+                                            flush_interval=ETLConfig.LLM_RESULT_FLUSH_SECONDS)
         total_jobs = len(df)
+        all_results = [None] * total_jobs
+        job_ids = df['job_id'].tolist()
+        input_hashes = df['llm_input_hash'].tolist() if pipeline_run is not None else None
+        progress = tqdm(total=total_jobs, desc="기술 스택 추출 처리")
+        if self.llm_cache is not None:
+            self.llm_cache.reset_stats()
+        if self.local_extractor is not None:
+            self.local_extractor.reset_stats()
+        self.llm_stats.reset()
+        self.rate_limiter.reset_stats()
         
-        for idx, row in tqdm(df.iterrows(), total=total_jobs, desc="기술 스택 추출 처리"):
+        def record(position, result, source, error=None):
+            """완료되는 대로 결과와 저널 상태를 같은 트랜잭션으로 쓰기 버퍼에 추가"""
+            result = self.skill_canonicalizer.canonicalize_skills(result)
+            all_results[position] = result
+            self.llm_stats.record_outcome(source)
+            tech_skills_json = json.dumps(result, ensure_ascii=False)
+            job_id = int(job_ids[position])
+            statements = [
+                (UPDATE_TECH_SKILLS_SQL, (tech_skills_json, job_id)),
+                result_statement(job_id, source, error)
+            ]
+            if pipeline_run is not None:
+                # 폴백/오류 결과의 재시도는 저널(EXTRACTION_MAX_ATTEMPTS)이 판단한다
+                statements.append(pipeline_run.statement('llm', job_id, input_hashes[position]))
+            writer.add_group(statements)
+            progress.update(1)
+            # 대표 공고 결과를 중복 공고에도 기록 (폴백/오류는 같은 상태로 남겨 함께 재시도)
+            duplicate_source = 'duplicate' if STATUS_BY_SOURCE[source] == 'done' else source
+            for duplicate in duplicate_positions.pop(position, ()):
+                record(duplicate, result, duplicate_source, error)
+        
+        # 0. 유사 중복 공고 분리 (대표가 이번 실행에 있으면 대표 기록 시 함께, 이미 완료됐으면 바로 기록)
+        duplicate_positions = {}   # 대표 공고 위치 -> 중복 공고 위치들
+        stored_results = {}        # 이번 실행에 없는 완료된 대표 공고 결과
+        position_by_job_id = {int(job_id): position for position, job_id in enumerate(job_ids)}
+        if 'dup_cluster_id' in df.columns:
+            representative_ids = {
+                int(cluster_id) for job_id, cluster_id in zip(job_ids, df['dup_cluster_id'])
+                if pd.notna(cluster_id) and int(cluster_id) != int(job_id)
+            }
+            stored_results = self._load_done_results(conn, representative_ids - set(position_by_job_id))
+            for position, (job_id, cluster_id) in enumerate(zip(job_ids, df['dup_cluster_id'])):
+                if pd.isna(cluster_id) or int(cluster_id) == int(job_id):
+                    continue
+                if int(cluster_id) in position_by_job_id:
+                    duplicate_positions.setdefault(position_by_job_id[int(cluster_id)], []).append(position)
+        duplicate_set = {position for positions in duplicate_positions.values() for position in positions}
+        
+        # 1. 캐시 조회, 사전 해석 및 같은 토큰 집합끼리 묶기
+        units = []              # (cache_key, 토큰 목록, 대표 공고 행)
+        positions_by_key = {}   # cache_key -> 해당 토큰 집합을 가진 공고 위치들
+        local_results = {}      # cache_key -> 사전으로 해석한 기술 스택
+        for position, (_, row) in enumerate(df.iterrows()):
+            if position in duplicate_set:
+                continue
+            cluster_id = row.get('dup_cluster_id')
+            if pd.notna(cluster_id) and int(cluster_id) in stored_results:
+                record(position, stored_results[int(cluster_id)], 'duplicate')
+                continue
+
             try:
-                job_id = row['job_id']
-                print(f"\nProcessing job_id: {job_id}")
-                
                 tokens = json.loads(row['skills'])
-                job_info = {
-                    'title': row['title'],
-                    'description': row['description'],
-                    'requirements': row['requirements'],
-                    'preferred': row['preferred']
-                }
-                
-                # LLM 메시지 준비
-                messages = self._prepare_llm_messages(tokens, job_info)
-                
-                # LLM 호출 및 결과 처리
-                result = await self._call_llm_with_retry(async_client, messages, tokens)
-                all_results.append(result)
-                
-                # 결과를 즉시 DB에 업데이트
-                tech_skills_json = json.dumps(result, ensure_ascii=False)
-                cursor.execute(
-                    'UPDATE jobs SET llm_extracted_tech_skills = ? WHERE job_id = ?',
-                    (tech_skills_json, job_id)
-                )
-                conn.commit()
-                
-                # 진행상황 출력 (100개마다)
-                if (idx + 1) % 100 == 0:
-                    print(f"진행률: {idx + 1}/{total_jobs} 완료")
+            except (TypeError, ValueError) as e:
+                print(f"Job processing error for job_id {row['job_id']}: {str(e)}")
+                record(position, [], 'error', str(e))
+                continue
+            
+            cache_key = LLMExtractionCache.make_key(
+                tokens, self.LLM_PROMPT_VERSION, ETLConfig.LLM_MODEL, ETLConfig.LLM_TEMPERATURE
+            )
+            if cache_key in local_results:
+                record(position, local_results[cache_key], 'local')
+                continue
+
+            if cache_key in positions_by_key:
+                # 이번 실행에서 이미 요청 예정인 토큰 집합
+                positions_by_key[cache_key].append(position)
+                if self.llm_cache is not None:
+                    self.llm_cache.record_hit()
+                continue
+            
+            if self.llm_cache is not None:
+                cached = self.llm_cache.get(cache_key)
+                if cached is not None:
+                    record(position, cached, 'cache')
+                    continue
+            
+            if self.local_extractor is not None:
+                resolved = self.local_extractor.resolve(tokens)
+                if resolved is not None:
+                    local_results[cache_key] = resolved
+                    record(position, resolved, 'local')
+                    continue
+            
+            positions_by_key[cache_key] = [position]
+            units.append((cache_key, tokens, row))
+        
+        # 2. 요청 묶음 구성 (패킹 모드가 아니면 요청 하나에 공고 하나)
+        if ETLConfig.LLM_PACKING and len(units) > 1:
+            batches = self._pack_units(units)
+            print(f"패킹 모드: 공고 {len(units)}건을 요청 {len(batches)}건으로 묶었습니다.")
+        else:
+            batches = [[unit] for unit in units]
+        
+        queue = asyncio.Queue()
+        for batch in batches:
+            queue.put_nowait(batch)
+        
+        async def extract_batch(batch):
+            """요청 묶음 하나 처리"""
+            if len(batch) > 1:
+                return await self._call_llm_packed(async_client, batch)
+            
+            _, tokens, row = batch[0]
+            job_info = {
+                'title': row['title'],
+                'description': row['description'],
+                'requirements': row['requirements'],
+                'preferred': row['preferred']
+            }
+            messages = self._prepare_llm_messages(tokens, job_info)
+            return [await self._call_llm_with_retry(async_client, messages, tokens)]
+        
+        async def worker():
+            """큐가 빌 때까지 요청 묶음을 하나씩 처리 (워커 수 = 동시 요청 수)"""
+            while True:
+                try:
+                    batch = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
                 
-                # 요청 간 짧은 휴식
-                await asyncio.sleep(0.1)
+                error = None
+                try:
+                    outcomes = await extract_batch(batch)
+                except Exception as e:
+                    # 오류는 해당 묶음의 공고에만 영향을 준다
+                    print(f"Job processing error for job_id "
+                          f"{', '.join(str(row['job_id']) for _, _, row in batch)}: {str(e)}")
+                    error = str(e)
+                    outcomes = [(tokens, 'error') for _, tokens, _ in batch]
                 
-            except Exception as e:
-                print(f"Job processing error for job_id {row['job_id']}: {str(e)}")
-                all_results.append(tokens)
-                # 에러 발생 시에도 원본 토큰을 DB에 저장
-                tech_skills_json = json.dumps(tokens, ensure_ascii=False)
-                cursor.execute(
-                    'UPDATE jobs SET llm_extracted_tech_skills = ? WHERE job_id = ?',
-                    (tech_skills_json, job_id)
-                )
-                conn.commit()
+                for (cache_key, tokens, _), (result, source) in zip(batch, outcomes):
+                    # 폴백 결과는 캐시/학습하지 않는다 (다음 실행에서 다시 시도)
+                    if source == 'llm':
+                        if cache_writer is not None:
+                            cache_writer.add(*self.llm_cache.put_statement(cache_key, result))
+                        if self.local_extractor is not None:
+                            # 토큰은 대표 표기이므로 결과도 대표 표기로 맞춰 학습 (별칭/버전 차이를 non_tech로 세지 않도록)
+                            canonical = self.skill_canonicalizer.canonicalize_skills(result)
+                            self.local_extractor.observe(tokens, canonical)
+                    for index, position in enumerate(positions_by_key[cache_key]):
+                        # 같은 실행에서 결과를 공유한 공고는 캐시 적중으로 본다
+                        record(position, result, source if index == 0 or source != 'llm' else 'cache', error)
         
-        conn.close()
+        concurrency = max(1, min(ETLConfig.LLM_CONCURRENCY, len(batches)))
+        try:
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+        finally:
+            progress.close()
+            # 중단(Ctrl+C 포함)되어도 큐에 남은 결과를 모두 기록한 뒤 종료
+            writer.close()
+            if cache_writer is not None:
+                cache_writer.close()
+            print(f"기술 스택 결과 저장: {writer.summary()}")
+            print(f"LLM 요청: {self.llm_stats.summary()}")
+            print(f"레이트 리미터: {self.rate_limiter.summary()}")
+            if self.llm_cache is not None:
+                print(f"LLM 캐시: {self.llm_cache.summary()}")
+            if self.local_extractor is not None:
+                self.local_extractor.save()
+                print(f"사전 추출: {self.local_extractor.summary()}")
+            if total_jobs:
+                local_count = self.llm_stats.outcomes['local']
+                print(f"로컬 처리 공고: {local_count}/{total_jobs} ({local_count / total_jobs:.1%})")
+                duplicate_count = self.llm_stats.outcomes['duplicate']
+                if duplicate_count:
+                    print(f"중복 공고 결과 재사용: {duplicate_count}/{total_jobs}")
+            conn.close()
         
         try:
             # DataFrame 업데이트
@@ -491,25 +759,52 @@ class JobDataProcessor:
         
         return df
     
+    @staticmethod
+    def _representative_llm_hashes(conn, run, df, is_representative):
+        """중복 공고가 가리키는 대표 공고의 LLM 입력 해시 (입력에 없는 대표는 기록된 단계 상태)"""
+        hashes = dict(zip(df.loc[is_representative, 'job_id'].astype(int),
+                          run.hashes('llm', [df.loc[is_representative, 'skills']])))
+        outside = {int(cluster_id) for cluster_id in df.loc[~is_representative, 'dup_cluster_id']} - set(hashes)
+        hashes.update(select_in(conn, "SELECT job_id, input_hash FROM stage_state WHERE stage = 'llm' "
+                                      "AND job_id IN ({})", sorted(outside)))
+        return hashes
+
+    @staticmethod
+    def _llm_input_hashes(run, frame, representative_hashes):
+        """LLM 단계 입력 해시 (중복 공고는 대표 공고의 입력 해시 포함: 대표가 바뀌면 복사한 결과도 다시 기록)"""
+        own = run.hashes('llm', [frame['skills']])
+        duplicate = run.hashes('llm', [frame['skills'], frame['dup_cluster_id'],
+                                       frame['dup_cluster_id'].map(representative_hashes).fillna('')])
+        return np.where((frame['job_id'] == frame['dup_cluster_id']).to_numpy(), own, duplicate)
+
+    @staticmethod
+    def _load_duplicates(conn, representative_ids, exclude_job_ids):
+        """대표 공고들의 중복 공고 중 exclude_job_ids에 없는 공고 (LLM 추출 입력 칼럼)"""
+        columns = ['job_id', 'title', 'description', 'requirements', 'preferred', 'skills', 'dup_cluster_id']
+        rows = select_in(conn, f"SELECT {', '.join(columns)} FROM jobs "
+                               f"WHERE job_id != dup_cluster_id AND dup_cluster_id IN ({{}})",
+                         [int(job_id) for job_id in representative_ids])
+        duplicates = pd.DataFrame(rows, columns=columns)
+        return duplicates[~duplicates['job_id'].isin(exclude_job_ids)].reset_index(drop=True)
+
+    def _load_done_results(self, conn, job_ids):
+        """추출이 완료된(done) 공고의 기술 스택 결과"""
+        job_ids = list(job_ids)
+        results = {}
+        for start in range(0, len(job_ids), 500):
+            chunk = job_ids[start:start + 500]
+            rows = conn.execute(f'''
+                SELECT j.job_id, j.llm_extracted_tech_skills
+                FROM jobs j JOIN extraction_journal e ON e.job_id = j.job_id
+                WHERE e.status = 'done' AND j.llm_extracted_tech_skills IS NOT NULL
+                  AND j.job_id IN ({','.join('?' * len(chunk))})
+            ''', chunk).fetchall()
+            results.update((job_id, json.loads(skills_json)) for job_id, skills_json in rows)
+        return results
+
     def _extract_years(self, experience_text):
-        """경력 연차 추출"""
-        if pd.isna(experience_text) or experience_text == '':
-            return 0
-        
-        # "경력 3-5년" 같은 패턴에서 숫자 추출
-        match = re.search(r'(\d+)[-~]?(\d+)?년?', experience_text)
-        if match:
-            # 범위가 있는 경우 (예: 3-5년)
-            if match.group(2):
-                return int(match.group(1))  # 최소 연차만 반환
-            # 단일 숫자인 경우 (예: 3년)
-            return int(match.group(1))
-        
-        # 신입 또는 숫자가 없는 경우
-        if '신입' in experience_text:
-            return 0
-        
-        return 0  # 기본값
+        """경력 연차 추출 (범위면 최소 연차, 신입/숫자 없음은 0)"""
+        return extract_years(experience_text)
     
     def create_database(self):
         """SQLite 데이터베이스 생성 및 테이블 설정"""
@@ -533,32 +828,460 @@ class JobDataProcessor:
             cleaned_text TEXT,
             tokens_str TEXT,
             skills TEXT,
-            llm_extracted_tech_skills TEXT DEFAULT NULL
+            llm_extracted_tech_skills TEXT DEFAULT NULL,
+            dup_cluster_id INTEGER,
+            content_hash TEXT
         )
         ''')
         
-        # 모델 정보 저장 테이블 (존재하지 않는 경우에만)
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS model_data (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT UNIQUE,
-            data BLOB
-        )
-        ''')
+        # 유사 중복 클러스터 / 원문 해시 컬럼이 없으면 추가 (이전 버전 DB)
+        cursor.execute("PRAGMA table_info(jobs)")
+        columns = [col[1] for col in cursor.fetchall()]
+        if 'dup_cluster_id' not in columns:
+            cursor.execute('ALTER TABLE jobs ADD COLUMN dup_cluster_id INTEGER')
+        if 'content_hash' not in columns:
+            cursor.execute('ALTER TABLE jobs ADD COLUMN content_hash TEXT')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_dup_cluster_id ON jobs(dup_cluster_id)')
+        
+        # 공고 키워드 검색 인덱스 (FTS5, jobs 트리거로 UPSERT/삭제와 함께 갱신)
+        if ETLConfig.FTS_ENABLED:
+            create_fts_index(cursor, ETLConfig.FTS_TOKENIZER)
+        else:
+            drop_fts_index(cursor)
+        
+        # LLM 추출 저널 테이블 (존재하지 않는 경우에만)
+        create_journal_table(cursor)
+        
+        # 단계별 입력 해시/출력 버전 테이블 (존재하지 않는 경우에만)
+        create_stage_table(cursor)
+        
+        # 모델 산출물은 ETLConfig.ARTIFACT_DIR의 버전별 아티팩트로 저장한다
+        # (이전 버전의 pickle BLOB 테이블 정리)
+        cursor.execute('DROP TABLE IF EXISTS model_data')
         
         conn.commit()
         conn.close()
         
         print("SQLite 데이터베이스 테이블이 확인/생성되었습니다.")
     
-    def process_data(self):
-        """CSV 데이터 전처리 및 SQLite에 저장"""
-        self.tokenize_mixed_skills
+    def _run_llm_extraction(self, df, conn, pipeline_run=None, defer_artifacts=False):
+        """LLM 기술 스택 추출 후 주요 기술 스택 목록 갱신 (defer_artifacts면 flush_artifacts()에서 갱신)
+
+        Returns:
+            기술 스택 결과가 바뀐 공고 수 (0이면 주요 기술 스택 목록도 그대로 둔다)
+        """
+        if not self.cerebras_api_key:
+            print("\nCEREBRAS_API_KEY가 없어 기술 스택 추출을 건너뜁니다.")
+            return 0
+
+        print("\nLLM을 사용하여 기술 스택 추출을 시작합니다...")
+        before = self._load_tech_skills(conn, df['job_id'])
+        try:
+            # 전체 데이터셋 한번에 처리
+            print(f"총 {len(df)}개의 데이터를 처리합니다.")
+            # 결과와 저널 상태는 extract_tech_skills_batch에서 이미 DB에 기록된다
+            asyncio.run(self.extract_tech_skills_batch(df, pipeline_run))
+        except Exception as e:
+            print(f"기술 스택 추출 중 오류 발생: {str(e)}")
+
+        # 중간에 실패해도 이미 기록된 결과는 반영한다
+        after = self._load_tech_skills(conn, df['job_id'])
+        changed = sum(1 for job_id, tech_skills in after.items() if before.get(job_id) != tech_skills)
+        print(f"추출 저널: {journal_summary(conn)}, 결과 변경 {changed}건")
+        if not changed:
+            return 0
+        if defer_artifacts:
+            # 전체 공고를 다시 읽는 빈도 재계산은 미뤄 둔 변경을 저장할 때 한 번만
+            self._pending_artifacts()['tech_skills'] = True
+        else:
+            self._save_common_tech_skills(conn)
+        return changed
+
+    @staticmethod
+    def _load_tech_skills(conn, job_ids):
+        """공고별 기록된 기술 스택 결과 (JSON 문자열)"""
+        return dict(select_in(conn, 'SELECT job_id, llm_extracted_tech_skills FROM jobs WHERE job_id IN ({})',
+                              [int(job_id) for job_id in job_ids]))
+
+    def _save_common_tech_skills(self, conn):
+        """기술 스택 빈도 재계산 및 저장"""
+        try:
+            print("\n기술 스택 빈도 재계산 중...")
+            cursor = conn.cursor()
+            cursor.execute('SELECT llm_extracted_tech_skills FROM jobs')
+            all_tech_skills = []
+            for (tech_skills_json,) in cursor.fetchall():
+                if tech_skills_json:  # NULL이 아닌 경우만 처리 (이전 실행 결과도 대표 표기로 집계)
+                    all_tech_skills.extend(
+                        self.skill_canonicalizer.canonicalize_skills(json.loads(tech_skills_json))
+                    )
+
+            tech_skill_counter = Counter(all_tech_skills)
+            common_tech_skills = [skill for skill, count in tech_skill_counter.most_common(50)]
+
+            # 주요 기술 스택 목록 업데이트 (나머지 아티팩트는 현재 버전에서 이어받음)
+            previous_version = current_version(ETLConfig.ARTIFACT_DIR)
+            with ArtifactWriter(ETLConfig.ARTIFACT_DIR, ETLConfig.ARTIFACT_KEEP_VERSIONS) as writer:
+                writer.add_vocabulary('common_tech_skills', common_tech_skills)
+                version = writer.commit({'stage': 'llm_extraction'})
+            print(f"주요 기술 스택 저장: {ETLConfig.ARTIFACT_DIR}/{version}")
+            if self._warm_artifacts and self._warm_artifacts.get('version') == previous_version:
+                # 나머지 아티팩트는 이어받았으므로 캐시 객체(미뤄 둔 변경 포함)도 새 버전에서 그대로 유효
+                self._warm_artifacts['version'] = version
+
+        except Exception as e:
+            print(f"기술 스택 빈도 저장 중 오류 발생: {str(e)}")
+
+    def retry_fallback_extractions(self):
+        """폴백 결과로 기록된 공고만 다시 LLM 추출 (시도 횟수 제한과 무관)"""
         start_time = time.time()
-        print(f"CSV 파일 '{self.csv_path}'을 불러오는 중...")
-        
-        # CSV 데이터 로드
-        df = pd.read_csv(self.csv_path)
+        conn = configure_connection(sqlite3.connect(self.db_path))
+        fallback_jobs = select_fallback_job_ids(conn)
+        if not fallback_jobs:
+            print("폴백 결과로 기록된 공고가 없습니다.")
+            conn.close()
+            return
+
+        df = pd.read_sql(
+            'SELECT job_id, title, description, requirements, preferred, skills, dup_cluster_id FROM jobs', conn
+        )
+        df = df[df['job_id'].isin(fallback_jobs)]
+        print(f"폴백 결과 공고 {len(df)}개를 다시 추출합니다...")
+        changed = self._run_llm_extraction(df, conn)
+        conn.close()
+        if changed:
+            write_reload_stamp(ETLConfig.RELOAD_STAMP_PATH, artifact_version=current_version(ETLConfig.ARTIFACT_DIR))
+
+        print(f"\n재추출 완료! 총 소요 시간: {time.time() - start_time:.2f}초")
+
+    def _load_tfidf_model(self):
+        """저장된 증분 TF-IDF 모델 불러오기 (없으면 None)"""
+        warm = self._take_warm_artifact('tfidf')
+        if warm is not None:
+            return warm
+        store = ArtifactStore.open(ETLConfig.ARTIFACT_DIR)
+        if store is None or 'tfidf_term_counts' not in store:
+            return None
+        return IncrementalTfidf.load(store)
+
+    def _validate_warm_artifacts(self):
+        """캐시가 현재 아티팩트 버전의 것이 아니면(다른 실행이 새 버전을 저장) 비운다"""
+        version = current_version(ETLConfig.ARTIFACT_DIR)
+        if self._warm_artifacts.get('version') != version:
+            if self._warm_artifacts.get('pending'):
+                print("경고: 다른 실행이 아티팩트를 저장해 미뤄 둔 마이크로 배치 변경을 버립니다 "
+                      "(해당 공고는 다음 실행에서 다시 처리).")
+            self._warm_artifacts = {'version': version}
+
+    def _take_warm_artifact(self, name):
+        """직전 실행이 저장한 아티팩트 객체 (현재 버전이 그대로일 때만)
+
+        꺼낸 객체는 이번 실행에서 갱신되므로 캐시에서 빼고, 아티팩트 저장에 성공하면 다시 넣는다.
+        """
+        self._validate_warm_artifacts()
+        return self._warm_artifacts.pop(name, None)
+
+    def _keep_warm_artifact(self, name, artifact):
+        """현재 아티팩트 버전 기준으로 갱신한 객체를 캐시에 넣는다"""
+        self._validate_warm_artifacts()
+        self._warm_artifacts[name] = artifact
+
+    def _pending_artifacts(self):
+        """flush_artifacts()까지 미룬 변경 (갱신한 아티팩트 이름, 주요 스킬 목록, 단계 상태 기록, 실행 번호)"""
+        self._validate_warm_artifacts()
+        return self._warm_artifacts.setdefault('pending', {
+            'names': set(), 'common_skills': None, 'statements': [], 'tech_skills': False, 'run_id': None,
+            'since': time.time()
+        })
+
+    def _defer_artifacts(self, tfidf_model=None, common_skills=None, dedup_index=None, embeddings=None):
+        """갱신한 아티팩트 객체를 캐시에 두고 저장은 flush_artifacts()로 미룬다"""
+        pending = self._pending_artifacts()
+        for name, artifact in (('tfidf', tfidf_model), ('dedup', dedup_index), ('embeddings', embeddings)):
+            if artifact is not None:
+                self._warm_artifacts[name] = artifact
+                pending['names'].add(name)
+        if common_skills is not None:
+            pending['common_skills'] = common_skills
+
+    def flush_artifacts(self):
+        """미뤄 둔 아티팩트 저장 → 단계 상태 기록 → 리로드 스탬프 교체
+
+        process_data(defer_artifacts=True)로 처리한 마이크로 배치들을 아티팩트 버전 하나로 묶어 저장한다.
+
+        Returns:
+            저장한 아티팩트 버전 (미뤄 둔 변경이 없으면 None)
+        """
+        self._validate_warm_artifacts()
+        pending = self._warm_artifacts.pop('pending', None)
+        if pending is None:
+            return None
+        artifacts = {name: self._warm_artifacts.get(name) for name in pending['names']}
+        if any(artifact is None for artifact in artifacts.values()):
+            # 실패한 배치가 꺼낸 객체를 돌려놓지 못함 (저장된 버전부터 다시 처리해야 한다)
+            self._warm_artifacts = {}
+            raise RuntimeError("미뤄 둔 아티팩트 객체가 없어 저장할 수 없습니다: "
+                               + ', '.join(name for name, artifact in artifacts.items() if artifact is None))
+        try:
+            if artifacts or pending['common_skills'] is not None:
+                self._save_artifacts(artifacts.get('tfidf'), pending['common_skills'],
+                                     artifacts.get('dedup'), artifacts.get('embeddings'))
+            conn = configure_connection(sqlite3.connect(self.db_path))
+            try:
+                with BatchWriter(conn, batch_size=ETLConfig.DB_WRITE_BATCH_SIZE) as writer:
+                    for sql, params in pending['statements']:
+                        writer.add(sql, params)
+                if pending['tech_skills']:
+                    self._save_common_tech_skills(conn)
+            finally:
+                conn.close()
+        except Exception:
+            # 다음 flush에서 다시 시도
+            self._warm_artifacts['pending'] = pending
+            raise
+        version = current_version(ETLConfig.ARTIFACT_DIR)
+        write_reload_stamp(ETLConfig.RELOAD_STAMP_PATH, run_id=pending['run_id'], artifact_version=version)
+        print(f"미뤄 둔 변경 저장: 아티팩트 {', '.join(sorted(artifacts)) or '-'}, "
+              f"단계 상태 {len(pending['statements'])}건 ({time.time() - pending['since']:.1f}초 동안 누적)")
+        return version
+
+    def discard_artifacts(self):
+        """미뤄 둔 변경과 캐시를 버린다 (다음 실행은 저장된 아티팩트 버전부터 다시 갱신)"""
+        self._warm_artifacts = {}
+
+    def _update_tfidf(self, conn, df, full_refit=False, removed_job_ids=()):
+        """새/변경 공고의 TF-IDF 행만 갱신하고 삭제된 공고 행 제거 (저장된 모델이 없거나 full_refit이면 전체 구성)"""
+        model = None if full_refit else self._load_tfidf_model()
+        if model is None:
+            print("전체 코퍼스로 TF-IDF 모델을 구성합니다...")
+            model = IncrementalTfidf(ETLConfig.TFIDF_MIN_DF, ETLConfig.TFIDF_MAX_DF,
+                                     ETLConfig.TFIDF_IDF_DRIFT_THRESHOLD)
+            stored_df = pd.read_sql('SELECT job_id, tokens_str FROM jobs', conn)
+            # 이번에 다시 처리하는 공고는 새 토큰으로 대체, 삭제된 공고는 제외
+            stored_df = stored_df[~stored_df['job_id'].isin(df['job_id'])
+                                  & ~stored_df['job_id'].isin(list(removed_job_ids))]
+            job_ids = pd.concat([stored_df['job_id'], df['job_id']])
+            texts = pd.concat([stored_df['tokens_str'].fillna(''), df['tokens_str']])
+        else:
+            job_ids, texts = df['job_id'], df['tokens_str']
+
+        report = model.update(job_ids, texts, removed_job_ids)
+        print(f"TF-IDF 갱신: {IncrementalTfidf.format_report(report)}")
+        self.tfidf_model = model
+        return model
+
+    def _update_dedup(self, conn, df, full_refit=False, removed_job_ids=()):
+        """새/변경 공고의 MinHash 서명 갱신(삭제된 공고 제거) 후 유사 중복 클러스터 계산
+
+        Returns:
+            (인덱스, job_id → 클러스터 id), 비활성화 시 (None, 자기 job_id)
+        """
+        if not ETLConfig.DEDUP_ENABLED:
+            return None, {int(job_id): int(job_id) for job_id in df['job_id']}
+
+        index = None if full_refit else self._take_warm_artifact('dedup')
+        if index is None and not full_refit:
+            store = ArtifactStore.open(ETLConfig.ARTIFACT_DIR)
+            index = NearDuplicateIndex.load(store) if store is not None and 'dedup_signatures' in store else None
+        if index is not None and index.params != self._dedup_params():
+            print("중복 탐지 설정이 바뀌어 서명을 다시 계산합니다...")
+            index = None
+
+        if index is None:
+            index = NearDuplicateIndex(**self._dedup_params())
+            stored_df = pd.read_sql('SELECT job_id, cleaned_text FROM jobs', conn)
+            stored_df = stored_df[~stored_df['job_id'].isin(df['job_id'])
+                                  & ~stored_df['job_id'].isin(list(removed_job_ids))]
+            job_ids = pd.concat([stored_df['job_id'], df['job_id']])
+            texts = pd.concat([stored_df['cleaned_text'].fillna(''), df['cleaned_text']])
+        else:
+            job_ids, texts = df['job_id'], df['cleaned_text']
+
+        index.update(job_ids, texts, removed_job_ids)
+        clusters = index.clusters()
+        print(f"유사 중복 공고: {NearDuplicateIndex.cluster_summary(clusters)}")
+        return index, clusters
+
+    @staticmethod
+    def _dedup_params():
+        return {'num_perm': ETLConfig.DEDUP_NUM_PERM, 'bands': ETLConfig.DEDUP_BANDS,
+                'shingle_size': ETLConfig.DEDUP_SHINGLE_SIZE, 'threshold': ETLConfig.DEDUP_THRESHOLD,
+                'seed': ETLConfig.DEDUP_SEED}
+
+    def _update_embeddings(self, df, changed_mask, removed_job_ids=()):
+        """대표 공고 중 입력이 바뀌었거나 벡터가 없는 공고만 배치 인코딩하고 삭제된 공고 벡터 제거
+
+        Returns:
+            (갱신된 JobEmbeddings 또는 None, 인코딩한 공고 수)
+        """
+        embeddings = self._take_warm_artifact('embeddings')
+        if embeddings is None:
+            store = ArtifactStore.open(ETLConfig.ARTIFACT_DIR)
+            embeddings = JobEmbeddings.load(store, mmap=False) if store is not None else None
+        if embeddings is not None and (embeddings.model_name, embeddings.backend) != (
+                ETLConfig.EMBEDDING_MODEL, ETLConfig.EMBEDDING_BACKEND):
+            print(f"임베딩 모델/백엔드가 바뀌어 전체 공고를 다시 인코딩합니다: "
+                  f"{embeddings.model_name} ({embeddings.backend}) -> "
+                  f"{ETLConfig.EMBEDDING_MODEL} ({ETLConfig.EMBEDDING_BACKEND})")
+            embeddings = None
+        removed = embeddings.remove(removed_job_ids) if embeddings is not None else 0
+
+        # 유사 중복 공고는 대표 공고 벡터를 쓴다
+        targets = (df['job_id'] == df['dup_cluster_id']).to_numpy()
+        if embeddings is not None:
+            targets = targets & (changed_mask | (embeddings.rows_for(df['job_id']) < 0))
+        if not targets.any():
+            if embeddings is not None and not removed:
+                # 바뀌지 않은 객체는 캐시로 돌려놓는다 (저장을 미룬 변경이 있을 수 있다)
+                self._keep_warm_artifact('embeddings', embeddings)
+            return (embeddings if removed else None), 0
+
+        changed = df[targets]
+        texts = [embedding_text(description, requirements)
+                 for description, requirements in zip(changed['description'], changed['requirements'])]
+        unique_count = len(set(texts))
+        print(f"임베딩 인코딩: {len(texts)}개 공고 (고유 텍스트 {unique_count}개, "
+              f"배치 토큰 {ETLConfig.EMBEDDING_TOKEN_BUDGET}, 최대 {ETLConfig.EMBEDDING_BATCH_SIZE}개)")
+        if ETLConfig.EMBEDDING_WORKERS > 1 and unique_count >= ETLConfig.EMBEDDING_PARALLEL_MIN_TEXTS:
+            if self._embedding_pool is None:
+                print(f"임베딩 프로세스 풀 시작: 워커 {ETLConfig.EMBEDDING_WORKERS}개")
+                self._embedding_pool = EncoderPool(ETLConfig.EMBEDDING_MODEL, ETLConfig.EMBEDDING_WORKERS,
+                                                   ETLConfig.EMBEDDING_BACKEND)
+            vectors = self._embedding_pool.encode(texts, ETLConfig.EMBEDDING_TOKEN_BUDGET,
+                                                  ETLConfig.EMBEDDING_BATCH_SIZE)
+        else:
+            if self._embedding_encoder is None:
+                print(f"임베딩 모델 로드: {ETLConfig.EMBEDDING_MODEL} ({ETLConfig.EMBEDDING_BACKEND})")
+                self._embedding_encoder = load_encoder(ETLConfig.EMBEDDING_MODEL, ETLConfig.EMBEDDING_BACKEND)
+            vectors = encode_corpus(self._embedding_encoder, texts, ETLConfig.EMBEDDING_TOKEN_BUDGET,
+                                    ETLConfig.EMBEDDING_BATCH_SIZE, show_progress_bar=True)
+
+        if embeddings is None:
+            embeddings = JobEmbeddings(ETLConfig.EMBEDDING_MODEL, vectors.shape[1],
+                                       backend=ETLConfig.EMBEDDING_BACKEND)
+        embeddings.update(changed['job_id'], vectors)
+        return embeddings, len(texts)
+
+    def _save_artifacts(self, tfidf_model=None, common_skills=None, dedup_index=None, embeddings=None):
+        """TF-IDF 모델/벡터, 중복 탐지 서명, 임베딩, 주요 스킬 목록을 새 아티팩트 버전으로 저장
+
+        주어지지 않은 아티팩트는 현재 버전에서 이어받는다.
+        """
+        # 이번에 갱신하지 않은 캐시 객체는 이어받은 아티팩트와 같다
+        carried = {}
+        if self._warm_artifacts.get('version') == current_version(ETLConfig.ARTIFACT_DIR):
+            carried = {name: artifact for name, artifact in self._warm_artifacts.items() if name != 'version'}
+        with ArtifactWriter(ETLConfig.ARTIFACT_DIR, ETLConfig.ARTIFACT_KEEP_VERSIONS) as writer:
+            if tfidf_model is not None:
+                tfidf_model.save(writer)
+            if dedup_index is not None:
+                dedup_index.save(writer)
+            if embeddings is not None:
+                embeddings.save(writer)
+            if common_skills is not None:
+                writer.add_vocabulary('common_skills', common_skills)
+            version = writer.commit({'stage': 'process_data'})
+        print(f"모델 아티팩트 저장: {ETLConfig.ARTIFACT_DIR}/{version}")
+        updated = {'tfidf': tfidf_model, 'dedup': dedup_index, 'embeddings': embeddings}
+        self._warm_artifacts = {**carried, **{name: artifact for name, artifact in updated.items()
+                                              if artifact is not None}, 'version': version}
+
+    def _corpus_skill_counts(self, conn, df, stored, deleted_ids, scoped):
+        """저장 공고 전체(이번 입력 반영, 삭제 공고 제외)의 스킬 빈도
+
+        마이크로 배치는 캐시된 직전 빈도에서 입력 공고의 이전 스킬을 빼고 새 스킬을 더한다.
+        """
+        counts = self._take_warm_artifact('skill_counts') if scoped else None
+        if counts is None:
+            if scoped:
+                stored = pd.read_sql('SELECT job_id, skills FROM jobs', conn).set_index('job_id')
+            # 입력에 없는 저장 공고(마이크로 배치, 삭제 보류)도 집계에 포함
+            outside = stored.loc[~stored.index.isin(df['job_id']) & ~stored.index.isin(deleted_ids), 'skills']
+            return Counter(skill for skills_json in pd.concat([outside.dropna(), df['skills']])
+                           for skill in json.loads(skills_json))
+        counts.subtract(skill for skills_json in stored['skills'].dropna() for skill in json.loads(skills_json))
+        counts.update(skill for skills_json in df['skills'] for skill in json.loads(skills_json))
+        return +counts
+
+    def _update_cluster_ids(self, conn, clusters):
+        """저장된 값과 다른 dup_cluster_id만 갱신
+
+        직전 실행의 클러스터가 캐시에 있으면 그 사이에 바뀐 공고의 저장 값만 읽는다.
+        """
+        previous = self._take_warm_artifact('clusters')
+        if previous is None:
+            stored = dict(conn.execute('SELECT job_id, dup_cluster_id FROM jobs').fetchall())
+        else:
+            candidates = [job_id for job_id, cluster_id in clusters.items() if previous.get(job_id) != cluster_id]
+            stored = dict(select_in(conn, 'SELECT job_id, dup_cluster_id FROM jobs WHERE job_id IN ({})',
+                                    candidates))
+        changed = [(cluster_id, job_id) for job_id, cluster_id in clusters.items()
+                   if job_id in stored and stored[job_id] != cluster_id]
+        with BatchWriter(conn, batch_size=ETLConfig.DB_WRITE_BATCH_SIZE) as writer:
+            writer.add_many(UPDATE_DUP_CLUSTER_SQL, changed)
+        self._keep_warm_artifact('clusters', dict(clusters))
+
+    @staticmethod
+    def _deleted_job_ids(stored_job_ids, current_job_ids, delete_missing=True):
+        """DB에는 있고 CSV에서 빠진 공고 (삭제 비율이 한도를 넘으면 CSV 누락으로 보고 삭제하지 않음)"""
+        if not delete_missing:
+            return []
+        deleted = sorted(set(int(job_id) for job_id in stored_job_ids) - set(int(job_id) for job_id in current_job_ids))
+        if deleted and len(deleted) > ETLConfig.DELETE_MAX_FRACTION * len(stored_job_ids):
+            print(f"경고: 저장된 공고 {len(stored_job_ids)}개 중 {len(deleted)}개가 CSV에 없습니다. "
+                  f"CSV가 일부만 있는 것으로 보고 삭제하지 않습니다 "
+                  f"(ETLConfig.DELETE_MAX_FRACTION={ETLConfig.DELETE_MAX_FRACTION}).")
+            return []
+        return deleted
+
+    def _stage_versions(self):
+        """단계 버전 (바뀌면 해당 단계를 전체 공고에 다시 적용)"""
+        return {
+            'clean': 1,
+            'tokenize': content_hash(2, TECH_KEYWORDS, sorted(STOPWORDS), sorted(SKILL_ALIASES.items()),
+                                     sorted(VERSIONED_SKILLS.items())),
+            'dedup': content_hash(ETLConfig.DEDUP_ENABLED, sorted(self._dedup_params().items())),
+            'tfidf': 1,
+            'embed': content_hash(ETLConfig.EMBEDDING_MODEL),
+            'store': 1,
+            'llm': content_hash(self.LLM_PROMPT_VERSION, ETLConfig.LLM_MODEL, ETLConfig.LLM_TEMPERATURE),
+        }
+
+    def process_data(self, full_refit=False, force_stages=(), report_path=None, postings=None,
+                     delete_missing=None, defer_artifacts=False):
+        """CSV 데이터 전처리 및 SQLite에 저장
+
+        공고 원문 해시(content_hash)로 신규/변경/삭제/동일 공고를 나누고,
+        단계(clean → tokenize → dedup → tfidf → embed → store → llm)마다 입력 해시가 바뀐 공고만 처리하고,
+        나머지는 DB에 저장된 결과를 쓴다. CSV에서 빠진 공고는 DB/단계 상태/TF-IDF/중복 탐지/임베딩에서 제거한다.
+
+        Args:
+            full_refit: True면 저장된 TF-IDF 모델/중복 탐지 서명을 버리고 전체 코퍼스로 다시 구성
+            force_stages: 입력 해시와 무관하게 전체 공고에 다시 실행할 단계 이름
+            report_path: 실행 리포트(JSON) 경로 (None이면 ETLConfig.RUN_REPORT_DIR/run_<실행 번호>.json)
+            postings: CSV 대신 처리할 공고 DataFrame (연속 수집 데몬의 마이크로 배치)
+            delete_missing: 입력에 없는 저장 공고 삭제 여부 (None이면 ETLConfig.DELETE_MISSING_POSTINGS,
+                마이크로 배치처럼 일부 공고만 넘길 때는 False, 이때 DB/단계 상태는 입력 공고 행만 읽는다)
+            defer_artifacts: True면 아티팩트 저장과 중복 탐지/TF-IDF/임베딩 단계 상태 기록을
+                flush_artifacts()까지 미룬다 (연속 수집 데몬이 배치마다 전체 아티팩트를 다시 쓰지 않도록)
+
+        Returns:
+            실행 리포트 딕셔너리
+        """
+        start_time = time.time()
+        if not defer_artifacts:
+            # 미뤄 둔 마이크로 배치 변경을 먼저 저장
+            self.flush_artifacts()
+        if postings is None:
+            print(f"CSV 파일 '{self.csv_path}'을 불러오는 중...")
+            
+            # CSV 데이터 로드
+            df = pd.read_csv(self.csv_path)
+        else:
+            print(f"마이크로 배치 공고 {len(postings)}건을 처리합니다...")
+            df = postings.copy()
+        if delete_missing is None:
+            delete_missing = ETLConfig.DELETE_MISSING_POSTINGS
         
         # 필요한 칼럼만 선택
         df = df[['job_id', 'title', 'company', 'location', 'experience', 'description', 'requirements', 'preferred', 'job_type']]
@@ -571,166 +1294,262 @@ class JobDataProcessor:
         if duplicate_count > 0:
             print(f"중복된 job_id {duplicate_count}개를 제거합니다...")
             df = df.drop_duplicates(subset=['job_id'])
+        df = df.reset_index(drop=True)
         
-        # 기존 DB에서 데이터 로드
-        conn = sqlite3.connect(self.db_path)
-        existing_df = pd.read_sql('SELECT job_id, llm_extracted_tech_skills FROM jobs', conn)
-        
-        # llm_extracted_tech_skills가 NULL인 job_id만 필터링
-        if not existing_df.empty:
-            null_skills_jobs = existing_df[existing_df['llm_extracted_tech_skills'].isnull()]['job_id'].tolist()
-            new_jobs = set(df['job_id']) - set(existing_df['job_id'])
-            jobs_to_process = list(new_jobs) + null_skills_jobs
-            df = df[df['job_id'].isin(jobs_to_process)]
-        
-        if df.empty:
-            print("처리할 새로운 데이터가 없습니다.")
-            conn.close()
-            return
-        
-        print(f"총 {len(df)} 개의 직무 공고를 처리합니다...")
-        
-        # 데이터 전처리
-        print("텍스트 정제 중...")
-        df['cleaned_text'] = df.apply(
-            lambda row: self._clean_text(f"{row['description']} {row['requirements']} {row['preferred']}"), 
-            axis=1
-        )
-        
-        print("텍스트 토큰화 중...")
-        tqdm.pandas(desc="토큰화 진행률")
-        df['tokenized'] = df['cleaned_text'].progress_apply(self.tokenize_mixed_skills)
-        df['tokens_str'] = df['tokenized'].apply(lambda x: ' '.join(x))
-        
-        # skills 컬럼 저장 직전에, 결과 미리 보기
-        for i in range(min(5, len(df))):
-            print(f"\n==== {i+1}번째 row ====")
-            print("cleaned_text:", df['cleaned_text'].iloc[i])
-            print("tokenized   :", df['tokenized'].iloc[i])
-            # (아직 df['skills'] 저장 전이니, tokenized만 우선 봅니다)
-
-
-        print("스킬 추출 중...")
-        df['skills'] = df['tokenized'].apply(lambda x: json.dumps(x, ensure_ascii=False))
-
-        
-        print("경력 연차 추출 중...")
-        df['years'] = df['experience'].apply(self._extract_years)
-        
-        # TF-IDF 벡터화를 위한 전체 데이터 로드
-        all_jobs_df = pd.read_sql('SELECT tokens_str FROM jobs', conn)
-        combined_tokens = pd.concat([all_jobs_df['tokens_str'], df['tokens_str']])
-        
-        # TF-IDF 벡터화
-        print("TF-IDF 벡터화 중...")
-        job_vectors = self.tfidf_vectorizer.fit_transform(combined_tokens)
+        # 기존 DB에서 단계 출력 로드 (입력이 바뀌지 않은 공고는 그대로 사용)
+        # 삭제 판정이 없는 실행(마이크로 배치)은 입력 공고 행만 읽는다
+        conn = configure_connection(sqlite3.connect(self.db_path))
+        scoped = postings is not None and not delete_missing
+        job_ids = df['job_id'].tolist()
+        stored_columns = ['job_id', 'years', 'cleaned_text', 'tokens_str', 'skills', 'dup_cluster_id',
+                          'llm_extracted_tech_skills', 'content_hash']
+        if scoped:
+            stored = pd.DataFrame(
+                select_in(conn, f"SELECT {', '.join(stored_columns)} FROM jobs WHERE job_id IN ({{}})", job_ids),
+                columns=stored_columns
+            ).set_index('job_id')
+        else:
+            stored = pd.read_sql(f"SELECT {', '.join(stored_columns)} FROM jobs", conn).set_index('job_id')
+        stored_rows = df['job_id'].map(lambda job_id: job_id in stored.index).to_numpy()
+        missing = ~stored_rows
         
-        # 스킬 빈도 추출
-        print("스킬 빈도 계산 중...")
-        all_skills = []
-        for skills_json in df['skills']:
-            all_skills.extend(json.loads(skills_json))
+        # 수집 변경 판정 (원문 해시 기준 신규/변경/삭제/동일)
+        df['content_hash'] = [content_hash(*values) for values in zip(*(df[column] for column in SOURCE_COLUMNS))]
+        stored_hash = stored['content_hash'].reindex(df['job_id']).to_numpy()
+        hashed = stored_rows & pd.notna(stored_hash)
+        deleted_ids = self._deleted_job_ids(stored.index, df['job_id'], delete_missing)
+        ingest = {
+            'new': int(missing.sum()),
+            'changed': int((hashed & (stored_hash != df['content_hash'].to_numpy())).sum()),
+            'deleted': len(deleted_ids),
+            'unchanged': int((hashed & (stored_hash == df['content_hash'].to_numpy())).sum()),
+            # 원문 해시가 없던 이전 버전 DB 행 (단계 입력 해시로 판정)
+            'unhashed': int((stored_rows & ~hashed).sum()),
+        }
+        print("수집 변경: 신규 {new}, 변경 {changed}, 삭제 {deleted}, 동일 {unchanged}".format(**ingest)
+              + (f", 원문 해시 없음 {ingest['unhashed']}" if ingest['unhashed'] else ""))
         
-        skill_counter = Counter(all_skills)
-        common_skills = [skill for skill, count in skill_counter.most_common(100)]
+        force_stages = set(force_stages) | ({'dedup', 'tfidf'} if full_refit else set())
+        run = PipelineRun(conn, self._stage_versions(), force_stages, scope=job_ids if scoped else None)
+        total = len(df)
+        print(f"총 {total} 개의 직무 공고를 확인합니다... (실행 #{run.run_id})")
         
-        # SQLite에 데이터 저장 (UPSERT)
-        print("SQLite 데이터베이스에 저장 중...")
+        def from_stored(column, mask):
+            """처리하지 않은 공고는 저장된 값 사용"""
+            if mask.all():
+                return
+            df.loc[~mask, column] = stored.loc[df.loc[~mask, 'job_id'], column].to_numpy()
         
-        # 직무 데이터 저장 (UPSERT)
-        for _, row in df.iterrows():
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO jobs 
-                (job_id, title, company, location, experience, years, description, 
-                requirements, preferred, job_type, cleaned_text, tokens_str, skills)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                row['job_id'], row['title'], row['company'], row['location'],
-                row['experience'], row['years'], row['description'],
-                row['requirements'], row['preferred'], row['job_type'],
-                row['cleaned_text'], row['tokens_str'], row['skills']
-            ))
-        
-        # 모델 데이터 저장
-        cursor = conn.cursor()
+        # 1. 정제 (원문 → cleaned_text, years)
+        with run.stage('clean', total) as entry:
+            clean_hashes = run.hashes('clean', [df['description'], df['requirements'],
+                                                df['preferred'], df['experience']])
+            clean_mask = run.changed('clean', job_ids, clean_hashes, missing)
+            df['cleaned_text'] = None
+            df['years'] = 0
+            from_stored('cleaned_text', clean_mask)
+            from_stored('years', clean_mask)
+            if clean_mask.any():
+                print("텍스트 정제 / 경력 연차 추출 중...")
+                changed = df[clean_mask]
+                df.loc[clean_mask, 'cleaned_text'] = clean_texts(
+                    combined_posting_text(changed), ETLConfig.TEXT_NORMALIZATION_WORKERS,
+                    ETLConfig.TEXT_NORMALIZATION_CHUNK_SIZE).to_numpy()
+                df.loc[clean_mask, 'years'] = extract_years_column(changed['experience']).to_numpy()
+            df['years'] = df['years'].astype(int)
+            entry['processed'] = int(clean_mask.sum())
         
-        # TF-IDF 벡터라이저 저장
-        vectorizer_pickle = pickle.dumps(self.tfidf_vectorizer)
-        cursor.execute('INSERT OR REPLACE INTO model_data (name, data) VALUES (?, ?)', 
-                       ('tfidf_vectorizer', vectorizer_pickle))
+        # 2. 토큰화 (cleaned_text → tokens_str, skills)
+        with run.stage('tokenize', total) as entry:
+            tokenize_hashes = run.hashes('tokenize', [df['cleaned_text']])
+            tokenize_mask = run.changed('tokenize', job_ids, tokenize_hashes, missing)
+            df['tokens_str'] = None
+            df['skills'] = None
+            from_stored('tokens_str', tokenize_mask)
+            from_stored('skills', tokenize_mask)
+            if tokenize_mask.any():
+                print("텍스트 토큰화 중...")
+                tqdm.pandas(desc="토큰화 진행률")
+                tokenized = df.loc[tokenize_mask, 'cleaned_text'].progress_apply(self.tokenize_mixed_skills)
+                df.loc[tokenize_mask, 'tokens_str'] = tokenized.apply(lambda x: ' '.join(x)).to_numpy()
+                df.loc[tokenize_mask, 'skills'] = tokenized.apply(
+                    lambda x: json.dumps(x, ensure_ascii=False)
+                ).to_numpy()
+                
+                # 결과 미리 보기
+                for i in range(min(5, len(tokenized))):
+                    print(f"\n==== {i+1}번째 row ====")
+                    print("cleaned_text:", df.loc[tokenized.index[i], 'cleaned_text'])
+                    print("tokenized   :", tokenized.iloc[i])
+            entry['processed'] = int(tokenize_mask.sum())
         
-        # 직무 벡터 저장
-        vectors_pickle = pickle.dumps(job_vectors)
-        cursor.execute('INSERT OR REPLACE INTO model_data (name, data) VALUES (?, ?)', 
-                       ('job_vectors', vectors_pickle))
+        # 3. 유사 중복 공고 클러스터링 (MinHash LSH)
+        with run.stage('dedup', total) as entry:
+            dedup_hashes = run.hashes('dedup', [df['cleaned_text']])
+            dedup_mask = run.changed('dedup', job_ids, dedup_hashes, missing)
+            dedup_index = None
+            if dedup_mask.any() or deleted_ids:
+                print("유사 중복 공고 탐지 중...")
+                dedup_index, clusters = self._update_dedup(conn, df[dedup_mask], full_refit, deleted_ids)
+                df['dup_cluster_id'] = df['job_id'].map(clusters).fillna(df['job_id']).astype(int)
+            else:
+                clusters = {}
+                df['dup_cluster_id'] = stored.loc[df['job_id'], 'dup_cluster_id'].astype(int).to_numpy()
+            entry['processed'] = int(dedup_mask.sum())
         
-        # 주요 스킬 목록 저장
-        skills_pickle = pickle.dumps(common_skills)
-        cursor.execute('INSERT OR REPLACE INTO model_data (name, data) VALUES (?, ?)', 
-                       ('common_skills', skills_pickle))
+        # 4. TF-IDF 벡터화 (tokens_str가 바뀐 공고 행만 갱신)
+        with run.stage('tfidf', total) as entry:
+            tfidf_hashes = run.hashes('tfidf', [df['tokens_str']])
+            tfidf_mask = run.changed('tfidf', job_ids, tfidf_hashes, missing)
+            tfidf_model = None
+            if tfidf_mask.any() or deleted_ids:
+                print("TF-IDF 벡터화 중...")
+                tfidf_model = self._update_tfidf(conn, df[tfidf_mask], full_refit, deleted_ids)
+            entry['processed'] = int(tfidf_mask.sum())
         
-        # 피처 이름 저장
-        feature_names = self.tfidf_vectorizer.get_feature_names_out()
-        feature_names_pickle = pickle.dumps(feature_names)
-        cursor.execute('INSERT OR REPLACE INTO model_data (name, data) VALUES (?, ?)', 
-                       ('feature_names', feature_names_pickle))
+        # 5. 임베딩 (대표 공고 중 description/requirements가 바뀐 공고만 배치 인코딩)
+        with run.stage('embed', total) as entry:
+            embed_hashes = run.hashes('embed', [df['description'], df['requirements']])
+            embed_mask = run.changed('embed', job_ids, embed_hashes, missing)
+            embeddings = None
+            if ETLConfig.EMBEDDING_ENABLED:
+                embeddings, entry['processed'] = self._update_embeddings(df, embed_mask, deleted_ids)
+            else:
+                # 비활성화 상태에서는 기록하지 않아 다시 켜면 전체 공고를 인코딩한다
+                embed_mask[:] = False
         
-        conn.commit()
+        # 6. 모델 아티팩트 저장 (TF-IDF 모델/벡터, 중복 탐지 서명, 임베딩, 주요 스킬 목록)
+        with run.stage('artifacts', 1) as entry:
+            if (tfidf_model is not None or dedup_index is not None or embeddings is not None
+                    or tokenize_mask.any() or deleted_ids):
+                print("스킬 빈도 계산 중...")
+                skill_counts = self._corpus_skill_counts(conn, df, stored, deleted_ids, scoped)
+                # 빈도가 같으면 스킬 이름 순 (증분/전체 집계 결과가 같도록)
+                common_skills = [skill for skill, count in
+                                 sorted(skill_counts.items(), key=lambda item: (-item[1], item[0]))[:100]]
+                if defer_artifacts:
+                    self._defer_artifacts(tfidf_model, common_skills, dedup_index, embeddings)
+                else:
+                    self._save_artifacts(tfidf_model, common_skills, dedup_index, embeddings)
+                entry['processed'] = 1
         
-        end_time = time.time()
-        print(f"기본 전처리 및 저장 완료! 소요 시간: {end_time - start_time:.2f}초")
+        # 7. SQLite 저장 (UPSERT), 삭제된 공고 제거 및 단계 상태 기록 (같은 배치 트랜잭션)
+        #    아티팩트를 먼저 저장하므로 중간에 중단되면 다음 실행에서 같은 공고를 다시 삭제 대상으로 판정한다
+        with run.stage('store', total) as entry:
+            store_hashes = run.hashes('store', [df[column] for column in UPSERT_JOB_COLUMNS[1:]])
+            store_mask = run.changed('store', job_ids, store_hashes, missing)
+            if store_mask.any():
+                print("SQLite 데이터베이스에 저장 중...")
+            with BatchWriter(conn, batch_size=ETLConfig.DB_WRITE_BATCH_SIZE) as writer:
+                if deleted_ids:
+                    print(f"CSV에서 빠진 공고 {len(deleted_ids)}개를 삭제합니다...")
+                    writer.add_many(DELETE_JOB_SQL, ((job_id,) for job_id in deleted_ids))
+                    delete_entries(writer, deleted_ids)
+                    run.forget(writer, deleted_ids)
+                writer.add_many(
+                    UPSERT_JOB_SQL,
+                    df.loc[store_mask, UPSERT_JOB_COLUMNS].astype(object).itertuples(index=False, name=None)
+                )
+                for stage, mask, hashes in (('clean', clean_mask, clean_hashes),
+                                            ('tokenize', tokenize_mask, tokenize_hashes),
+                                            ('dedup', dedup_mask, dedup_hashes),
+                                            ('tfidf', tfidf_mask, tfidf_hashes),
+                                            ('embed', embed_mask, embed_hashes),
+                                            ('store', store_mask, store_hashes)):
+                    if defer_artifacts and stage in ('dedup', 'tfidf', 'embed'):
+                        # 아티팩트에 반영된 뒤에 기록 (저장 전에 중단되면 다음 실행에서 다시 처리)
+                        self._pending_artifacts()['statements'].extend(
+                            run.statement(stage, job_id, input_hash)
+                            for job_id, input_hash in zip(df.loc[mask, 'job_id'], np.asarray(hashes)[mask]))
+                        continue
+                    run.record(writer, stage, df.loc[mask, 'job_id'], np.asarray(hashes)[mask])
+            if clusters:
+                # 새 공고와 묶이면서 대표가 바뀐 CSV 밖 공고의 클러스터 id 갱신
+                self._update_cluster_ids(conn, clusters)
+            if run.report['artifacts']['processed']:
+                self._keep_warm_artifact('skill_counts', skill_counts)
+            print(f"직무 데이터 저장: {writer.summary()}")
+            entry['processed'] = int(store_mask.sum())
         
-        # LLM으로 기술 스택 추출 및 업데이트
-        if self.cerebras_api_key:
-            print("\nLLM을 사용하여 기술 스택 추출을 시작합니다...")
+        # 8. LLM 기술 스택 추출 (입력이 바뀐 공고 + 결과 없는 공고 + 저널 기준 미완료/폴백 공고)
+        with run.stage('llm', total) as entry:
+            is_representative = (df['job_id'] == df['dup_cluster_id']).to_numpy()
+            representative_hashes = self._representative_llm_hashes(conn, run, df, is_representative)
+            df['llm_input_hash'] = self._llm_input_hashes(run, df, representative_hashes)
+            llm_mask = run.changed('llm', job_ids, df['llm_input_hash'])
+            stored_llm = stored['llm_extracted_tech_skills'].reindex(df['job_id']).to_numpy()
+            has_result = pd.notna(stored_llm) & stored_rows
+            resumable = df['job_id'].isin(select_resumable_job_ids(conn, ETLConfig.EXTRACTION_MAX_ATTEMPTS))
+            # 단계 상태가 없던 이전 버전 DB: 토큰이 그대로인 기존 결과는 재추출하지 않고 상태만 기록
+            # (이전 버전은 토큰 순서가 실행마다 달랐으므로 토큰 집합으로 비교)
+            same_skills = (df['skills'].map(_skill_set).to_numpy()
+                           == stored['skills'].reindex(df['job_id']).map(_skill_set).to_numpy())
+            adopted = llm_mask & has_result & same_skills & ~resumable.to_numpy()
+            adopted &= ~df['job_id'].isin(list(run.stored_hashes('llm'))).to_numpy()
+            llm_mask = (llm_mask & ~adopted) | ~has_result | resumable.to_numpy()
+            # 다시 추출하는 대표 공고의 중복 공고(입력에 없는 공고 포함)도 새 결과로 함께 갱신
+            representatives = df.loc[llm_mask & is_representative, 'job_id'].tolist()
+            llm_mask |= ~is_representative & df['dup_cluster_id'].isin(representatives).to_numpy()
+            llm_df = df[llm_mask]
+            outside_duplicates = self._load_duplicates(conn, representatives, job_ids)
+            if len(outside_duplicates):
+                outside_duplicates['llm_input_hash'] = self._llm_input_hashes(run, outside_duplicates,
+                                                                              representative_hashes)
+                llm_df = pd.concat([llm_df, outside_duplicates], ignore_index=True)
+            with BatchWriter(conn, batch_size=ETLConfig.DB_WRITE_BATCH_SIZE) as writer:
+                run.record(writer, 'llm', df.loc[adopted, 'job_id'], df.loc[adopted, 'llm_input_hash'])
+                mark_pending(writer, llm_df['job_id'].tolist())
             
-            try:
-                # 전체 데이터셋 한번에 처리
-                print(f"총 {len(df)}개의 데이터를 처리합니다.")
-                processed_df = asyncio.run(self.extract_tech_skills_batch(df))
-                
-                # 처리된 결과를 DB에 업데이트
-                for _, row in processed_df.iterrows():
-                    cursor.execute(
-                        'UPDATE jobs SET llm_extracted_tech_skills = ? WHERE job_id = ?',
-                        (row['llm_extracted_tech_skills'], row['job_id'])
-                    )
-                conn.commit()
-                
-                # 기술 스택 빈도 재계산 및 저장
-                print("\n기술 스택 빈도 재계산 중...")
-                cursor.execute('SELECT llm_extracted_tech_skills FROM jobs')
-                all_tech_skills = []
-                for (tech_skills_json,) in cursor.fetchall():
-                    if tech_skills_json:  # NULL이 아닌 경우만 처리
-                        all_tech_skills.extend(json.loads(tech_skills_json))
-                
-                tech_skill_counter = Counter(all_tech_skills)
-                common_tech_skills = [skill for skill, count in tech_skill_counter.most_common(50)]
-                
-                # 주요 기술 스택 목록 업데이트
-                tech_skills_pickle = pickle.dumps(common_tech_skills)
-                cursor.execute('INSERT OR REPLACE INTO model_data (name, data) VALUES (?, ?)', 
-                               ('common_tech_skills', tech_skills_pickle))
-                
-                conn.commit()
-                
-            except Exception as e:
-                print(f"기술 스택 추출 중 오류 발생: {str(e)}")
-        else:
-            print("\nCEREBRAS_API_KEY가 없어 기술 스택 추출을 건너뜁니다.")
-
+            llm_changed = self._run_llm_extraction(llm_df, conn, run, defer_artifacts) if len(llm_df) else 0
+            entry['processed'] = len(llm_df)
         
         conn.close()
         
+        print(f"\n단계별 처리 현황 (실행 #{run.run_id}):\n{run.summary()}")
+        # 재시도한 추출 결과가 그대로면 다시 불러올 필요가 없다 (LLM 단계는 처리 건수가 아니라 결과 변경 기준)
+        if deleted_ids or llm_changed or any(run.report[stage]['processed'] for stage in ('artifacts', 'store')):
+            if defer_artifacts:
+                # 아티팩트를 저장하는 flush_artifacts()에서 알림
+                self._pending_artifacts()['run_id'] = run.run_id
+            else:
+                # DB/아티팩트가 바뀌었으므로 실행 중인 앱에 다시 불러오라고 알림
+                write_reload_stamp(ETLConfig.RELOAD_STAMP_PATH, run_id=run.run_id,
+                                   artifact_version=current_version(ETLConfig.ARTIFACT_DIR))
         total_end_time = time.time()
         print(f"\n전체 작업 완료! 총 소요 시간: {total_end_time - start_time:.2f}초")
+        
+        # LLM 단계를 건너뛴 실행은 LLM/리미터 통계가 비어 있다
+        llm_ran = run.report['llm']['processed'] > 0
+        report = build_run_report(run, total_end_time - start_time,
+                                  self.llm_stats if llm_ran else None,
+                                  self.rate_limiter if llm_ran else None, ingest)
+        if report_path is None:
+            report_path = os.path.join(ETLConfig.RUN_REPORT_DIR, f"run_{run.run_id:04d}.json")
+        print(f"실행 리포트 저장: {write_run_report(report, report_path)}")
+        return report
 
 
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="직무 공고 ETL")
+    parser.add_argument('--retry-fallback', action='store_true',
+                        help="폴백 결과로 기록된 공고만 다시 LLM 추출")
+    parser.add_argument('--full-refit', action='store_true',
+                        help="TF-IDF 모델/중복 탐지 서명을 증분 갱신하지 않고 전체 코퍼스로 다시 구성")
+    parser.add_argument('--force-stage', action='append', default=[],
+                        choices=['clean', 'tokenize', 'dedup', 'tfidf', 'embed', 'store', 'llm'],
+                        help="입력 해시와 무관하게 전체 공고에 다시 실행할 단계 (여러 번 지정 가능)")
+    parser.add_argument('--report', default=None,
+                        help="실행 리포트(JSON) 저장 경로 (기본: data/run_reports/run_<실행 번호>.json)")
+    args = parser.parse_args()
+
     processor = JobDataProcessor()
     processor.create_database()
-    processor.process_data() 
+    if args.retry_fallback:
+        processor.retry_fallback_extractions()
+    else:
+        processor.process_data(full_refit=args.full_refit, force_stages=args.force_stage,
+                               report_path=args.report)
     
@@ -0,0 +1,228 @@
+"""
+SQLite 배치 쓰기 계층
+행 단위 execute/commit 대신 버퍼에 모아 executemany로 묶어서 기록한다.
+BackgroundWriter는 같은 배치 쓰기를 전용 스레드에서 실행해 호출 측(이벤트 루프)이 커밋을 기다리지 않게 한다.
+"""
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from itertools import groupby
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+
+def configure_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """WAL 모드 설정
+
+    WAL + synchronous=FULL 조합에서는 커밋할 때마다 WAL 파일이 한 번 fsync 된다.
+    배치 단위로 커밋하므로 fsync도 배치당 한 번만 발생한다.
+    """
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=FULL')
+    return conn
+
+
+def select_in(conn: sqlite3.Connection, sql: str, values: Iterable[Any],
+              params: Sequence[Any] = (), chunk_size: int = 500) -> List[tuple]:
+    """IN (...) 조건을 값 묶음으로 나눠 조회 (sql의 {}에 자리표시자, params는 그 앞 인자)
+
+    SQLite 자리표시자 수 제한(이전 버전 기본 999) 안에서 일부 행만 인덱스로 읽는다.
+    """
+    values = list(values)
+    rows = []
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start:start + chunk_size]
+        rows.extend(conn.execute(sql.format(','.join('?' * len(chunk))), (*params, *chunk)).fetchall())
+    return rows
+
+
+class BatchWriter:
+    """executemany 기반 배치 쓰기 (배치 하나 = 트랜잭션 하나)"""
+
+    def __init__(self, conn: sqlite3.Connection, batch_size: int = 500):
+        self.conn = conn
+        self.batch_size = max(1, batch_size)
+        self._pending: List[Tuple[str, Sequence[Any]]] = []
+
+        # 처리 통계
+        self.rows_written = 0
+        self.batches_committed = 0
+        self.write_seconds = 0.0
+
+    def add(self, sql: str, params: Sequence[Any]):
+        """쓰기 요청 추가 (배치 크기에 도달하면 자동 flush)"""
+        self._pending.append((sql, params))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def add_group(self, statements: Iterable[Tuple[str, Sequence[Any]]]):
+        """같은 트랜잭션에 기록되어야 하는 쓰기 요청 묶음 추가"""
+        self._pending.extend(statements)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def add_many(self, sql: str, rows: Iterable[Sequence[Any]]):
+        """같은 SQL의 여러 행 추가"""
+        for params in rows:
+            self.add(sql, params)
+
+    def flush(self):
+        """버퍼를 하나의 트랜잭션으로 기록"""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        start = time.perf_counter()
+        # 요청 순서를 유지하면서 연속된 같은 SQL끼리 executemany로 묶는다
+        with self.conn:
+            for sql, group in groupby(pending, key=lambda item: item[0]):
+                self.conn.executemany(sql, [params for _, params in group])
+        self.write_seconds += time.perf_counter() - start
+        self.rows_written += len(pending)
+        self.batches_committed += 1
+
+    def close(self):
+        """남은 버퍼 기록"""
+        self.flush()
+
+    @property
+    def pending(self) -> int:
+        """아직 기록하지 않은 쓰기 요청 수"""
+        return len(self._pending)
+
+    @property
+    def rows_per_sec(self) -> Optional[float]:
+        """초당 기록 행 수"""
+        if self.write_seconds <= 0:
+            return None
+        return self.rows_written / self.write_seconds
+
+    def summary(self) -> str:
+        """쓰기 통계 요약 문자열"""
+        rate = self.rows_per_sec
+        rate_text = f"{rate:,.0f}행/초" if rate is not None else "-"
+        return (f"{self.rows_written}행 / {self.batches_committed}개 배치, "
+                f"{self.write_seconds:.2f}초 ({rate_text})")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class BackgroundWriter:
+    """전용 스레드에서 BatchWriter로 기록하는 쓰기 큐
+
+    add/add_group은 큐에 넣고 바로 반환한다. 쓰기 스레드는 자체 연결로 큐를 비우면서
+    배치 크기에 도달하거나 첫 미기록 요청 후 flush_interval초가 지나면 커밋한다.
+    커밋이 느려 큐가 밀리면 밀린 요청을 한 트랜잭션으로 묶으므로 커밋 수가 늘지 않는다.
+    close()는 큐에 남은 요청을 모두 기록한 뒤 스레드를 종료한다.
+    쓰기 스레드에서 난 오류는 다음 add/close 호출에서 다시 발생한다.
+    """
+
+    _STOP = object()
+
+    def __init__(self, db_path: str, batch_size: int = 500, flush_interval: float = 1.0):
+        self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.writer: Optional[BatchWriter] = None
+        self.max_queue_depth = 0
+        self._queue: queue.Queue = queue.Queue()
+        self._error: Optional[BaseException] = None
+        self._ready = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='db-writer', daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        self._raise_error()
+
+    def _run(self):
+        try:
+            # sqlite3 연결은 만든 스레드에서만 쓸 수 있으므로 쓰기 스레드에서 연다
+            conn = configure_connection(sqlite3.connect(self.db_path))
+            # 커밋 시점은 쓰기 스레드가 정한다 (BatchWriter 자동 flush 없음)
+            self.writer = BatchWriter(conn, batch_size=sys.maxsize)
+        except Exception as e:
+            self._error = e
+            self._ready.set()
+            return
+        self._ready.set()
+
+        deadline = None
+        stopping = False
+        try:
+            while not stopping:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    items = [self._queue.get(timeout=timeout)]
+                except queue.Empty:
+                    items = []
+                # 커밋하는 동안 밀린 요청은 다음 트랜잭션 하나로 묶는다 (그룹 커밋)
+                while True:
+                    try:
+                        items.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if self._STOP in items:
+                    stopping = True
+                    items = items[:items.index(self._STOP)]
+                for statements in items:
+                    self.writer.add_group(statements)
+
+                expired = deadline is not None and time.monotonic() >= deadline
+                if self.writer.pending >= self.batch_size or expired or (not items and self.writer.pending):
+                    self.writer.flush()
+                if not self.writer.pending:
+                    deadline = None
+                elif deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            self.writer.flush()
+        except Exception as e:
+            self._error = e
+        finally:
+            conn.close()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def add(self, sql: str, params: Sequence[Any]):
+        """쓰기 요청 추가"""
+        self.add_group([(sql, params)])
+
+    def add_group(self, statements: Iterable[Tuple[str, Sequence[Any]]]):
+        """같은 트랜잭션에 기록되어야 하는 쓰기 요청 묶음 추가"""
+        self._raise_error()
+        if self._closed:
+            raise RuntimeError("닫힌 BackgroundWriter에 쓰기 요청을 추가했습니다")
+        self._queue.put(list(statements))
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+
+    def add_many(self, sql: str, rows: Iterable[Sequence[Any]]):
+        """같은 SQL의 여러 행 추가"""
+        self.add_group((sql, params) for params in rows)
+
+    def close(self):
+        """큐에 남은 요청을 모두 기록하고 쓰기 스레드 종료"""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(self._STOP)
+            self._thread.join()
+        self._raise_error()
+
+    def summary(self) -> str:
+        """쓰기 통계 요약 문자열"""
+        if self.writer is None:
+            return "-"
+        return f"{self.writer.summary()}, 최대 대기 {self.max_queue_depth}건"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
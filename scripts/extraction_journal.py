@@ -0,0 +1,102 @@
+"""
+LLM 기술 스택 추출 저널
+공고별 추출 상태/시도 횟수/결과 출처를 기록해 중단된 실행을 정확히 이어서 처리한다.
+
+status:
+    pending  - 추출 대기 (토큰화 완료, 결과 미기록)
+    done     - LLM, 캐시, 사전 해석 또는 유사 중복 대표 공고 결과 기록
+    degraded - 폴백 사전 매칭 결과 기록 (재시도 대상)
+    failed   - 오류로 원본 토큰 기록 (재시도 대상)
+
+실패/폴백 결과는 시도 횟수가 max_attempts에 이를 때까지만 다시 추출한다.
+"""
+import sqlite3
+import time
+from typing import Dict, List
+
+from scripts.db_writer import BatchWriter
+
+CREATE_JOURNAL_SQL = '''
+CREATE TABLE IF NOT EXISTS extraction_journal (
+    job_id INTEGER PRIMARY KEY,
+    status TEXT NOT NULL,
+    source TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+)
+'''
+
+MARK_PENDING_SQL = '''
+    INSERT INTO extraction_journal (job_id, status, attempts, created_at, updated_at)
+    VALUES (?, 'pending', 0, ?, ?)
+    ON CONFLICT(job_id) DO UPDATE SET status = 'pending', updated_at = excluded.updated_at
+'''
+
+RECORD_RESULT_SQL = '''
+    INSERT INTO extraction_journal (job_id, status, source, attempts, last_error, created_at, updated_at)
+    VALUES (?, ?, ?, 1, ?, ?, ?)
+    ON CONFLICT(job_id) DO UPDATE SET
+        status = excluded.status,
+        source = excluded.source,
+        attempts = extraction_journal.attempts + 1,
+        last_error = excluded.last_error,
+        updated_at = excluded.updated_at
+'''
+
+DELETE_JOURNAL_SQL = 'DELETE FROM extraction_journal WHERE job_id = ?'
+
+# 결과 출처 → 저널 상태
+STATUS_BY_SOURCE = {
+    'llm': 'done',
+    'cache': 'done',
+    'local': 'done',
+    'duplicate': 'done',
+    'fallback': 'degraded',
+    'error': 'failed',
+}
+
+
+def create_journal_table(cursor: sqlite3.Cursor):
+    """저널 테이블 생성 (존재하지 않는 경우에만)"""
+    cursor.execute(CREATE_JOURNAL_SQL)
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_extraction_journal_status ON extraction_journal(status)')
+
+
+def mark_pending(writer: BatchWriter, job_ids: List[int]):
+    """추출 대상 공고를 pending으로 기록"""
+    now = time.time()
+    writer.add_many(MARK_PENDING_SQL, ((int(job_id), now, now) for job_id in job_ids))
+
+
+def result_statement(job_id: int, source: str, error: str = None):
+    """추출 결과 기록 SQL과 파라미터 (결과 UPDATE와 같은 트랜잭션에 넣는다)"""
+    now = time.time()
+    return RECORD_RESULT_SQL, (int(job_id), STATUS_BY_SOURCE[source], source, error, now, now)
+
+
+def delete_entries(writer: BatchWriter, job_ids: List[int]):
+    """삭제된 공고의 저널 항목 제거"""
+    writer.add_many(DELETE_JOURNAL_SQL, ((int(job_id),) for job_id in job_ids))
+
+
+def select_resumable_job_ids(conn: sqlite3.Connection, max_attempts: int) -> List[int]:
+    """이어서 처리할 공고: 추출 대기(pending) + 시도 횟수가 남은 실패/폴백 결과"""
+    rows = conn.execute('''
+        SELECT job_id FROM extraction_journal
+        WHERE status = 'pending'
+           OR (status IN ('failed', 'degraded') AND attempts < ?)
+    ''', (max_attempts,)).fetchall()
+    return [row[0] for row in rows]
+
+
+def select_fallback_job_ids(conn: sqlite3.Connection) -> List[int]:
+    """폴백 결과로 기록된 공고 (시도 횟수와 무관)"""
+    rows = conn.execute("SELECT job_id FROM extraction_journal WHERE source = 'fallback'").fetchall()
+    return [row[0] for row in rows]
+
+
+def journal_summary(conn: sqlite3.Connection) -> Dict[str, int]:
+    """상태별 공고 수"""
+    return dict(conn.execute('SELECT status, COUNT(*) FROM extraction_journal GROUP BY status').fetchall())
@@ -0,0 +1,228 @@
+"""
+증분 TF-IDF 모델
+
+전체 코퍼스를 매번 다시 fit 하는 대신, 공고별 단어 빈도(TF) 행과 문서 빈도(DF)를 유지하면서
+새로 들어오거나 바뀐 공고의 행만 갱신한다. 어휘는 추가만 되므로 열 번호가 바뀌지 않는다.
+
+가중치는 TfidfVectorizer 기본값과 같다:
+    idf = ln((1 + n) / (1 + df)) + 1, min_df/max_df 범위 밖 단어는 0, 행은 L2 정규화
+저장된 벡터의 IDF가 현재 DF 기준 IDF에서 임계값 이상 벗어나면 전체 행을 다시 가중한다
+(토큰화/fit 없이 희소 행렬 곱 한 번).
+"""
+import math
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.preprocessing import normalize
+
+
+class IncrementalTfidf:
+    """job_id에 정렬된 증분 TF-IDF 행렬"""
+
+    def __init__(self, min_df: float = 0.01, max_df: float = 0.9, drift_threshold: float = 0.05):
+        self.min_df = min_df
+        self.max_df = max_df
+        self.drift_threshold = drift_threshold
+
+        self.vocabulary: Dict[str, int] = {}
+        self.document_frequency = np.zeros(0, dtype=np.int64)
+        self.job_ids = np.zeros(0, dtype=np.int64)
+        self.term_counts = sp.csr_matrix((0, 0), dtype=np.float64)
+        # 현재 저장된 벡터에 적용된 IDF (min_df/max_df 범위 밖은 0)
+        self.weighted_idf = np.zeros(0, dtype=np.float64)
+        self.vectors = sp.csr_matrix((0, 0), dtype=np.float64)
+
+    @property
+    def n_documents(self) -> int:
+        return len(self.job_ids)
+
+    def get_feature_names_out(self) -> np.ndarray:
+        """열 순서의 어휘 (TfidfVectorizer와 같은 인터페이스)"""
+        names = np.empty(len(self.vocabulary), dtype=object)
+        for term, index in self.vocabulary.items():
+            names[index] = term
+        return names
+
+    # TfidfVectorizer 기본 분석기 (소문자화 + 2글자 이상 단어)
+    _analyzer = staticmethod(CountVectorizer().build_analyzer())
+
+    def _count_rows(self, texts: Iterable[str], grow: bool) -> sp.csr_matrix:
+        """텍스트 → 단어 빈도 CSR (grow=True면 새 단어를 어휘에 추가)"""
+        indptr, indices, data = [0], [], []
+        for text in texts:
+            counts = Counter(self._analyzer(text or ''))
+            for term, count in counts.items():
+                index = self.vocabulary.get(term)
+                if index is None:
+                    if not grow:
+                        continue
+                    index = self.vocabulary[term] = len(self.vocabulary)
+                indices.append(index)
+                data.append(count)
+            indptr.append(len(indices))
+        return sp.csr_matrix(
+            (np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int64), indptr),
+            shape=(len(indptr) - 1, len(self.vocabulary))
+        )
+
+    def _resize_columns(self, matrix: sp.csr_matrix) -> sp.csr_matrix:
+        """어휘가 늘어난 만큼 열 수 확장"""
+        n_terms = len(self.vocabulary)
+        if matrix.shape[1] == n_terms:
+            return matrix
+        return sp.csr_matrix((matrix.data, matrix.indices, matrix.indptr),
+                             shape=(matrix.shape[0], n_terms))
+
+    def _presence(self, counts: sp.csr_matrix) -> np.ndarray:
+        """단어별 등장 문서 수"""
+        return np.bincount(counts.indices, minlength=counts.shape[1]).astype(np.int64)
+
+    def current_idf(self) -> np.ndarray:
+        """현재 DF 기준 IDF (min_df/max_df 범위 밖 단어는 0)"""
+        n = self.n_documents
+        df = self.document_frequency
+        idf = np.log((1 + n) / (1 + df)) + 1.0
+        min_count = self.min_df if isinstance(self.min_df, int) else math.ceil(self.min_df * n)
+        max_count = self.max_df if isinstance(self.max_df, int) else self.max_df * n
+        active = (df > 0) & (df >= min_count) & (df <= max_count)
+        return np.where(active, idf, 0.0)
+
+    def _weigh(self, counts: sp.csr_matrix, idf: np.ndarray) -> sp.csr_matrix:
+        if counts.shape[0] == 0:
+            # 삭제만 있는 갱신/빈 코퍼스 (normalize는 0행 행렬을 받지 않는다)
+            return sp.csr_matrix(counts.shape, dtype=np.float64)
+        weighted = sp.csr_matrix(counts.multiply(idf[np.newaxis, :]))
+        weighted.eliminate_zeros()
+        return normalize(weighted, norm='l2', copy=False)
+
+    def _positions(self, job_ids: Iterable[int]) -> np.ndarray:
+        """저장된 행 중 job_ids에 해당하는 위치"""
+        return np.flatnonzero(np.isin(self.job_ids, np.fromiter(job_ids, dtype=np.int64)))
+
+    def _drop_rows(self, positions: np.ndarray):
+        """행 제거 및 DF 차감"""
+        if len(positions) == 0:
+            return
+        self.document_frequency -= self._presence(self.term_counts[positions])
+        keep = np.ones(self.n_documents, dtype=bool)
+        keep[positions] = False
+        self.term_counts = self.term_counts[keep]
+        self.vectors = self.vectors[keep]
+        self.job_ids = self.job_ids[keep]
+
+    def update(self, job_ids: Iterable[int], texts: Iterable[str],
+               removed_job_ids: Iterable[int] = ()) -> Dict[str, object]:
+        """새/변경 공고 행 반영 및 삭제된 공고 행 제거
+
+        Returns:
+            갱신/어휘 변화/IDF 드리프트 리포트
+        """
+        job_ids = np.asarray(list(job_ids), dtype=np.int64)
+        texts = list(texts)
+        n_terms_before = len(self.vocabulary)
+        idf_before = self.current_idf()
+
+        replaced = self._positions(job_ids)
+        removed = self._positions(removed_job_ids)
+        changed = len(replaced)
+        self._drop_rows(np.union1d(replaced, removed))
+
+        new_counts = self._count_rows(texts, grow=True)
+        self.term_counts = self._resize_columns(self.term_counts)
+        self.vectors = self._resize_columns(self.vectors)
+        self.document_frequency = np.concatenate([
+            self.document_frequency,
+            np.zeros(len(self.vocabulary) - n_terms_before, dtype=np.int64)
+        ]) + self._presence(new_counts)
+        self.job_ids = np.concatenate([self.job_ids, job_ids])
+        self.term_counts = sp.vstack([self.term_counts, new_counts], format='csr')
+
+        # 어휘 변화 (활성 = min_df/max_df 범위 안)
+        idf = self.current_idf()
+        padded_before = np.concatenate([idf_before, np.zeros(len(idf) - len(idf_before))])
+        was_active, is_active = padded_before > 0, idf > 0
+
+        # 저장된 벡터 가중치 대비 IDF 드리프트 (기존 단어 기준)
+        n_weighted = len(self.weighted_idf)
+        old_weighted, old_idf = self.weighted_idf, idf[:n_weighted]
+        either = (old_weighted > 0) | (old_idf > 0)
+        if either.any():
+            relative = (np.abs(old_idf[either] - old_weighted[either])
+                        / np.maximum(old_weighted[either], old_idf[either]))
+            mean_drift, max_drift = float(relative.mean()), float(relative.max())
+        else:
+            mean_drift = max_drift = 0.0
+        weighted = np.concatenate([old_weighted, idf[n_weighted:]])
+
+        reweighted = mean_drift > self.drift_threshold or self.vectors.shape[0] == 0
+        if reweighted:
+            # 전체 행 재가중 (TF 행은 그대로)
+            self.weighted_idf = idf
+            self.vectors = self._weigh(self.term_counts, idf)
+        else:
+            # 새/변경 행만 기존 가중치로 계산 (새 단어는 현재 IDF)
+            self.weighted_idf = weighted
+            self.vectors = sp.vstack([self.vectors, self._weigh(new_counts, weighted)], format='csr')
+
+        return {
+            'documents': self.n_documents,
+            'added': len(job_ids) - changed,
+            'changed': changed,
+            'removed': len(removed),
+            'new_terms': len(self.vocabulary) - n_terms_before,
+            'activated_terms': int((~was_active & is_active).sum()),
+            'deactivated_terms': int((was_active & ~is_active).sum()),
+            'active_terms': int(is_active.sum()),
+            'mean_idf_drift': mean_drift,
+            'max_idf_drift': max_drift,
+            'reweighted': reweighted,
+        }
+
+    def transform(self, texts: Iterable[str]) -> sp.csr_matrix:
+        """질의 텍스트 벡터화 (저장된 벡터와 같은 가중치, 모르는 단어는 무시)"""
+        return self._weigh(self._count_rows(texts, grow=False), self.weighted_idf)
+
+    def row_positions(self, job_ids: Iterable[int]) -> List[Optional[int]]:
+        """job_id → 벡터 행 위치 (없으면 None)"""
+        position_by_id = {int(job_id): position for position, job_id in enumerate(self.job_ids)}
+        return [position_by_id.get(int(job_id)) for job_id in job_ids]
+
+    def save(self, writer):
+        """아티팩트로 저장 (ArtifactWriter)
+
+        job_vectors / job_vector_ids / feature_names는 검색 등 다른 단계에서도 직접 읽는다.
+        """
+        writer.add_json('tfidf_params', {
+            'min_df': self.min_df, 'max_df': self.max_df, 'drift_threshold': self.drift_threshold
+        })
+        writer.add_vocabulary('feature_names', self.get_feature_names_out())
+        writer.add_array('tfidf_document_frequency', self.document_frequency)
+        writer.add_array('tfidf_idf', self.weighted_idf)
+        writer.add_csr('tfidf_term_counts', self.term_counts)
+        writer.add_array('job_vector_ids', self.job_ids)
+        writer.add_csr('job_vectors', self.vectors)
+
+    @classmethod
+    def load(cls, store) -> 'IncrementalTfidf':
+        """아티팩트에서 불러오기 (ArtifactStore, 갱신 가능하도록 메모리로 읽는다)"""
+        model = cls(**store.load_json('tfidf_params'))
+        model.vocabulary = {term: index for index, term in enumerate(store.load_vocabulary('feature_names'))}
+        model.document_frequency = store.load_array('tfidf_document_frequency', mmap=False)
+        model.weighted_idf = store.load_array('tfidf_idf', mmap=False)
+        model.term_counts = store.load_csr('tfidf_term_counts', mmap=False)
+        model.job_ids = store.load_array('job_vector_ids', mmap=False)
+        model.vectors = store.load_csr('job_vectors', mmap=False)
+        return model
+
+    @staticmethod
+    def format_report(report: Dict[str, object]) -> str:
+        """갱신 리포트 요약 문자열"""
+        return (f"문서 {report['documents']}개 (추가 {report['added']}, 변경 {report['changed']}, "
+                f"삭제 {report['removed']}), 신규 단어 {report['new_terms']}개, "
+                f"활성 단어 {report['active_terms']}개 (+{report['activated_terms']}/"
+                f"-{report['deactivated_terms']}), IDF 드리프트 평균 {report['mean_idf_drift']:.2%} "
+                f"/ 최대 {report['max_idf_drift']:.2%}"
+                + (", 전체 재가중" if report['reweighted'] else ", 변경 행만 갱신"))
@@ -0,0 +1,366 @@
+"""
+연속 수집 데몬 (마이크로 배치 ETL)
+
+CSV 드롭마다 data_processing.py를 새로 실행하면 NLTK 자원 확인, Okt(JVM) 시작, 인코더/아티팩트 로드를
+매번 다시 한다. 데몬은 JobDataProcessor 하나를 계속 띄워 두고 새로 들어온 공고만 마이크로 배치로 처리한다.
+    - 형태소 분석기, 임베딩 인코더, LLM 클라이언트/캐시, 레이트 리미터 버킷 잔량을 배치 사이에 유지
+    - TF-IDF 모델/중복 탐지 서명/임베딩은 직전 배치가 저장한 객체를 다시 읽지 않고 이어서 갱신
+    - 배치마다 process_data(postings=배치, delete_missing=False): 신규/변경 공고만 각 단계를 거치고
+      DB/단계 상태도 배치 공고 행만 읽는다
+    - 아티팩트 저장(TF-IDF/임베딩 전체 스냅샷)은 새 공고가 없을 때나 --flush-seconds마다 한 번만 하고,
+      그때 리로드 스탬프를 교체해 실행 중인 앱이 새 데이터를 불러온다
+    - 처리 위치(파일 이동/오프셋)는 아티팩트 저장 후에 확정하므로, 저장 전에 중단되거나 배치가 실패하면
+      마지막 저장 이후의 입력을 다시 읽는다
+
+입력:
+    --watch-dir: 드롭 디렉터리의 새 *.csv (두 번 연속 같은 크기면 쓰기가 끝난 것으로 판단)
+                 처리 후 processed/ 로, 읽을 수 없거나 처리에 계속 실패하면 failed/ 로 이동
+    --csv: 추가 전용 CSV에 새로 붙은 행 (처리한 바이트 위치를 ETLConfig.INGEST_STATE_PATH에 기록)
+
+드롭에는 공고 일부만 있으므로 빠진 공고를 삭제하지 않는다. 마감 공고 삭제는 전체 CSV로
+python scripts/data_processing.py 를 실행해 반영한다.
+
+사용법:
+    python scripts/ingest_daemon.py --watch-dir data/incoming
+    python scripts/ingest_daemon.py --csv data/job_infos.csv --interval 10
+"""
+import argparse
+import io
+import json
+import os
+import shutil
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import pandas as pd
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from config.settings import ETLConfig
+from scripts.data_processing import SOURCE_COLUMNS, JobDataProcessor
+
+INPUT_COLUMNS = ['job_id'] + SOURCE_COLUMNS
+
+
+class IngestBatch:
+    """소스에서 읽은 공고와 처리 결과 통보 콜백"""
+
+    def __init__(self, postings: pd.DataFrame, label: str,
+                 on_success: Callable[[], None], on_failure: Callable[[], None]):
+        self.postings = postings
+        self.label = label
+        self.on_success = on_success
+        self.on_failure = on_failure
+
+
+class DropDirectorySource:
+    """드롭 디렉터리의 새 CSV 파일 (수정 시각 순)"""
+
+    def __init__(self, directory: str, max_attempts: int = 3):
+        self.directory = directory
+        self.max_attempts = max_attempts
+        self.processed_dir = os.path.join(directory, 'processed')
+        self.failed_dir = os.path.join(directory, 'failed')
+        for path in (directory, self.processed_dir, self.failed_dir):
+            os.makedirs(path, exist_ok=True)
+        self._sizes = {}
+        self._failures: Counter = Counter()
+        # 처리했지만 아티팩트 저장 전이라 아직 processed/로 옮기지 않은 파일
+        self._uncommitted: List[str] = []
+
+    def _ready_files(self) -> List[str]:
+        """직전 확인 때와 크기/수정 시각이 같은(쓰기가 끝난) CSV 파일"""
+        names = [name for name in os.listdir(self.directory)
+                 if name.endswith('.csv') and not name.startswith('.')]
+        ready = []
+        sizes = {}
+        for name in names:
+            path = os.path.join(self.directory, name)
+            try:
+                sizes[name] = (os.path.getsize(path), os.path.getmtime(path))
+            except FileNotFoundError:
+                continue
+            if self._sizes.get(name) == sizes[name] and path not in self._uncommitted:
+                ready.append(path)
+        self._sizes = sizes
+        return sorted(ready, key=lambda path: sizes[os.path.basename(path)][1])
+
+    def _move(self, path: str, directory: str):
+        target = os.path.join(directory, os.path.basename(path))
+        if os.path.exists(target):
+            stem, ext = os.path.splitext(os.path.basename(path))
+            target = os.path.join(directory, f"{stem}.{time.strftime('%Y%m%d%H%M%S')}{ext}")
+        shutil.move(path, target)
+        self._sizes.pop(os.path.basename(path), None)
+
+    def poll(self) -> Optional[IngestBatch]:
+        """쓰기가 끝난 파일을 모두 읽어 배치 하나로 반환 (없으면 None)"""
+        paths, frames = [], []
+        for path in self._ready_files():
+            try:
+                frame = pd.read_csv(path)
+                missing = [column for column in INPUT_COLUMNS if column not in frame.columns]
+                if missing:
+                    raise ValueError(f"필수 칼럼 없음: {', '.join(missing)}")
+            except Exception as e:
+                print(f"드롭 파일을 읽을 수 없어 failed/로 옮깁니다: {path} ({e})")
+                self._move(path, self.failed_dir)
+                continue
+            paths.append(path)
+            frames.append(frame[INPUT_COLUMNS])
+        if not frames:
+            return None
+
+        def on_success():
+            for path in paths:
+                self._failures.pop(path, None)
+            self._uncommitted.extend(paths)
+
+        def on_failure():
+            for path in paths:
+                self._failures[path] += 1
+                if self._failures[path] >= self.max_attempts:
+                    print(f"{self.max_attempts}회 처리에 실패해 failed/로 옮깁니다: {path}")
+                    self._failures.pop(path)
+                    self._move(path, self.failed_dir)
+
+        label = f"드롭 파일 {len(paths)}개"
+        return IngestBatch(pd.concat(frames, ignore_index=True), label, on_success, on_failure)
+
+    def commit(self):
+        """처리한 파일을 processed/로 이동 (아티팩트 저장 후)"""
+        for path in self._uncommitted:
+            self._move(path, self.processed_dir)
+        self._uncommitted = []
+
+    def rollback(self):
+        """저장하지 못한 처리 결과를 버리고 해당 파일을 다시 읽는다"""
+        self._uncommitted = []
+
+
+def _complete_records_end(chunk: bytes) -> int:
+    """따옴표 밖의 마지막 줄바꿈 다음 위치 (쓰는 중인 마지막 행 제외, 없으면 0)"""
+    end = len(chunk)
+    while True:
+        position = chunk.rfind(b'\n', 0, end)
+        if position < 0:
+            return 0
+        # 따옴표 안의 줄바꿈(여러 줄 필드)은 행 경계가 아니다 ("" 이스케이프는 짝수라 영향 없음)
+        if chunk.count(b'"', 0, position) % 2 == 0:
+            return position + 1
+        end = position
+
+
+class AppendOnlyCsvSource:
+    """추가 전용 CSV에 새로 붙은 행 (처리 완료한 바이트 위치를 상태 파일에 기록)"""
+
+    def __init__(self, csv_path: str, state_path: str):
+        self.csv_path = os.path.abspath(csv_path)
+        self.state_path = state_path
+        # offset: 처리한 위치, committed_offset: 아티팩트 저장 후 상태 파일에 기록한 위치
+        self.offset = self.committed_offset = self._load_state().get(self.csv_path, 0)
+
+    def _load_state(self) -> dict:
+        try:
+            with open(self.state_path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _save_offset(self, offset: int):
+        state = self._load_state()
+        state[self.csv_path] = offset
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.state_path)
+        self.offset = self.committed_offset = offset
+
+    def poll(self) -> Optional[IngestBatch]:
+        """마지막 처리 위치 이후의 완성된 행을 배치로 반환 (없으면 None)"""
+        if not os.path.exists(self.csv_path):
+            return None
+        size = os.path.getsize(self.csv_path)
+        if size < self.offset:
+            print(f"경고: {self.csv_path} 크기가 처리한 위치보다 작습니다. 파일이 교체된 것으로 보고 처음부터 읽습니다.")
+            self.offset = 0
+        if size == self.offset:
+            return None
+
+        with open(self.csv_path, 'rb') as f:
+            header = f.readline()
+            f.seek(self.offset)
+            chunk = f.read(size - self.offset)
+        end = _complete_records_end(chunk)
+        # 처음 읽을 때는 헤더가 chunk 안에 있다
+        body = chunk[:end] if self.offset == 0 else header + chunk[:end]
+        if end == 0 or body.strip() == header.strip():
+            return None
+
+        # 깨진 행/칼럼 누락은 예외로 알린다 (위치를 옮기지 않았으므로 다음 확인 때 같은 행을 다시 읽는다)
+        frame = pd.read_csv(io.BytesIO(body))
+        missing = [column for column in INPUT_COLUMNS if column not in frame.columns]
+        if missing:
+            raise ValueError(f"필수 칼럼 없음: {', '.join(missing)}")
+        postings = frame[INPUT_COLUMNS]
+        new_offset = self.offset + end
+
+        def on_success():
+            self.offset = new_offset
+
+        def on_failure():
+            # 위치를 옮기지 않았으므로 다음 확인 때 같은 행을 다시 읽는다
+            pass
+
+        label = f"추가 행 {len(postings)}건 (바이트 {self.offset}~{new_offset})"
+        return IngestBatch(postings, label, on_success, on_failure)
+
+    def commit(self):
+        """처리한 위치를 상태 파일에 기록 (아티팩트 저장 후)"""
+        if self.offset != self.committed_offset:
+            self._save_offset(self.offset)
+
+    def rollback(self):
+        """저장하지 못한 처리 결과를 버리고 마지막 기록 위치부터 다시 읽는다"""
+        self.offset = self.committed_offset
+
+
+class IngestDaemon:
+    """소스를 주기적으로 확인해 새 공고를 마이크로 배치로 처리"""
+
+    def __init__(self, source, processor: JobDataProcessor, interval: float = 5.0,
+                 max_batch_rows: int = 5000, flush_seconds: float = 60.0):
+        self.source = source
+        self.processor = processor
+        self.interval = interval
+        self.max_batch_rows = max(1, max_batch_rows)
+        self.flush_seconds = flush_seconds
+        self.batches = 0
+        self.postings = 0
+        # 아티팩트 저장 전인 배치 수와 그중 첫 배치 처리 시각
+        self._unflushed = 0
+        self._unflushed_since = None
+        self._stop = threading.Event()
+
+    def stop(self, *args):
+        """현재 배치를 마치고 종료"""
+        self._stop.set()
+
+    def run_once(self) -> int:
+        """새 공고를 한 번 확인해 처리 (처리한 공고 수 반환)"""
+        try:
+            batch = self.source.poll()
+        except Exception as e:
+            print(f"[수집] 입력 읽기 실패 (다음 확인 때 다시 읽음): {e}")
+            return 0
+        if batch is None:
+            return 0
+        # 같은 배치 안에서는 나중에 들어온 공고 내용을 쓴다
+        postings = batch.postings.drop_duplicates(subset=['job_id'], keep='last').reset_index(drop=True)
+        print(f"\n[수집] {batch.label}: 공고 {len(postings)}건")
+        start = time.time()
+        try:
+            for offset in range(0, len(postings), self.max_batch_rows):
+                self.processor.process_data(postings=postings.iloc[offset:offset + self.max_batch_rows],
+                                            delete_missing=False, defer_artifacts=True)
+        except Exception as e:
+            print(f"[수집] 배치 처리 실패: {e}")
+            batch.on_failure()
+            self._discard()
+            return 0
+        batch.on_success()
+        if not self._unflushed:
+            self._unflushed_since = time.time()
+        self._unflushed += 1
+        self.batches += 1
+        self.postings += len(postings)
+        print(f"[수집] 완료: {len(postings)}건, {time.time() - start:.2f}초 "
+              f"(누적 배치 {self.batches}개, 공고 {self.postings}건)")
+        return len(postings)
+
+    def _discard(self):
+        """저장하지 않은 배치를 버리고 소스를 마지막 저장 위치로 되돌린다"""
+        if self._unflushed:
+            print(f"[수집] 아티팩트 저장 전인 배치 {self._unflushed}개도 다시 처리합니다.")
+        self.processor.discard_artifacts()
+        self.source.rollback()
+        self._unflushed = 0
+
+    def flush(self):
+        """미뤄 둔 아티팩트/단계 상태를 저장한 뒤 소스의 처리 위치 확정"""
+        if not self._unflushed:
+            return
+        try:
+            self.processor.flush_artifacts()
+        except Exception as e:
+            print(f"[수집] 아티팩트 저장 실패: {e}")
+            self._discard()
+            return
+        self.source.commit()
+        self._unflushed = 0
+
+    def run(self):
+        """중지될 때까지 반복 (새 공고가 있으면 바로 다음 확인, 없으면 저장 후 interval초 대기)"""
+        print(f"[수집] 대기 중 (확인 주기 {self.interval}초, 배치 최대 {self.max_batch_rows}건, "
+              f"저장 주기 최대 {self.flush_seconds}초)")
+        while not self._stop.is_set():
+            processed = self.run_once()
+            if not processed or time.time() - self._unflushed_since >= self.flush_seconds:
+                self.flush()
+            if not processed:
+                self._stop.wait(self.interval)
+        self.flush()
+        print(f"[수집] 종료: 배치 {self.batches}개, 공고 {self.postings}건")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="연속 수집 데몬 (마이크로 배치 ETL)")
+    source_group = parser.add_mutually_exclusive_group()
+    source_group.add_argument('--watch-dir', default=None,
+                              help=f"새 CSV 파일을 감시할 드롭 디렉터리 (기본: {ETLConfig.INGEST_DROP_DIR})")
+    source_group.add_argument('--csv', default=None, help="새로 붙은 행을 읽을 추가 전용 CSV 파일")
+    parser.add_argument('--interval', type=float, default=ETLConfig.INGEST_POLL_SECONDS,
+                        help="새 공고 확인 주기 (초)")
+    parser.add_argument('--max-batch-rows', type=int, default=ETLConfig.INGEST_MAX_BATCH_ROWS,
+                        help="process_data 1회에 넘길 최대 공고 수")
+    parser.add_argument('--flush-seconds', type=float, default=ETLConfig.INGEST_FLUSH_SECONDS,
+                        help="새 공고가 계속 들어올 때 아티팩트 저장을 미루는 최대 시간 (초)")
+    parser.add_argument('--once', action='store_true', help="한 번만 확인하고 종료 (cron 등)")
+    args = parser.parse_args()
+
+    if args.csv:
+        source = AppendOnlyCsvSource(args.csv, ETLConfig.INGEST_STATE_PATH)
+    else:
+        source = DropDirectorySource(args.watch_dir or ETLConfig.INGEST_DROP_DIR, ETLConfig.INGEST_MAX_ATTEMPTS)
+
+    processor = JobDataProcessor()
+    processor.create_database()
+    daemon = IngestDaemon(source, processor, args.interval, args.max_batch_rows, args.flush_seconds)
+    if args.once:
+        if isinstance(source, DropDirectorySource):
+            # 드롭 파일은 두 번 연속 같은 크기여야 처리하므로 먼저 크기만 기록
+            source.poll()
+            time.sleep(1.0)
+        daemon.run_once()
+        daemon.flush()
+        return
+
+    signal.signal(signal.SIGTERM, daemon.stop)
+    try:
+        daemon.run()
+    except KeyboardInterrupt:
+        print("\n[수집] 중단됨")
+        daemon.flush()
+
+
+if __name__ == "__main__":
+    main()
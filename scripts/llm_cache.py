@@ -0,0 +1,96 @@
+"""
+LLM 기술 스택 추출 결과 디스크 캐시
+(정렬된 고유 토큰, 프롬프트 버전, 모델, temperature) 해시 → tech_skills
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Iterable, List, Optional
+
+PUT_SQL = 'INSERT OR REPLACE INTO llm_cache (cache_key, tech_skills, created_at) VALUES (?, ?, ?)'
+
+
+class LLMExtractionCache:
+    """토큰 집합 기반 LLM 추출 결과 캐시 (SQLite 파일)
+
+    job_data.db와 별도 파일에 저장하므로 DB를 재생성해도 캐시는 유지된다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                cache_key TEXT PRIMARY KEY,
+                tech_skills TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+        ''')
+        self.conn.commit()
+
+        self.reset_stats()
+
+    def reset_stats(self):
+        """실행 단위 통계 초기화"""
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    @staticmethod
+    def make_key(tokens: Iterable[str], prompt_version: int, model: str,
+                 temperature: float) -> str:
+        """정규화된 토큰 집합 + 요청 설정으로 캐시 키 생성"""
+        normalized = sorted({token.strip() for token in tokens if token and token.strip()})
+        payload = json.dumps(
+            [normalized, prompt_version, model, float(temperature)],
+            ensure_ascii=False, separators=(',', ':')
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, cache_key: str) -> Optional[List[str]]:
+        """캐시 조회 (없으면 None)"""
+        row = self.conn.execute(
+            'SELECT tech_skills FROM llm_cache WHERE cache_key = ?', (cache_key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def record_hit(self):
+        """같은 실행 안에서 동일한 토큰 집합의 요청 결과를 공유한 경우 적중으로 집계"""
+        self.hits += 1
+
+    def put_statement(self, cache_key: str, tech_skills: List[str]):
+        """LLM 추출 결과 저장 SQL과 파라미터 (BackgroundWriter로 기록할 때 사용)"""
+        self.stores += 1
+        return PUT_SQL, (cache_key, json.dumps(tech_skills, ensure_ascii=False), time.time())
+
+    def put(self, cache_key: str, tech_skills: List[str]):
+        """LLM 추출 결과 저장"""
+        with self.conn:
+            self.conn.execute(*self.put_statement(cache_key, tech_skills))
+
+    def __len__(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM llm_cache').fetchone()[0]
+
+    @property
+    def hit_rate(self) -> float:
+        """이번 실행의 캐시 적중률"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def summary(self) -> str:
+        """캐시 통계 요약 문자열"""
+        return (f"적중 {self.hits}건 / 미스 {self.misses}건 (적중률 {self.hit_rate:.1%}), "
+                f"신규 저장 {self.stores}건, 전체 {len(self)}건")
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,90 @@
+"""
+LLM 호출 통계 (요청 수, 지연 시간 분포, 오류/재시도 분류, 토큰 사용량)
+"""
+import bisect
+import math
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+# 지연 시간 히스토그램 구간 상한 (초)
+LATENCY_BUCKETS = (0.25, 0.5, 1, 2, 4, 8, 16, 32)
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """nearest-rank 방식 백분위수 (q: 0~100)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class LLMCallStats:
+    """LLM 요청 단위 통계 수집"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """실행 단위 통계 초기화"""
+        self.requests = 0
+        self.latencies: List[float] = []
+        self.errors: Counter = Counter()      # 오류 클래스별 요청 실패 수
+        self.retries: Counter = Counter()     # 재시도 사유별 횟수
+        self.outcomes: Counter = Counter()    # 결과 출처별 공고 수 (llm/cache/fallback/error)
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def record_request(self, latency: float, error: Optional[str] = None, usage: Any = None):
+        """요청 1건 기록 (성공 시 usage, 실패 시 오류 클래스명)"""
+        self.requests += 1
+        self.latencies.append(latency)
+        if error:
+            self.errors[error] += 1
+        if usage is not None:
+            self.prompt_tokens += getattr(usage, 'prompt_tokens', 0) or 0
+            self.completion_tokens += getattr(usage, 'completion_tokens', 0) or 0
+
+    def record_retry(self, reason: str):
+        """재시도 1회 기록"""
+        self.retries[reason] += 1
+
+    def record_outcome(self, source: str, count: int = 1):
+        """공고 단위 결과 출처 기록"""
+        self.outcomes[source] += count
+
+    def latency_percentiles(self) -> Dict[str, Optional[float]]:
+        """p50/p95/p99 요청 지연 시간 (초)"""
+        return {f"p{q}": percentile(self.latencies, q) for q in (50, 95, 99)}
+
+    def latency_histogram(self) -> Dict[str, int]:
+        """지연 시간 구간별 요청 수 ("<=1s": 상한 이하, ">32s": 마지막 상한 초과)"""
+        counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        for latency in self.latencies:
+            counts[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+        labels = [f"<={bound}s" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}s"]
+        return dict(zip(labels, counts))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """리포트용 딕셔너리"""
+        return {
+            'requests': self.requests,
+            'errors': dict(self.errors),
+            'retries': dict(self.retries),
+            'outcomes': dict(self.outcomes),
+            'prompt_tokens': self.prompt_tokens,
+            'completion_tokens': self.completion_tokens,
+            'total_tokens': self.prompt_tokens + self.completion_tokens,
+            'latency_seconds': self.latency_percentiles(),
+            'latency_histogram': self.latency_histogram(),
+        }
+
+    def summary(self) -> str:
+        """통계 요약 문자열"""
+        latency = self.latency_percentiles()
+        latency_text = ", ".join(
+            f"{name} {value:.2f}s" for name, value in latency.items() if value is not None
+        ) or "-"
+        return (f"요청 {self.requests}건 (실패 {sum(self.errors.values())}건), "
+                f"재시도 {sum(self.retries.values())}회, 지연 {latency_text}, "
+                f"토큰 {self.prompt_tokens + self.completion_tokens:,}")
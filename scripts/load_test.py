@@ -0,0 +1,164 @@
+"""
+LLM 추출 파이프라인 오프라인 부하 테스트 하네스
+
+모의 LLM 서버를 띄우고 extract_tech_skills_batch를 실행한 뒤
+처리량, 지연 시간 꼬리(p50/p95/p99), 재시도 횟수를 보고한다.
+
+사용법:
+    # 합성 공고 500건, 동시 요청 16, 패킹 모드
+    python scripts/load_test.py --postings 500 --concurrency 16 --packing --client-rpm 600
+
+    # 기존 DB의 토큰 목록을 그대로 재생 (실제 분포)
+    python scripts/load_test.py --replay-db data/job_data.db --postings 2000 --error-429 0.05
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from config.settings import ETLConfig
+from scripts.db_writer import BatchWriter, configure_connection
+from scripts.mock_llm_server import MockLLMServer, add_server_arguments
+from scripts.rate_limiter import AsyncRateLimiter
+
+SYNTHETIC_KOREAN_NOUNS = [
+    '백엔드', '프론트엔드', '서버', '플랫폼', '트래픽', '아키텍처', '운영', '배포', '모니터링', '결제',
+    '커머스', '검색엔진', '추천시스템', '파이프라인', '대용량', '분산', '보안', '인프라', '모바일', '광고'
+]
+SYNTHETIC_TECH_TOKENS = [
+    'Python', 'Java', 'Kotlin', 'Spring', 'Django', 'React', 'Vue', 'TypeScript', 'MySQL', 'PostgreSQL',
+    'Redis', 'Kafka', 'AWS', 'Docker', 'Kubernetes', 'Terraform', 'Airflow', 'Spark', 'Elasticsearch', 'Go'
+]
+
+
+def load_replay_postings(db_path, limit):
+    """기존 DB에서 토큰화된 공고 불러오기"""
+    conn = sqlite3.connect(db_path)
+    df = pd.read_sql(
+        'SELECT job_id, title, description, requirements, preferred, skills '
+        'FROM jobs WHERE skills IS NOT NULL LIMIT ?', conn, params=(limit,)
+    )
+    conn.close()
+    return df
+
+
+def make_synthetic_postings(count, duplicate_ratio, seed):
+    """합성 공고 생성 (duplicate_ratio 비율만큼 앞선 공고의 토큰 목록을 재사용)"""
+    rng = random.Random(seed)
+    rows = []
+    for job_id in range(1, count + 1):
+        if rows and rng.random() < duplicate_ratio:
+            tokens = json.loads(rng.choice(rows)['skills'])
+        else:
+            tokens = (rng.sample(SYNTHETIC_TECH_TOKENS, rng.randint(2, 8)) +
+                      rng.sample(SYNTHETIC_KOREAN_NOUNS, rng.randint(3, 12)))
+        rows.append({
+            'job_id': job_id, 'title': f"개발자 {job_id}", 'description': '', 'requirements': '',
+            'preferred': '', 'skills': json.dumps(tokens, ensure_ascii=False)
+        })
+    return pd.DataFrame(rows)
+
+
+def build_processor(args, db_path, cache_path):
+    """모의 서버를 바라보는 JobDataProcessor 생성"""
+    from scripts.data_processing import JobDataProcessor
+
+    ETLConfig.LLM_CONCURRENCY = args.concurrency
+    ETLConfig.LLM_PACKING = args.packing
+    ETLConfig.LLM_PACK_MAX_ITEMS = args.pack_max_items
+    ETLConfig.LLM_CACHE_ENABLED = args.with_cache
+    ETLConfig.LLM_CACHE_PATH = cache_path
+    ETLConfig.LOCAL_EXTRACTION_ENABLED = args.local_extraction
+
+    processor = JobDataProcessor(csv_path=None, db_path=db_path)
+    limits = processor.rate_limits
+    if args.client_rpm:
+        limits['requests']['minute'] = args.client_rpm
+        limits['requests']['hour'] = max(limits['requests']['hour'], args.client_rpm * 60)
+        limits['requests']['day'] = max(limits['requests']['day'], args.client_rpm * 60 * 24)
+    processor.rate_limiter = AsyncRateLimiter(limits)
+    return processor
+
+
+def run(args):
+    server = MockLLMServer(latency=args.latency, error_429=args.error_429, error_5xx=args.error_5xx,
+                           invalid_rate=args.invalid_rate, rpm=args.server_rpm, seed=args.seed).start()
+    os.environ['CEREBRAS_BASE_URL'] = server.base_url
+    os.environ['CEREBRAS_API_KEY'] = 'mock-key'
+
+    if args.replay_db:
+        df = load_replay_postings(args.replay_db, args.postings)
+    else:
+        df = make_synthetic_postings(args.postings, args.duplicate_ratio, args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'job_data.db')
+        processor = build_processor(args, db_path, os.path.join(tmp, 'llm_cache.db'))
+        processor.create_database()
+
+        conn = configure_connection(sqlite3.connect(db_path))
+        with BatchWriter(conn) as writer:
+            writer.add_many(
+                'INSERT INTO jobs (job_id, title, description, requirements, preferred, skills) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                df[['job_id', 'title', 'description', 'requirements', 'preferred', 'skills']]
+                .astype(object).itertuples(index=False, name=None)
+            )
+        conn.close()
+
+        print(f"모의 서버 {server.base_url} 에 공고 {len(df)}건 추출 시작...")
+        start = time.perf_counter()
+        asyncio.run(processor.extract_tech_skills_batch(df))
+        elapsed = time.perf_counter() - start
+    server.stop()
+
+    stats = processor.llm_stats
+    latency = stats.latency_percentiles()
+    client_attempts = stats.requests
+    server_requests = server.counters['requests']
+
+    print("\n===== 부하 테스트 결과 =====")
+    print(f"공고 수             : {len(df)}")
+    print(f"소요 시간           : {elapsed:.2f}초")
+    print(f"처리량              : {len(df) / elapsed:.2f} 공고/초, {client_attempts / elapsed:.2f} 요청/초")
+    print("요청 지연 (클라이언트): " + ", ".join(
+        f"{name} {value:.3f}s" for name, value in latency.items() if value is not None))
+    print(f"요청 (클라이언트)   : {client_attempts}건, 실패 {dict(stats.errors)}")
+    print(f"재시도 (파이프라인) : {sum(stats.retries.values())}회 {dict(stats.retries)}")
+    # SDK 자체 재시도(429/5xx)는 서버 요청 수와 클라이언트 요청 수의 차이로 드러난다
+    print(f"재시도 (SDK 내부)   : {max(0, server_requests - client_attempts)}회")
+    print(f"서버 관측           : {dict(server.counters)}")
+    print(f"결과 출처           : {dict(stats.outcomes)}")
+    print(f"레이트 리미터       : {processor.rate_limiter.summary()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 추출 파이프라인 부하 테스트 (모의 서버)")
+    parser.add_argument('--postings', type=int, default=200)
+    parser.add_argument('--replay-db', default=None, help="토큰 목록을 재생할 기존 job_data.db 경로")
+    parser.add_argument('--duplicate-ratio', type=float, default=0.0, help="합성 공고 중 재게시 비율")
+    parser.add_argument('--concurrency', type=int, default=ETLConfig.LLM_CONCURRENCY)
+    parser.add_argument('--packing', action='store_true')
+    parser.add_argument('--pack-max-items', type=int, default=ETLConfig.LLM_PACK_MAX_ITEMS)
+    parser.add_argument('--with-cache', action='store_true', help="임시 LLM 캐시 사용")
+    parser.add_argument('--local-extraction', action='store_true',
+                        help="사전 기반 빠른 경로 사용 (임시 학습 어휘)")
+    parser.add_argument('--client-rpm', type=int, default=None,
+                        help="클라이언트 레이트 리미터의 분당 요청 한도 (기본: 실제 한도)")
+    add_server_arguments(parser)
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+로컬 모의 LLM 서버 (Cerebras chat completions API 호환)
+
+실제 할당량을 쓰지 않고 추출 파이프라인의 동시성/패킹/레이트 리밋을 튜닝하기 위한 서버.
+응답 지연 분포, 429/5xx 오류 주입, 결정적(deterministic) 기술 스택 응답을 지원한다.
+
+사용법:
+    python scripts/mock_llm_server.py --port 8765 --latency lognormal:-0.7,0.5 --error-429 0.02
+    CEREBRAS_BASE_URL=http://127.0.0.1:8765 python scripts/data_processing.py
+"""
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Optional
+
+SINGLE_TOKENS_PATTERN = re.compile(r'토큰 목록:\s*(.*)')
+PACKED_ITEM_PATTERN = re.compile(r'^\[job_id=(.+?)\]\s*(.*)$', re.MULTILINE)
+ASCII_LETTER_PATTERN = re.compile(r'[A-Za-z]')
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """지연 시간 분포 파싱
+
+    fixed:0.3 | uniform:0.1,0.8 | exp:0.5 | lognormal:MU,SIGMA (초 = exp(N(MU, SIGMA)))
+    """
+    kind, _, params = spec.partition(':')
+    values = [float(v) for v in params.split(',')] if params else []
+    if kind == 'fixed':
+        return lambda rng: values[0]
+    if kind == 'uniform':
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == 'exp':
+        return lambda rng: rng.expovariate(1 / values[0])
+    if kind == 'lognormal':
+        return lambda rng: math.exp(rng.gauss(values[0], values[1]))
+    raise ValueError(f"지원하지 않는 지연 분포입니다: {spec}")
+
+
+def extract_mock_skills(tokens: List[str]) -> List[str]:
+    """결정적 모의 추출: 영문자를 포함한 토큰을 기술 스택으로 본다"""
+    return sorted({token for token in tokens if ASCII_LETTER_PATTERN.search(token)})
+
+
+def _split_tokens(text: str) -> List[str]:
+    return [token.strip() for token in text.split(',') if token.strip()]
+
+
+class MockLLMServer:
+    """스레드에서 동작하는 모의 chat completions 서버"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: str = 'fixed:0.2',
+                 error_429: float = 0.0, error_5xx: float = 0.0, invalid_rate: float = 0.0,
+                 rpm: Optional[int] = None, seed: int = 42):
+        self.sample_latency = parse_latency(latency)
+        self.error_429 = error_429
+        self.error_5xx = error_5xx
+        self.invalid_rate = invalid_rate
+        self.rpm = rpm
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._recent = deque()  # 서버 측 분당 요청 한도 계산용
+        self.counters = Counter()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                # 클라이언트 생성 시 TCP 워밍 요청
+                self._send_json(200, {})
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                body = json.loads(self.rfile.read(length) or b'{}')
+                status, payload, headers = server.handle_completion(body)
+                self._send_json(status, payload, headers)
+
+            def _send_json(self, status, payload, headers=None):
+                data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, name: str):
+        with self._lock:
+            self.counters[name] += 1
+
+    def _draw(self):
+        """(지연 시간, 난수) 추출 (여러 스레드에서 호출되므로 잠금)"""
+        with self._lock:
+            return max(0.0, self.sample_latency(self._rng)), self._rng.random()
+
+    def _over_rpm(self) -> bool:
+        """서버 측 분당 요청 한도 초과 여부"""
+        if not self.rpm:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            while self._recent and now - self._recent[0] >= 60:
+                self._recent.popleft()
+            if len(self._recent) >= self.rpm:
+                return True
+            self._recent.append(now)
+            return False
+
+    def handle_completion(self, body):
+        """chat completions 요청 처리 → (상태 코드, 응답 본문, 헤더)"""
+        self._count('requests')
+        latency, roll = self._draw()
+
+        if self._over_rpm() or roll < self.error_429:
+            self._count('429')
+            return 429, {"error": {"message": "Rate limit exceeded", "type": "too_many_requests_error"}}, \
+                {'retry-after': '1'}
+
+        time.sleep(latency)
+        if roll < self.error_429 + self.error_5xx:
+            self._count('5xx')
+            return 503, {"error": {"message": "Service unavailable", "type": "server_error"}}, {}
+
+        messages = body.get('messages', [])
+        prompt = "\n".join(str(message.get('content', '')) for message in messages)
+        user_content = messages[-1].get('content', '') if messages else ''
+
+        packed_items = PACKED_ITEM_PATTERN.findall(user_content)
+        if packed_items:
+            result = {"results": [
+                {"job_id": job_id, "tech_skills": extract_mock_skills(_split_tokens(tokens))}
+                for job_id, tokens in packed_items
+            ]}
+        else:
+            match = SINGLE_TOKENS_PATTERN.search(user_content)
+            result = {"tech_skills": extract_mock_skills(_split_tokens(match.group(1)) if match else [])}
+
+        content = json.dumps(result, ensure_ascii=False)
+        if roll > 1 - self.invalid_rate:
+            self._count('invalid')
+            content = content[:len(content) // 2]  # 잘린 JSON
+
+        self._count('ok')
+        prompt_tokens = max(1, len(prompt) // 3)
+        completion_tokens = max(1, len(content) // 3)
+        return 200, {
+            "id": f"chatcmpl-mock-{self.counters['requests']}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get('model', 'mock'),
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content}
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            },
+            "time_info": {"total_time": latency}
+        }, {}
+
+    def start(self) -> 'MockLLMServer':
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def add_server_arguments(parser: argparse.ArgumentParser):
+    """모의 서버 옵션 (부하 테스트 하네스와 공유)"""
+    parser.add_argument('--latency', default='lognormal:-1.0,0.5',
+                        help="지연 분포: fixed:S | uniform:A,B | exp:MEAN | lognormal:MU,SIGMA")
+    parser.add_argument('--error-429', type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument('--error-5xx', type=float, default=0.0, help="503 응답 비율")
+    parser.add_argument('--invalid-rate', type=float, default=0.0, help="잘린 JSON 응답 비율")
+    parser.add_argument('--server-rpm', type=int, default=None, help="서버 측 분당 요청 한도")
+    parser.add_argument('--seed', type=int, default=42)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모의 LLM 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    server = MockLLMServer(args.host, args.port, args.latency, args.error_429, args.error_5xx,
+                           args.invalid_rate, args.server_rpm, args.seed)
+    print(f"모의 LLM 서버 시작: {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"요청 통계: {dict(server.counters)}")
+
+
+if __name__ == "__main__":
+    main()
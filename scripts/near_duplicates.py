@@ -0,0 +1,157 @@
+"""
+MinHash LSH 기반 유사 중복 공고 탐지
+
+같은 공고가 job_id만 바뀌어 문구 일부만 수정된 채 다시 올라오는 경우를 묶는다.
+    - cleaned_text를 소문자 단어 k-gram(shingle) 집합으로 바꿔 MinHash 서명 계산
+    - 서명을 band로 나눠 같은 버킷에 들어간 후보 쌍만 비교 (전체 쌍 비교 없음)
+    - 후보 쌍은 서명 일치율(추정 Jaccard 유사도)이 임계값 이상일 때만 같은 클러스터로 합친다
+
+클러스터 대표는 인덱스에 먼저 들어온 공고(이미 추출/임베딩된 공고)이며,
+클러스터 id는 대표 공고의 job_id다. 중복이 없는 공고는 자기 job_id를 갖는다.
+"""
+import zlib
+from collections import defaultdict
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+# 2^31 - 1 (메르센 소수): (a * x + b) 가 uint64 범위를 넘지 않는다
+MERSENNE_PRIME = (1 << 31) - 1
+EMPTY_VALUE = np.uint32(MERSENNE_PRIME)
+
+
+class NearDuplicateIndex:
+    """job_id에 정렬된 MinHash 서명과 LSH 클러스터링"""
+
+    def __init__(self, num_perm: int = 128, bands: int = 16, shingle_size: int = 3,
+                 threshold: float = 0.8, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})로 나누어떨어져야 합니다")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.seed = seed
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+
+        self.job_ids = np.zeros(0, dtype=np.int64)
+        self.signatures = np.zeros((0, num_perm), dtype=np.uint32)
+
+    @property
+    def n_documents(self) -> int:
+        return len(self.job_ids)
+
+    @property
+    def params(self) -> Dict[str, object]:
+        return {'num_perm': self.num_perm, 'bands': self.bands, 'shingle_size': self.shingle_size,
+                'threshold': self.threshold, 'seed': self.seed}
+
+    def _shingles(self, text: str) -> List[str]:
+        """소문자 단어 k-gram (단어 수가 k보다 적으면 전체를 하나로)"""
+        words = (text or '').lower().split()
+        k = self.shingle_size
+        if len(words) <= k:
+            return [' '.join(words)] if words else []
+        return [' '.join(words[i:i + k]) for i in range(len(words) - k + 1)]
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash 서명 (shingle이 없으면 모두 EMPTY_VALUE)"""
+        shingles = set(self._shingles(text))
+        if not shingles:
+            return np.full(self.num_perm, EMPTY_VALUE, dtype=np.uint32)
+        hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles),
+                             dtype=np.uint64, count=len(shingles)) % MERSENNE_PRIME
+        permuted = (hashes[:, np.newaxis] * self._a + self._b) % MERSENNE_PRIME
+        return permuted.min(axis=0).astype(np.uint32)
+
+    def signatures_for(self, texts: Iterable[str]) -> np.ndarray:
+        rows = [self.signature(text) for text in texts]
+        return np.vstack(rows) if rows else np.zeros((0, self.num_perm), dtype=np.uint32)
+
+    def update(self, job_ids: Iterable[int], texts: Iterable[str],
+               removed_job_ids: Iterable[int] = ()) -> Dict[str, int]:
+        """새 공고 서명 추가, 변경 공고 서명 교체 및 삭제된 공고 제거
+
+        변경 공고는 제자리에서 교체해 순서(= 대표 우선순위)를 유지한다.
+        수정된 대표 공고가 대표 자리를 잃으면 중복 공고의 클러스터와 복사된 추출 결과가 함께 흔들린다.
+        """
+        job_ids = np.asarray(list(job_ids), dtype=np.int64)
+        new_signatures = self.signatures_for(texts)
+        removed = np.isin(self.job_ids, np.fromiter(removed_job_ids, dtype=np.int64))
+        position_by_id = {int(job_id): position for position, job_id in enumerate(self.job_ids)}
+        positions = np.fromiter((position_by_id.get(int(job_id), -1) for job_id in job_ids),
+                                dtype=np.int64, count=len(job_ids))
+        replaced = positions >= 0
+        self.signatures = self.signatures.copy()
+        self.signatures[positions[replaced]] = new_signatures[replaced]
+        changed = int(replaced.sum())
+
+        self.job_ids = np.concatenate([self.job_ids[~removed], job_ids[~replaced]])
+        self.signatures = np.vstack([self.signatures[~removed], new_signatures[~replaced]])
+        return {'documents': self.n_documents, 'added': len(job_ids) - changed,
+                'changed': changed, 'removed': int(removed.sum())}
+
+    def _buckets(self) -> Iterable[List[int]]:
+        """band별로 같은 버킷에 들어간 행 묶음 (빈 텍스트 행은 제외)"""
+        rows_per_band = self.num_perm // self.bands
+        indexed = np.flatnonzero((self.signatures != EMPTY_VALUE).any(axis=1))
+        for band in range(self.bands):
+            band_values = self.signatures[indexed, band * rows_per_band:(band + 1) * rows_per_band]
+            buckets = defaultdict(list)
+            for position, key in zip(indexed, map(bytes, band_values)):
+                buckets[key].append(int(position))
+            yield from (members for members in buckets.values() if len(members) > 1)
+
+    def similarity(self, first: int, second: int) -> float:
+        """두 행의 추정 Jaccard 유사도 (서명 일치율)"""
+        return float((self.signatures[first] == self.signatures[second]).mean())
+
+    def clusters(self) -> Dict[int, int]:
+        """job_id → 클러스터 id (대표 공고 job_id)"""
+        parent = list(range(self.n_documents))
+
+        def find(position):
+            while parent[position] != position:
+                parent[position] = parent[parent[position]]
+                position = parent[position]
+            return position
+
+        for members in self._buckets():
+            for i, first in enumerate(members):
+                for second in members[i + 1:]:
+                    root_first, root_second = find(first), find(second)
+                    # 이미 같은 클러스터면 비교 생략
+                    if root_first == root_second or self.similarity(first, second) < self.threshold:
+                        continue
+                    # 먼저 인덱스에 들어온 행을 대표로 유지
+                    parent[max(root_first, root_second)] = min(root_first, root_second)
+
+        return {int(job_id): int(self.job_ids[find(position)])
+                for position, job_id in enumerate(self.job_ids)}
+
+    def save(self, writer):
+        """아티팩트로 저장 (ArtifactWriter)"""
+        writer.add_json('dedup_params', self.params)
+        writer.add_array('dedup_job_ids', self.job_ids)
+        writer.add_array('dedup_signatures', self.signatures)
+
+    @classmethod
+    def load(cls, store) -> 'NearDuplicateIndex':
+        """아티팩트에서 불러오기 (ArtifactStore)"""
+        index = cls(**store.load_json('dedup_params'))
+        index.job_ids = store.load_array('dedup_job_ids', mmap=False)
+        index.signatures = store.load_array('dedup_signatures', mmap=False)
+        return index
+
+    @staticmethod
+    def cluster_summary(clusters: Dict[int, int]) -> str:
+        """클러스터 요약 문자열"""
+        sizes = defaultdict(int)
+        for cluster_id in clusters.values():
+            sizes[cluster_id] += 1
+        duplicate_clusters = [size for size in sizes.values() if size > 1]
+        return (f"공고 {len(clusters)}개 중 중복 {sum(duplicate_clusters) - len(duplicate_clusters)}개 "
+                f"(중복 클러스터 {len(duplicate_clusters)}개, 최대 크기 {max(duplicate_clusters, default=1)})")
@@ -0,0 +1,171 @@
+"""
+단계별 ETL 실행 상태
+
+공고별로 각 단계(정제 → 토큰화 → 중복 탐지 → TF-IDF → 임베딩 → 저장 → LLM 추출)의 입력 해시와
+출력 버전(결과를 만든 실행 번호)을 stage_state 테이블에 기록한다.
+다시 실행하면 입력 해시가 바뀐 공고만 해당 단계를 실행하고 나머지는 저장된 결과를 쓴다.
+
+입력 해시에는 단계 버전(코드/사전/설정 지문)이 포함되므로,
+단계 로직이 바뀌면 버전만 올려서 해당 단계를 전체 공고에 다시 적용할 수 있다.
+"""
+import hashlib
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from scripts.db_writer import BatchWriter, select_in
+from scripts.run_report import peak_rss_mb
+
+CREATE_STAGE_STATE_SQL = '''
+CREATE TABLE IF NOT EXISTS stage_state (
+    stage TEXT NOT NULL,
+    job_id INTEGER NOT NULL,
+    input_hash TEXT NOT NULL,
+    output_version INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (stage, job_id)
+)
+'''
+
+RECORD_STAGE_SQL = '''
+    INSERT INTO stage_state (stage, job_id, input_hash, output_version, updated_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(stage, job_id) DO UPDATE SET
+        input_hash = excluded.input_hash,
+        output_version = excluded.output_version,
+        updated_at = excluded.updated_at
+'''
+
+DELETE_STAGE_SQL = 'DELETE FROM stage_state WHERE job_id = ?'
+
+# 실행 번호 발급 (AUTOINCREMENT: 아무것도 기록하지 않은 실행이나 삭제된 번호도 다시 쓰지 않음)
+CREATE_PIPELINE_RUNS_SQL = '''
+CREATE TABLE IF NOT EXISTS pipeline_runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL
+)
+'''
+
+FIELD_SEPARATOR = '\x1f'
+
+
+def content_hash(*parts) -> str:
+    """입력 값들의 내용 해시 (순서 유지, 16자리 hex)"""
+    text = FIELD_SEPARATOR.join('' if part is None else str(part) for part in parts)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+def create_stage_table(cursor: sqlite3.Cursor):
+    """단계 상태/실행 번호 테이블 생성 (존재하지 않는 경우에만)"""
+    cursor.execute(CREATE_STAGE_STATE_SQL)
+    cursor.execute(CREATE_PIPELINE_RUNS_SQL)
+
+
+class PipelineRun:
+    """파이프라인 1회 실행: 단계별 변경 판정, 상태 기록, 처리/건너뜀/소요 시간 리포트"""
+
+    def __init__(self, conn: sqlite3.Connection, stage_versions: Dict[str, object],
+                 force_stages: Iterable[str] = (), scope: Optional[Iterable[int]] = None):
+        self.conn = conn
+        self.stage_versions = stage_versions
+        self.force_stages = set(force_stages)
+        # 일부 공고만 처리하는 실행(마이크로 배치)은 해당 공고의 상태만 읽는다 (None이면 전체)
+        self.scope = None if scope is None else [int(job_id) for job_id in scope]
+        # 출력 버전 = 실행 번호 (pipeline_runs에서 발급, 변경 없는 실행도 번호를 하나 쓴다)
+        self.run_id = self._allocate_run_id()
+        self.report: Dict[str, Dict[str, Optional[float]]] = {}
+
+    def _allocate_run_id(self) -> int:
+        """새 실행 번호 (pipeline_runs가 없던 이전 DB는 기록된 출력 버전 다음 번호부터)"""
+        self.conn.execute(CREATE_PIPELINE_RUNS_SQL)
+        started_at = time.time()
+        run_id = self.conn.execute('INSERT INTO pipeline_runs (started_at) VALUES (?)', (started_at,)).lastrowid
+        last = 0
+        if run_id == 1:
+            # 첫 발급일 때만 확인 (이후 번호는 이어지므로 매 실행 stage_state 전체를 훑지 않는다)
+            last = self.conn.execute('SELECT MAX(output_version) FROM stage_state').fetchone()[0] or 0
+        if run_id <= last:
+            self.conn.execute('DELETE FROM pipeline_runs WHERE run_id = ?', (run_id,))
+            run_id = self.conn.execute('INSERT INTO pipeline_runs (run_id, started_at) VALUES (?, ?)',
+                                       (last + 1, started_at)).lastrowid
+        self.conn.commit()
+        return run_id
+
+    def hashes(self, stage: str, columns: Sequence[Iterable]) -> List[str]:
+        """공고별 단계 입력 해시 (단계 버전 포함)"""
+        version = self.stage_versions[stage]
+        return [content_hash(stage, version, *values) for values in zip(*columns)]
+
+    def stored_hashes(self, stage: str) -> Dict[int, str]:
+        if self.scope is None:
+            rows = self.conn.execute('SELECT job_id, input_hash FROM stage_state WHERE stage = ?', (stage,))
+            return dict(rows.fetchall())
+        return dict(select_in(self.conn, 'SELECT job_id, input_hash FROM stage_state '
+                                         'WHERE stage = ? AND job_id IN ({})', self.scope, (stage,)))
+
+    def changed(self, stage: str, job_ids: Sequence[int], hashes: Sequence[str],
+                missing: Optional[np.ndarray] = None) -> np.ndarray:
+        """입력이 바뀐 공고 마스크 (강제 실행 단계면 전체, missing=True인 공고는 항상 포함)"""
+        if stage in self.force_stages:
+            return np.ones(len(job_ids), dtype=bool)
+        stored = self.stored_hashes(stage)
+        mask = np.fromiter((stored.get(int(job_id)) != input_hash
+                            for job_id, input_hash in zip(job_ids, hashes)),
+                           dtype=bool, count=len(job_ids))
+        return mask | missing if missing is not None else mask
+
+    def statement(self, stage: str, job_id: int, input_hash: str):
+        """단계 상태 기록 SQL과 파라미터 (결과 쓰기와 같은 트랜잭션에 넣는다)"""
+        return RECORD_STAGE_SQL, (stage, int(job_id), input_hash, self.run_id, time.time())
+
+    def record(self, writer: BatchWriter, stage: str, job_ids: Iterable[int], hashes: Iterable[str]):
+        """처리한 공고의 단계 상태 기록"""
+        for job_id, input_hash in zip(job_ids, hashes):
+            writer.add(*self.statement(stage, job_id, input_hash))
+
+    def forget(self, writer: BatchWriter, job_ids: Iterable[int]):
+        """삭제된 공고의 단계 상태 제거"""
+        writer.add_many(DELETE_STAGE_SQL, ((int(job_id),) for job_id in job_ids))
+
+    @contextmanager
+    def stage(self, name: str, total: int) -> Iterator[Dict[str, Optional[float]]]:
+        """단계 실행 구간 (yield된 딕셔너리의 processed를 채우면 나머지는 건너뜀으로 집계)"""
+        entry = {'processed': 0, 'skipped': 0, 'seconds': 0.0, 'cpu_seconds': 0.0, 'peak_rss_mb': None}
+        self.report[name] = entry
+        start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield entry
+        finally:
+            entry['seconds'] = time.perf_counter() - start
+            entry['cpu_seconds'] = time.process_time() - cpu_start
+            entry['skipped'] = max(0, total - entry['processed'])
+            entry['peak_rss_mb'] = peak_rss_mb()
+
+    def as_dict(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """단계별 리포트 (처리 속도와 CPU 사용률 포함, 시간은 소수 셋째 자리까지)"""
+        stages = {}
+        for name, entry in self.report.items():
+            seconds = entry['seconds']
+            stages[name] = {
+                'processed': entry['processed'],
+                'skipped': entry['skipped'],
+                'seconds': round(seconds, 3),
+                'rows_per_second': round(entry['processed'] / seconds, 1) if seconds else None,
+                'cpu_seconds': round(entry['cpu_seconds'], 3),
+                'cpu_utilization': round(entry['cpu_seconds'] / seconds, 3) if seconds else None,
+                'peak_rss_mb': entry['peak_rss_mb'],
+            }
+        return stages
+
+    def summary(self) -> str:
+        """단계별 처리/건너뜀/소요 시간 표"""
+        # 한글 머리글은 글자당 두 칸을 차지하므로 폭을 줄여 맞춘다
+        lines = [f"{'단계':<8}{'처리':>6}{'건너뜀':>5}{'소요(초)':>8}{'행/초':>8}"]
+        for name, entry in self.as_dict().items():
+            rate = entry['rows_per_second']
+            rate_text = f"{rate:>10.0f}" if rate is not None else f"{'-':>10}"
+            lines.append(f"{name:<10}{entry['processed']:>8}{entry['skipped']:>8}{entry['seconds']:>10.2f}{rate_text}")
+        return '\n'.join(lines)
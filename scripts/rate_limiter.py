@@ -0,0 +1,161 @@
+"""
+비동기 멀티 윈도우 토큰 버킷 레이트 리미터
+분/시간/일 단위의 요청 수·토큰 수 한도를 동시에 적용한다.
+"""
+import asyncio
+import time
+from typing import Dict, Optional
+
+WINDOW_SECONDS = {
+    'minute': 60,
+    'hour': 3600,
+    'day': 86400
+}
+
+
+class TokenBucket:
+    """연속 충전 토큰 버킷 (용량 = 윈도우 한도, 충전 속도 = 한도 / 윈도우 길이)"""
+
+    def __init__(self, capacity: float, window_seconds: float):
+        self.capacity = float(capacity)
+        self.refill_rate = self.capacity / window_seconds
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float):
+        """경과 시간만큼 충전"""
+        elapsed = max(0.0, now - self.updated)
+        self.level = min(self.capacity, self.level + elapsed * self.refill_rate)
+        self.updated = now
+
+    def time_until(self, amount: float, now: float) -> float:
+        """amount 만큼 소비 가능해질 때까지 남은 시간 (초)"""
+        self.refill(now)
+        # 용량보다 큰 요청은 버킷이 가득 찼을 때 허용
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.refill_rate
+
+    def consume(self, amount: float):
+        """소비 (실사용량 보정 시 음수 잔량 = 다음 요청이 갚아야 할 부채)"""
+        self.level = min(self.capacity, self.level - amount)
+
+
+class AsyncRateLimiter:
+    """요청/토큰 × 분/시간/일 한도를 적용하는 비동기 레이트 리미터
+
+    대기자는 도착 순서(FIFO)대로 통과하며, 대기는 asyncio.sleep으로 처리되어
+    이벤트 루프를 막지 않는다. 토큰 수는 요청 전에는 추정치로 차감하고,
+    응답의 usage 값으로 차이를 보정한다.
+    """
+
+    def __init__(self, limits: Dict[str, Dict[str, int]]):
+        self._buckets = {
+            (kind, window): TokenBucket(limit, WINDOW_SECONDS[window])
+            for kind, windows in limits.items()
+            for window, limit in windows.items()
+        }
+        # 이벤트 루프에 묶이지 않도록 첫 사용 시 생성 (루프가 바뀌면 다시 생성)
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop = None
+
+        # 추정 토큰 보정 계수 (실사용량 / 추정치의 지수 이동 평균)
+        self.estimate_scale = 1.0
+        self._ema_alpha = 0.2
+
+        self.reset_stats()
+
+    def reset_stats(self):
+        """실행 단위 통계 초기화 (버킷 잔량과 보정 계수는 유지)"""
+        self.acquired = 0
+        self.refunded = 0
+        self.wait_seconds = 0.0
+        self.tokens_estimated = 0
+        self.tokens_used = 0
+
+    def scaled_estimate(self, raw_estimate: int) -> int:
+        """과거 응답의 usage 기준으로 보정한 토큰 추정치"""
+        return max(1, int(round(raw_estimate * self.estimate_scale)))
+
+    async def acquire(self, raw_estimate: int) -> int:
+        """요청 1건 + 추정 토큰을 확보할 때까지 대기 후 차감
+
+        Returns:
+            차감한 토큰 수 (reconcile 호출 시 그대로 전달)
+        """
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            # 연속 수집처럼 asyncio.run을 여러 번 호출해도 버킷 잔량은 유지하고 락만 새 루프에서 만든다
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+
+        tokens = self.scaled_estimate(raw_estimate)
+        waited = 0.0
+        # 선두 대기자만 버킷을 확인하고 나머지는 락 대기열에서 순서대로 기다린다
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                wait_time, window = 0.0, None
+                for (kind, name), bucket in self._buckets.items():
+                    amount = 1 if kind == 'requests' else tokens
+                    needed = bucket.time_until(amount, now)
+                    if needed > wait_time:
+                        wait_time, window = needed, f"{name} {kind}"
+                if wait_time <= 0:
+                    break
+                if wait_time >= 1:
+                    print(f"\n{window} 한도 도달. {wait_time:.1f}초 대기 중...")
+                await asyncio.sleep(wait_time)
+                waited += wait_time
+
+            for (kind, _), bucket in self._buckets.items():
+                bucket.consume(1 if kind == 'requests' else tokens)
+
+        self.acquired += 1
+        self.wait_seconds += waited
+        self.tokens_estimated += tokens
+        return tokens
+
+    def refund(self, charged_tokens: int):
+        """보내지 못한 요청의 차감량(요청 1건 + 추정 토큰) 반환 (재시도가 한도를 두 번 쓰지 않도록)"""
+        now = time.monotonic()
+        for (kind, _), bucket in self._buckets.items():
+            bucket.refill(now)
+            bucket.consume(-(1 if kind == 'requests' else charged_tokens))
+
+        self.refunded += 1
+        self.tokens_estimated -= charged_tokens
+
+    def reconcile(self, charged_tokens: int, actual_tokens: Optional[int]):
+        """응답 usage 기준으로 토큰 차감량 보정"""
+        if not actual_tokens:
+            return
+        delta = actual_tokens - charged_tokens
+        now = time.monotonic()
+        for (kind, _), bucket in self._buckets.items():
+            if kind == 'tokens':
+                bucket.refill(now)
+                bucket.consume(delta)
+
+        self.tokens_used += actual_tokens
+        # 추정 오차를 다음 추정에 반영
+        ratio = actual_tokens / max(1, charged_tokens / self.estimate_scale)
+        self.estimate_scale += self._ema_alpha * (ratio - self.estimate_scale)
+
+    def as_dict(self) -> Dict[str, float]:
+        """리포트용 딕셔너리"""
+        return {
+            'acquired': self.acquired,
+            'refunded': self.refunded,
+            'wait_seconds': round(self.wait_seconds, 3),
+            'tokens_estimated': self.tokens_estimated,
+            'tokens_used': self.tokens_used,
+            'estimate_scale': round(self.estimate_scale, 3),
+        }
+
+    def summary(self) -> str:
+        """레이트 리미터 통계 요약 문자열"""
+        return (f"요청 {self.acquired}건 (반환 {self.refunded}건), 대기 {self.wait_seconds:.1f}초, "
+                f"토큰 사용 {self.tokens_used:,} (추정 {self.tokens_estimated:,}, "
+                f"보정 계수 {self.estimate_scale:.2f})")
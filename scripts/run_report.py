@@ -0,0 +1,63 @@
+"""
+ETL 실행 리포트 (JSON)
+
+process_data 1회 실행의 성능 지표를 파일 하나로 남긴다.
+    - 수집 변경 (신규/변경/삭제/동일 공고 수)
+    - 단계별 처리/건너뜀 공고 수, 소요 시간, 처리 속도(행/초), CPU 사용률(CPU 시간 / 소요 시간)
+    - 프로세스 최대 메모리(peak RSS, 단계 종료 시점까지의 최댓값)
+    - LLM 요청 수, 오류/재시도 분류, 토큰 사용량, 지연 시간 백분위수/히스토그램
+    - 레이트 리미터 대기 시간
+
+CPU 사용률이 1에 가까운 단계는 CPU 병목이다. LLM 단계에서 리미터 대기 비중이 크면 한도(quota) 병목,
+둘 다 낮은데 요청 지연이 길면 네트워크/서버 병목으로 본다.
+"""
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Dict, Optional
+
+
+def peak_rss_mb() -> Optional[float]:
+    """현재 프로세스의 최대 RSS (MB, resource 모듈이 없는 Windows는 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return round(peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024, 1)
+
+
+def build_run_report(run, elapsed: float, llm_stats=None, rate_limiter=None,
+                     ingest: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+    """파이프라인 실행(PipelineRun), 수집 변경(신규/변경/삭제/동일), LLM/리미터 통계로 리포트 구성"""
+    stages = run.as_dict()
+    report = {
+        'run_id': run.run_id,
+        'finished_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'elapsed_seconds': round(elapsed, 3),
+        'peak_rss_mb': peak_rss_mb(),
+        'python': platform.python_version(),
+        'cpu_count': os.cpu_count(),
+        'ingest': ingest,
+        'stages': stages,
+        'llm': llm_stats.as_dict() if llm_stats is not None else None,
+        'rate_limiter': rate_limiter.as_dict() if rate_limiter is not None else None,
+    }
+    llm_seconds = stages.get('llm', {}).get('seconds')
+    if rate_limiter is not None and llm_seconds:
+        # LLM 단계 소요 시간 중 한도 대기 비중 (동시 요청의 대기 시간 합이라 1을 넘을 수 있다)
+        report['rate_limiter']['wait_share'] = round(rate_limiter.wait_seconds / llm_seconds, 3)
+    return report
+
+
+def write_run_report(report: Dict[str, Any], path: str) -> str:
+    """리포트를 JSON 파일로 저장하고 경로 반환"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return path
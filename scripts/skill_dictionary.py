@@ -0,0 +1,189 @@
+"""
+사전 기반 기술 스택 추출 (LLM 호출 전 빠른 경로)
+
+공고의 토큰이 모두 알려진 어휘(기술 키워드 별칭, 불용어, 이전 LLM 결과로 학습한 토큰)로
+해석되면 LLM 없이 결정적으로 기술 스택을 만들고, 모르는 후보 토큰이 있는 공고만 LLM에 보낸다.
+"""
+import os
+import sqlite3
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+
+class TokenVocabulary:
+    """LLM 결과로 학습한 토큰별 관측 통계 (SQLite 파일)
+
+    토큰이 LLM 결과에 기술 스택으로 포함된 횟수와 제외된 횟수를 누적한다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS token_vocabulary (
+                token TEXT PRIMARY KEY,
+                tech_count INTEGER NOT NULL,
+                non_tech_count INTEGER NOT NULL,
+                skill TEXT,
+                updated_at REAL NOT NULL
+            )
+        ''')
+        self.conn.commit()
+
+        # 토큰(소문자) -> [기술 스택 횟수, 제외 횟수, LLM이 돌려준 표기]
+        self.entries: Dict[str, list] = {
+            token: [tech_count, non_tech_count, skill]
+            for token, tech_count, non_tech_count, skill in self.conn.execute(
+                'SELECT token, tech_count, non_tech_count, skill FROM token_vocabulary'
+            )
+        }
+        self._dirty = set()
+
+    def observe(self, tokens: Iterable[str], tech_skills: List[str]):
+        """LLM 입력 토큰과 추출 결과로 토큰별 통계 갱신"""
+        skill_by_key = {
+            skill.strip().lower(): skill.strip()
+            for skill in tech_skills if isinstance(skill, str) and skill.strip()
+        }
+        for key in {token.strip().lower() for token in tokens if token and token.strip()}:
+            entry = self.entries.setdefault(key, [0, 0, None])
+            if key in skill_by_key:
+                entry[0] += 1
+                entry[2] = skill_by_key[key]
+            else:
+                entry[1] += 1
+            self._dirty.add(key)
+
+    def label(self, key: str, min_observations: int, min_confidence: float) -> Optional[str]:
+        """관측 통계로 토큰 판정: 'tech' | 'non_tech' | 'ambiguous' | None(관측 부족)"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        tech_count, non_tech_count, _ = entry
+        total = tech_count + non_tech_count
+        if total < min_observations:
+            return None
+        if tech_count / total >= min_confidence:
+            return 'tech'
+        if non_tech_count / total >= min_confidence:
+            return 'non_tech'
+        return 'ambiguous'
+
+    def skill(self, key: str) -> Optional[str]:
+        """LLM이 돌려준 기술 스택 표기"""
+        entry = self.entries.get(key)
+        return entry[2] if entry else None
+
+    def save(self):
+        """변경된 토큰 통계 기록"""
+        if not self._dirty:
+            return
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO token_vocabulary '
+                '(token, tech_count, non_tech_count, skill, updated_at) VALUES (?, ?, ?, ?, ?)',
+                [(key, *self.entries[key], now) for key in self._dirty]
+            )
+        self._dirty.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def close(self):
+        self.save()
+        self.conn.close()
+
+
+class DictionarySkillExtractor:
+    """별칭 사전 + 학습 어휘 기반 결정적 기술 스택 추출기
+
+    학습 어휘의 판정이 충분한 관측과 신뢰도를 갖춘 경우에만 사전보다 우선한다.
+    """
+
+    def __init__(self, tech_keywords: Iterable[str], stopwords: Iterable[str],
+                 vocabulary: Optional[TokenVocabulary] = None,
+                 min_observations: int = 3, min_confidence: float = 0.95):
+        # 소문자 별칭 -> 사전 표기
+        self.aliases = {keyword.lower(): keyword for keyword in tech_keywords}
+        self.stopwords = {word.lower() for word in stopwords}
+        self.vocabulary = vocabulary
+        self.min_observations = min_observations
+        self.min_confidence = min_confidence
+        self.reset_stats()
+
+    def reset_stats(self):
+        """실행 단위 통계 초기화"""
+        self.resolved = 0
+        self.deferred = 0
+        self.unknown_tokens = Counter()
+
+    def _label(self, key: str) -> Optional[str]:
+        if self.vocabulary is None:
+            return None
+        return self.vocabulary.label(key, self.min_observations, self.min_confidence)
+
+    def resolve(self, tokens: Iterable[str]) -> Optional[List[str]]:
+        """모든 토큰이 해석되면 기술 스택 목록, 모르는 후보 토큰이 있으면 None"""
+        skills = {}
+        unknown = []
+        for token in tokens:
+            key = token.strip().lower() if isinstance(token, str) else ''
+            if not key:
+                continue
+
+            label = self._label(key)
+            if label == 'tech':
+                skill = self.vocabulary.skill(key) or self.aliases.get(key, token.strip())
+                skills.setdefault(skill.lower(), skill)
+            elif label == 'non_tech':
+                continue
+            elif label == 'ambiguous':
+                # LLM 판정이 엇갈린 토큰은 사전에 있어도 LLM에 맡긴다
+                unknown.append(token)
+            elif key in self.aliases:
+                skills.setdefault(key, self.aliases[key])
+            elif key not in self.stopwords:
+                unknown.append(token)
+
+        # 기술 스택이 하나도 없는 결과는 LLM 결과 검증 기준과 같이 미해석으로 본다
+        if unknown or not skills:
+            self.deferred += 1
+            self.unknown_tokens.update(unknown)
+            return None
+
+        self.resolved += 1
+        return sorted(skills.values())
+
+    def observe(self, tokens: Iterable[str], tech_skills: List[str]):
+        """LLM 결과를 학습 어휘에 반영"""
+        if self.vocabulary is not None:
+            self.vocabulary.observe(tokens, tech_skills)
+
+    @property
+    def resolved_rate(self) -> float:
+        """이번 실행에서 로컬로 해석한 비율 (캐시 적중 제외)"""
+        total = self.resolved + self.deferred
+        return self.resolved / total if total else 0.0
+
+    def summary(self) -> str:
+        """사전 추출 통계 요약 문자열"""
+        vocabulary_size = len(self.vocabulary) if self.vocabulary is not None else 0
+        top_unknown = ", ".join(token for token, _ in self.unknown_tokens.most_common(5))
+        return (f"로컬 해석 {self.resolved}건 / LLM 전달 {self.deferred}건 "
+                f"(로컬 해석 비율 {self.resolved_rate:.1%}), 학습 어휘 {vocabulary_size}개"
+                + (f", 미해석 상위 토큰: {top_unknown}" if top_unknown else ""))
+
+    def save(self):
+        """학습 어휘 기록"""
+        if self.vocabulary is not None:
+            self.vocabulary.save()
+
+    def close(self):
+        if self.vocabulary is not None:
+            self.vocabulary.close()
@@ -0,0 +1,72 @@
+"""
+공고 텍스트 정제 / 경력 연차 추출 (열 단위)
+
+JobDataProcessor._clean_text / _extract_years를 행마다 적용하던 것을 열 전체에 한 번에 적용한다.
+    - 정제: URL만 행별 정규식으로 지우고, 특수문자는 열 전체를 이어 붙인 문자열에서
+      문자별 str.replace로 공백 치환한 뒤(길이 유지) 행 구간으로 잘라 공백을 정리한다.
+    - 경력 연차: experience 표기는 종류가 적으므로 고유 값에서만 추출하고 행에 펼친다.
+결과는 행 단위 함수(clean_text / extract_years)와 같다.
+workers > 1이면 정제를 행 구간(chunk)별로 프로세스 풀에 나눠 처리한다.
+"""
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+URL_PATTERN = re.compile(r'https?://\S+|www\.\S+')
+SPECIAL_CHAR_PATTERN = re.compile(r'[^\w\s]')
+# "경력 3-5년" 같은 표기에서 첫 숫자(최소 연차)
+YEARS_PATTERN = re.compile(r'(\d+)[-~]?(\d+)?년?')
+
+
+def clean_text(text) -> str:
+    """텍스트 클린징: URL 제거, 특수문자 제거, 공백 정리"""
+    text = URL_PATTERN.sub('', str(text))
+    return ' '.join(SPECIAL_CHAR_PATTERN.sub(' ', text).split())
+
+
+def extract_years(experience_text) -> int:
+    """경력 연차 추출 (범위면 최소 연차, 신입/숫자 없음은 0)"""
+    if pd.isna(experience_text) or experience_text == '':
+        return 0
+    match = YEARS_PATTERN.search(str(experience_text))
+    return int(match.group(1)) if match else 0
+
+
+def _clean_chunk(texts: List[str]) -> List[str]:
+    """여러 텍스트 정제 (clean_text와 같은 결과)"""
+    texts = [URL_PATTERN.sub('', text) if '://' in text or 'www.' in text else text for text in texts]
+    joined = ''.join(texts)
+    # 특수문자 → 공백은 한 글자를 한 글자로 바꾸므로 행 경계(오프셋)가 유지된다
+    for char in set(joined):
+        if SPECIAL_CHAR_PATTERN.match(char):
+            joined = joined.replace(char, ' ')
+    ends = np.cumsum([len(text) for text in texts]).tolist()
+    return [' '.join(joined[start:end].split()) for start, end in zip([0] + ends, ends)]
+
+
+def clean_texts(texts: pd.Series, workers: int = 1, chunk_size: int = 20000) -> pd.Series:
+    """열 단위 텍스트 클린징 (clean_text와 같은 결과, 순서 유지)"""
+    values = texts.astype(str).tolist()
+    if workers <= 1 or len(values) <= chunk_size:
+        cleaned = _clean_chunk(values)
+    else:
+        chunks = [values[start:start + chunk_size] for start in range(0, len(values), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            cleaned = [text for chunk in pool.map(_clean_chunk, chunks) for text in chunk]
+    return pd.Series(cleaned, index=texts.index, dtype=object)
+
+
+def extract_years_column(experience: pd.Series) -> pd.Series:
+    """열 단위 경력 연차 추출 (extract_years와 같은 결과, 고유 표기만 정규식 적용)"""
+    codes, uniques = pd.factorize(experience)
+    # 결측값(code -1)은 마지막 0을 가리킨다
+    years = np.array([extract_years(value) for value in uniques] + [0], dtype=np.int64)
+    return pd.Series(years[codes], index=experience.index)
+
+
+def combined_posting_text(df: pd.DataFrame) -> pd.Series:
+    """정제 대상 텍스트: 직무 설명 + 자격 요건 + 우대 사항"""
+    return df['description'].astype(str) + ' ' + df['requirements'].astype(str) + ' ' + df['preferred'].astype(str)
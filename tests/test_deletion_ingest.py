@@ -0,0 +1,76 @@
+"""
+삭제만 있는 수집 회귀 테스트
+
+CSV에서 공고가 빠지기만 하고 신규/변경 공고가 없으면 TF-IDF 갱신에 빈 행렬이 들어간다.
+"""
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from config.settings import ETLConfig
+from scripts.data_processing import JobDataProcessor
+from scripts.incremental_tfidf import IncrementalTfidf
+from utils.artifacts import ArtifactStore
+
+
+class FakeOkt:
+    """형태소 분석기 대역 (JVM 없이 한글 어절을 명사로)"""
+
+    def nouns(self, text):
+        return [word for word in text.split() if not word.isascii()]
+
+
+def _postings(n):
+    skills = ['Python', 'Java', 'React', 'Docker', 'AWS', 'Kafka']
+    return pd.DataFrame([{
+        'job_id': job_id, 'title': f'백엔드 개발자 {job_id}', 'company': f'회사{job_id}', 'location': '서울',
+        'experience': '경력 3년',
+        'description': f'서비스 개발 {skills[job_id % 6]} {skills[(job_id + 1) % 6]} 항목{job_id} 업무{job_id % 4}',
+        'requirements': f'{skills[job_id % 6]} 경험', 'preferred': '우대', 'job_type': '정규직'
+    } for job_id in range(1, n + 1)])
+
+
+def test_tfidf_update_with_only_removals():
+    model = IncrementalTfidf(min_df=1, max_df=1.0)
+    model.update([1, 2, 3], ['python django', 'java spring', 'python kafka'])
+
+    report = model.update([], [], removed_job_ids=[2])
+
+    assert report['removed'] == 1
+    assert model.job_ids.tolist() == [1, 3]
+    assert model.vectors.shape == (2, len(model.vocabulary))
+    np.testing.assert_allclose(np.linalg.norm(model.vectors.toarray(), axis=1), 1.0)
+
+    model.update([], [], removed_job_ids=[1, 3])
+    assert model.vectors.shape[0] == 0
+
+
+def test_ingest_with_only_deleted_postings(tmp_path, monkeypatch):
+    monkeypatch.setenv('CEREBRAS_API_KEY', '')
+    for name, value in {
+        'ARTIFACT_DIR': str(tmp_path / 'artifacts'), 'RUN_REPORT_DIR': str(tmp_path / 'reports'),
+        'RELOAD_STAMP_PATH': str(tmp_path / 'reload_stamp.json'), 'LLM_CACHE_PATH': str(tmp_path / 'llm_cache.db'),
+        'EMBEDDING_ENABLED': False, 'LOCAL_EXTRACTION_ENABLED': False,
+    }.items():
+        monkeypatch.setattr(ETLConfig, name, value)
+    csv_path, db_path = tmp_path / 'jobs.csv', tmp_path / 'jobs.db'
+
+    def run(postings):
+        postings.to_csv(csv_path, index=False)
+        processor = JobDataProcessor(csv_path=str(csv_path), db_path=str(db_path))
+        processor._okt = FakeOkt()
+        processor.create_database()
+        return processor.process_data()
+
+    postings = _postings(60)
+    run(postings)
+    report = run(postings[postings['job_id'] != 7])
+
+    assert report['stages']['tfidf']['processed'] == 0
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute('SELECT COUNT(*) FROM jobs WHERE job_id = 7').fetchone()[0] == 0
+        assert conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0] == 59
+    tfidf = IncrementalTfidf.load(ArtifactStore(ETLConfig.ARTIFACT_DIR))
+    assert 7 not in tfidf.job_ids.tolist()
+    assert tfidf.vectors.shape[0] == 59
@@ -0,0 +1,88 @@
+"""
+중복 공고 추출 결과 전파 회귀 테스트
+
+대표 공고가 수정되어 다시 추출되면 중복 공고도 대표의 새 결과를 복사받는지 확인한다.
+"""
+import json
+import random
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from config.settings import ETLConfig
+from scripts.data_processing import JobDataProcessor
+from scripts.mock_llm_server import MockLLMServer
+
+
+class FakeOkt:
+    """형태소 분석기 대역 (JVM 없이 한글 어절을 명사로)"""
+
+    def nouns(self, text):
+        return [word for word in text.split() if not word.isascii()]
+
+
+def _postings(n):
+    rng = random.Random(0)
+    words = [f'업무{i}' for i in range(300)]
+    skills = ['Python', 'Java', 'React', 'Docker', 'AWS', 'Spring']
+    postings = pd.DataFrame([{
+        'job_id': job_id, 'title': f'백엔드 개발자 {job_id}', 'company': f'회사{job_id}', 'location': '서울',
+        'experience': '경력 3년',
+        'description': ' '.join(rng.choices(words, k=60)) + f' {skills[job_id % 6]} {skills[(job_id + 1) % 6]}',
+        'requirements': f'{skills[job_id % 6]} 경험', 'preferred': '우대', 'job_type': '정규직'
+    } for job_id in range(1, n + 1)])
+    # 100번은 1번을 그대로 옮겨 올린 중복 공고
+    duplicate = postings.iloc[[0]].assign(job_id=100, company='회사100')
+    return pd.concat([postings, duplicate], ignore_index=True)
+
+
+@pytest.fixture
+def mock_llm(monkeypatch):
+    server = MockLLMServer(latency='fixed:0.01', seed=1).start()
+    monkeypatch.setenv('CEREBRAS_API_KEY', 'test')
+    monkeypatch.setenv('CEREBRAS_BASE_URL', server.base_url)
+    yield server
+    server.stop()
+
+
+@pytest.mark.parametrize('micro_batch', [False, True])
+def test_duplicate_follows_edited_representative(tmp_path, monkeypatch, mock_llm, micro_batch):
+    for name, value in {
+        'ARTIFACT_DIR': str(tmp_path / 'artifacts'), 'RUN_REPORT_DIR': str(tmp_path / 'reports'),
+        'RELOAD_STAMP_PATH': str(tmp_path / 'reload_stamp.json'), 'LLM_CACHE_PATH': str(tmp_path / 'llm_cache.db'),
+        'LLM_CACHE_ENABLED': False, 'EMBEDDING_ENABLED': False, 'LOCAL_EXTRACTION_ENABLED': False,
+    }.items():
+        monkeypatch.setattr(ETLConfig, name, value)
+    csv_path, db_path = tmp_path / 'jobs.csv', tmp_path / 'jobs.db'
+
+    def run(postings, micro_batch=False):
+        postings.to_csv(csv_path, index=False)
+        processor = JobDataProcessor(csv_path=str(csv_path), db_path=str(db_path))
+        processor._okt = FakeOkt()
+        processor.create_database()
+        if micro_batch:
+            return processor.process_data(postings=postings, delete_missing=False)
+        return processor.process_data()
+
+    def extracted(job_id):
+        with sqlite3.connect(db_path) as conn:
+            row = conn.execute('SELECT dup_cluster_id, llm_extracted_tech_skills FROM jobs WHERE job_id = ?',
+                               (job_id,)).fetchone()
+        return row[0], json.loads(row[1])
+
+    postings = _postings(30)
+    run(postings)
+    assert extracted(100) == extracted(1)
+    assert 'Kafka' not in extracted(1)[1]
+
+    edited = postings.copy()
+    edited.loc[edited['job_id'] == 1, 'description'] += ' Kafka'
+    run(edited[edited['job_id'] == 1] if micro_batch else edited, micro_batch)
+
+    cluster_id, skills = extracted(1)
+    assert cluster_id == 1 and 'Kafka' in skills
+    assert extracted(100) == (1, skills)
+
+    # 바뀐 것이 없으면 중복 공고도 다시 추출하지 않는다
+    assert run(edited)['stages']['llm']['processed'] == 0
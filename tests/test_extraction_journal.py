@@ -0,0 +1,73 @@
+"""
+추출 저널 재시도 회귀 테스트
+
+실패 결과가 시도 횟수 제한 없이 매 실행 다시 추출되지 않는지,
+다시 추출해도 결과가 그대로면 앱에 리로드 신호를 보내지 않는지 확인한다.
+"""
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from config.settings import ETLConfig
+from scripts.data_processing import JobDataProcessor
+from scripts.extraction_journal import create_journal_table, select_resumable_job_ids
+from scripts.mock_llm_server import MockLLMServer
+from utils.reload_stamp import read_reload_stamp
+
+
+class FakeOkt:
+    """형태소 분석기 대역 (JVM 없이 한글 어절을 명사로)"""
+
+    def nouns(self, text):
+        return [word for word in text.split() if not word.isascii()]
+
+
+def test_failed_and_degraded_capped_by_attempts():
+    conn = sqlite3.connect(':memory:')
+    create_journal_table(conn.cursor())
+    conn.executemany('INSERT INTO extraction_journal (job_id, status, attempts, created_at, updated_at) '
+                     'VALUES (?, ?, ?, 0, 0)',
+                     [(1, 'pending', 5), (2, 'failed', 1), (3, 'failed', 3),
+                      (4, 'degraded', 2), (5, 'degraded', 3), (6, 'done', 1)])
+
+    assert sorted(select_resumable_job_ids(conn, max_attempts=3)) == [1, 2, 4]
+
+
+@pytest.fixture
+def mock_llm(monkeypatch):
+    server = MockLLMServer(latency='fixed:0.01', seed=1).start()
+    monkeypatch.setenv('CEREBRAS_API_KEY', 'test')
+    monkeypatch.setenv('CEREBRAS_BASE_URL', server.base_url)
+    yield server
+    server.stop()
+
+
+def test_unchanged_retry_keeps_reload_stamp(tmp_path, monkeypatch, mock_llm):
+    for name, value in {
+        'ARTIFACT_DIR': str(tmp_path / 'artifacts'), 'RUN_REPORT_DIR': str(tmp_path / 'reports'),
+        'RELOAD_STAMP_PATH': str(tmp_path / 'reload_stamp.json'), 'LLM_CACHE_PATH': str(tmp_path / 'llm_cache.db'),
+        'LLM_CACHE_ENABLED': False, 'EMBEDDING_ENABLED': False, 'LOCAL_EXTRACTION_ENABLED': False,
+    }.items():
+        monkeypatch.setattr(ETLConfig, name, value)
+    csv_path, db_path = tmp_path / 'jobs.csv', tmp_path / 'jobs.db'
+    pd.DataFrame([{
+        'job_id': job_id, 'title': f'백엔드 개발자 {job_id}', 'company': f'회사{job_id}', 'location': '서울',
+        'experience': '경력 3년', 'description': f'서비스 개발 Python Kafka 항목{job_id}',
+        'requirements': 'Python 경험', 'preferred': '우대', 'job_type': '정규직'
+    } for job_id in range(1, 6)]).to_csv(csv_path, index=False)
+
+    def run():
+        processor = JobDataProcessor(csv_path=str(csv_path), db_path=str(db_path))
+        processor._okt = FakeOkt()
+        processor.create_database()
+        return processor.process_data()
+
+    run()
+    stamp = read_reload_stamp(ETLConfig.RELOAD_STAMP_PATH)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE extraction_journal SET status = 'failed' WHERE job_id = 3")
+
+    # 실패로 남은 공고는 다시 추출하지만 결과가 같으면 스탬프를 바꾸지 않는다
+    assert run()['stages']['llm']['processed'] == 1
+    assert read_reload_stamp(ETLConfig.RELOAD_STAMP_PATH) == stamp
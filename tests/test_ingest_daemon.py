@@ -0,0 +1,86 @@
+"""
+연속 수집 데몬 회귀 테스트
+
+깨진 추가 행이 데몬을 멈추지 않는지, 처리 위치가 아티팩트 저장 후에만 확정되는지 확인한다.
+"""
+import os
+
+from scripts.ingest_daemon import INPUT_COLUMNS, AppendOnlyCsvSource, IngestDaemon
+
+
+class FakeProcessor:
+    """JobDataProcessor 대역 (넘겨받은 배치와 저장/폐기 호출만 기록)"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.batches = []
+        self.flushes = 0
+        self.discards = 0
+
+    def process_data(self, postings, delete_missing, defer_artifacts):
+        if self.fail:
+            raise RuntimeError('처리 실패')
+        self.batches.append(postings['job_id'].tolist())
+
+    def flush_artifacts(self):
+        self.flushes += 1
+
+    def discard_artifacts(self):
+        self.discards += 1
+
+
+def _append(path, job_ids):
+    with open(path, 'a', encoding='utf-8') as f:
+        for job_id in job_ids:
+            f.write(f"{job_id},제목,회사,서울,신입,설명 {job_id},요건,우대,정규직\n")
+
+
+def _source(tmp_path, header=','.join(INPUT_COLUMNS)):
+    csv_path = tmp_path / 'stream.csv'
+    csv_path.write_text(header + '\n', encoding='utf-8')
+    return str(csv_path), AppendOnlyCsvSource(str(csv_path), str(tmp_path / 'state.json'))
+
+
+def test_malformed_append_keeps_offset(tmp_path):
+    csv_path, source = _source(tmp_path, header='job_id,title')
+    _append(csv_path, [1])
+    processor = FakeProcessor()
+    daemon = IngestDaemon(source, processor)
+
+    assert daemon.run_once() == 0
+    assert processor.batches == []
+    assert source.offset == 0
+    assert not os.path.exists(tmp_path / 'state.json')
+
+
+def test_offset_committed_only_after_flush(tmp_path):
+    csv_path, source = _source(tmp_path)
+    processor = FakeProcessor()
+    daemon = IngestDaemon(source, processor)
+
+    _append(csv_path, [1, 2])
+    assert daemon.run_once() == 2
+    assert source.offset == os.path.getsize(csv_path)
+    assert source.committed_offset == 0
+
+    daemon.flush()
+    assert processor.flushes == 1
+    assert AppendOnlyCsvSource(csv_path, str(tmp_path / 'state.json')).offset == os.path.getsize(csv_path)
+
+
+def test_failed_batch_rereads_unflushed_batches(tmp_path):
+    csv_path, source = _source(tmp_path)
+    processor = FakeProcessor()
+    daemon = IngestDaemon(source, processor)
+
+    _append(csv_path, [1])
+    daemon.run_once()
+    _append(csv_path, [2])
+    processor.fail = True
+    assert daemon.run_once() == 0
+    assert processor.discards == 1
+
+    # 저장 전이던 1번 배치부터 다시 읽는다
+    processor.fail = False
+    assert daemon.run_once() == 2
+    assert processor.batches[-1] == [1, 2]
@@ -0,0 +1,38 @@
+"""
+레이트 리미터 회귀 테스트
+
+보내지 못한 요청의 차감량을 돌려받아 재시도가 한도를 두 번 쓰지 않는지 확인한다.
+"""
+import asyncio
+
+from scripts.rate_limiter import AsyncRateLimiter
+
+
+def test_refund_restores_request_and_tokens():
+    limiter = AsyncRateLimiter({'requests': {'minute': 1}, 'tokens': {'minute': 100}})
+
+    async def send_twice():
+        charged = await limiter.acquire(80)
+        limiter.refund(charged)
+        # 돌려받았으므로 재시도는 기다리지 않는다
+        await asyncio.wait_for(limiter.acquire(80), timeout=1.0)
+
+    asyncio.run(send_twice())
+
+    assert limiter.acquired == 2
+    assert limiter.refunded == 1
+    assert limiter.wait_seconds == 0.0
+    assert limiter.tokens_estimated == 80
+
+
+def test_acquire_across_event_loops():
+    limiter = AsyncRateLimiter({'requests': {'minute': 600}})
+
+    async def burst():
+        await asyncio.gather(*(limiter.acquire(1) for _ in range(5)))
+
+    # 연속 수집처럼 asyncio.run을 여러 번 호출
+    asyncio.run(burst())
+    asyncio.run(burst())
+
+    assert limiter.acquired == 10
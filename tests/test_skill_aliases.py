@@ -0,0 +1,55 @@
+"""
+기술 스택 표기 정규화 회귀 테스트
+
+ETL 적재와 매처(사용자 입력)가 같은 대표 표기를 내는지, 버전 표기 제거가 기술을 바꾸지 않는지 확인한다.
+"""
+import pytest
+
+from utils.skill_aliases import canonicalize_skill
+
+# 숫자/대소문자 표기가 달라 ETL과 매처 결과가 갈렸던 입력
+MIXED_INPUTS = ['Swift5', 'OAuth2', 'GPT4', 'GPT-4', 'TLS1.3', 'matlab', 'C89', 'C99', 'Python3', 'Java 17']
+
+
+@pytest.mark.parametrize('skill, expected', [
+    ('Swift5', 'Swift'),
+    ('Python3', 'Python'),
+    ('Java 17', 'Java'),
+    ('Spring Boot 2.x', 'Spring'),
+    ('matlab', 'MATLAB'),
+    ('Laravel 9', 'Laravel 9'),
+    ('S3', 'S3'),
+    ('R2', 'R2'),
+])
+def test_release_suffix_stripped_only_for_known_skills(skill, expected):
+    assert canonicalize_skill(skill) == expected
+
+
+@pytest.mark.parametrize('skill, expected', [
+    ('C89', 'C89'),
+    ('C99', 'C99'),
+    ('OAuth2', 'OAuth2'),
+    ('OAuth 2.0', 'OAuth2'),
+    ('GPT4', 'GPT-4'),
+    ('GPT-4', 'GPT-4'),
+    ('TLS1.3', 'TLS 1.3'),
+])
+def test_versioned_skill_names_are_kept(skill, expected):
+    assert canonicalize_skill(skill) == expected
+
+
+def test_etl_and_matcher_canonicalize_alike(tmp_path, monkeypatch):
+    pytest.importorskip('streamlit')
+    from config.settings import ETLConfig
+    from models import job_matcher
+    from scripts.data_processing import JobDataProcessor
+
+    monkeypatch.setenv('CEREBRAS_API_KEY', '')
+    monkeypatch.setattr(ETLConfig, 'LLM_CACHE_PATH', str(tmp_path / 'llm_cache.db'))
+    processor = JobDataProcessor(csv_path=str(tmp_path / 'jobs.csv'), db_path=str(tmp_path / 'jobs.db'))
+
+    assert (processor.skill_canonicalizer.canonicalize_skills(MIXED_INPUTS)
+            == job_matcher.canonicalize_skills(MIXED_INPUTS))
+    assert ([processor.skill_canonicalizer.canonicalize(skill) for skill in MIXED_INPUTS]
+            == [canonicalize_skill(skill) for skill in MIXED_INPUTS])
+
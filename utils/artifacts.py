@@ -0,0 +1,244 @@
+"""
+버전별 배열 아티팩트 저장소
+
+model_data 테이블의 pickle BLOB 대신 모델 산출물을 버전 디렉터리에 파일로 저장한다.
+    - 희소 행렬(CSR): {name}.data.npy / {name}.indices.npy / {name}.indptr.npy
+    - 밀집 배열: {name}.npy
+    - 어휘/목록: {name}.txt (UTF-8, 한 줄에 하나)
+    - 설정/메타데이터: {name}.json
+
+디렉터리 구조:
+    ARTIFACT_DIR/
+        CURRENT              # 현재 버전 디렉터리 이름 (원자적 교체)
+        v000001/manifest.json
+        v000002/manifest.json
+        ...
+
+.npy 파일은 mmap으로 열 수 있으므로 행렬 전체를 메모리에 올리지 않고 행 구간만 읽을 수 있다.
+"""
+import json
+import os
+import re
+import shutil
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import scipy.sparse as sp
+
+MANIFEST_FILE = 'manifest.json'
+CURRENT_FILE = 'CURRENT'
+MANIFEST_FORMAT = 1
+VERSION_PATTERN = re.compile(r'^v(\d+)$')
+
+
+def _list_versions(root: str) -> List[str]:
+    """버전 디렉터리 이름 (오래된 순)"""
+    if not os.path.isdir(root):
+        return []
+    names = [name for name in os.listdir(root) if VERSION_PATTERN.match(name)]
+    return sorted(names, key=lambda name: int(VERSION_PATTERN.match(name).group(1)))
+
+
+def current_version(root: str) -> Optional[str]:
+    """CURRENT가 가리키는 버전 디렉터리 이름 (없으면 None)"""
+    try:
+        with open(os.path.join(root, CURRENT_FILE), encoding='utf-8') as f:
+            version = f.read().strip()
+    except FileNotFoundError:
+        return None
+    return version if os.path.isdir(os.path.join(root, version)) else None
+
+
+class ArtifactWriter:
+    """새 버전 아티팩트 작성
+
+    commit 전까지는 임시 디렉터리에 쓰고, commit 시 버전 디렉터리로 옮긴 뒤 CURRENT를 교체한다.
+    이번에 쓰지 않은 아티팩트는 현재 버전에서 그대로 이어받는다(하드 링크).
+    """
+
+    def __init__(self, root: str, keep_versions: int = 3):
+        self.root = root
+        self.keep_versions = max(1, keep_versions)
+        os.makedirs(root, exist_ok=True)
+
+        versions = _list_versions(root)
+        next_number = int(VERSION_PATTERN.match(versions[-1]).group(1)) + 1 if versions else 1
+        self.version = f"v{next_number:06d}"
+        self._tmp_dir = os.path.join(root, f".{self.version}.tmp")
+        shutil.rmtree(self._tmp_dir, ignore_errors=True)
+        os.makedirs(self._tmp_dir)
+        self.artifacts: Dict[str, Dict[str, Any]] = {}
+
+    def _path(self, filename: str) -> str:
+        return os.path.join(self._tmp_dir, filename)
+
+    def add_array(self, name: str, array: np.ndarray):
+        """밀집 배열 저장 (.npy)"""
+        array = np.ascontiguousarray(array)
+        np.save(self._path(f"{name}.npy"), array, allow_pickle=False)
+        self.artifacts[name] = {
+            'kind': 'array', 'files': [f"{name}.npy"],
+            'shape': list(array.shape), 'dtype': str(array.dtype)
+        }
+
+    def add_csr(self, name: str, matrix: sp.spmatrix):
+        """CSR 희소 행렬을 구성 배열별 .npy로 저장"""
+        matrix = sp.csr_matrix(matrix)
+        matrix.sort_indices()
+        files = []
+        for part in ('data', 'indices', 'indptr'):
+            filename = f"{name}.{part}.npy"
+            np.save(self._path(filename), getattr(matrix, part), allow_pickle=False)
+            files.append(filename)
+        self.artifacts[name] = {
+            'kind': 'csr', 'files': files, 'shape': list(matrix.shape),
+            'dtype': str(matrix.dtype), 'nnz': int(matrix.nnz)
+        }
+
+    def add_vocabulary(self, name: str, terms: Iterable[str]):
+        """문자열 목록을 한 줄에 하나씩 저장"""
+        terms = [str(term) for term in terms]
+        if any('\n' in term for term in terms):
+            raise ValueError(f"줄바꿈이 포함된 항목은 저장할 수 없습니다: {name}")
+        with open(self._path(f"{name}.txt"), 'w', encoding='utf-8') as f:
+            f.writelines(f"{term}\n" for term in terms)
+        self.artifacts[name] = {'kind': 'vocabulary', 'files': [f"{name}.txt"], 'size': len(terms)}
+
+    def add_json(self, name: str, value: Any):
+        """설정/메타데이터 저장"""
+        with open(self._path(f"{name}.json"), 'w', encoding='utf-8') as f:
+            json.dump(value, f, ensure_ascii=False, indent=2)
+        self.artifacts[name] = {'kind': 'json', 'files': [f"{name}.json"]}
+
+    def _carry_over(self):
+        """이번 버전에 쓰지 않은 아티팩트를 현재 버전에서 이어받기"""
+        base = current_version(self.root)
+        if base is None:
+            return
+        base_store = ArtifactStore(self.root, base)
+        for name, entry in base_store.manifest['artifacts'].items():
+            if name in self.artifacts:
+                continue
+            for filename in entry['files']:
+                source = os.path.join(base_store.path, filename)
+                try:
+                    os.link(source, self._path(filename))
+                except OSError:
+                    shutil.copy2(source, self._path(filename))
+            self.artifacts[name] = entry
+
+    def commit(self, metadata: Optional[Dict[str, Any]] = None) -> str:
+        """매니페스트 작성 후 새 버전으로 교체, 오래된 버전 정리"""
+        self._carry_over()
+        manifest = {
+            'format': MANIFEST_FORMAT,
+            'version': self.version,
+            'created_at': time.time(),
+            'metadata': metadata or {},
+            'artifacts': self.artifacts,
+        }
+        with open(self._path(MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+        os.rename(self._tmp_dir, os.path.join(self.root, self.version))
+        current_tmp = os.path.join(self.root, f"{CURRENT_FILE}.tmp")
+        with open(current_tmp, 'w', encoding='utf-8') as f:
+            f.write(self.version)
+        os.replace(current_tmp, os.path.join(self.root, CURRENT_FILE))
+
+        # mmap으로 열려 있는 파일은 삭제되어도 닫힐 때까지 유효하다
+        for old in _list_versions(self.root)[:-self.keep_versions]:
+            shutil.rmtree(os.path.join(self.root, old), ignore_errors=True)
+        return self.version
+
+    def abort(self):
+        """작성 중인 버전 폐기"""
+        shutil.rmtree(self._tmp_dir, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None or os.path.isdir(self._tmp_dir):
+            self.abort()
+        return False
+
+
+class ArtifactStore:
+    """아티팩트 읽기 (기본: CURRENT 버전)"""
+
+    def __init__(self, root: str, version: Optional[str] = None):
+        self.root = root
+        self.version = version or current_version(root)
+        if self.version is None:
+            raise FileNotFoundError(f"아티팩트가 없습니다: {root}")
+        self.path = os.path.join(root, self.version)
+        with open(os.path.join(self.path, MANIFEST_FILE), encoding='utf-8') as f:
+            self.manifest = json.load(f)
+
+    @classmethod
+    def open(cls, root: str) -> Optional['ArtifactStore']:
+        """현재 버전 열기 (없으면 None)"""
+        return cls(root) if current_version(root) is not None else None
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self.manifest.get('metadata', {})
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.manifest['artifacts']
+
+    def _entry(self, name: str, kind: str) -> Dict[str, Any]:
+        entry = self.manifest['artifacts'].get(name)
+        if entry is None:
+            raise KeyError(f"아티팩트가 없습니다: {name} ({self.version})")
+        if entry['kind'] != kind:
+            raise TypeError(f"{name}은(는) {entry['kind']} 아티팩트입니다")
+        return entry
+
+    def _load_npy(self, filename: str, mmap: bool) -> np.ndarray:
+        return np.load(os.path.join(self.path, filename), mmap_mode='r' if mmap else None,
+                       allow_pickle=False)
+
+    def load_array(self, name: str, mmap: bool = True) -> np.ndarray:
+        """밀집 배열 (mmap=True면 읽기 전용 메모리 맵)"""
+        entry = self._entry(name, 'array')
+        return self._load_npy(entry['files'][0], mmap)
+
+    def load_csr(self, name: str, rows: Optional[slice] = None, mmap: bool = True) -> sp.csr_matrix:
+        """CSR 행렬 (rows를 주면 해당 행 구간만 읽는다)"""
+        entry = self._entry(name, 'csr')
+        data_file, indices_file, indptr_file = entry['files']
+        n_rows, n_cols = entry['shape']
+        indptr = self._load_npy(indptr_file, mmap=True)
+        data = self._load_npy(data_file, mmap)
+        indices = self._load_npy(indices_file, mmap)
+
+        if rows is None:
+            if mmap:
+                return sp.csr_matrix((data, indices, indptr), shape=(n_rows, n_cols), copy=False)
+            return sp.csr_matrix((data, indices, np.array(indptr)), shape=(n_rows, n_cols))
+
+        start, stop, step = rows.indices(n_rows)
+        if step != 1:
+            raise ValueError("행 구간은 연속(step=1)이어야 합니다")
+        stop = max(start, stop)
+        row_indptr = np.array(indptr[start:stop + 1])
+        begin, end = (int(row_indptr[0]), int(row_indptr[-1])) if len(row_indptr) else (0, 0)
+        return sp.csr_matrix(
+            (np.array(data[begin:end]), np.array(indices[begin:end]), row_indptr - begin),
+            shape=(stop - start, n_cols)
+        )
+
+    def load_vocabulary(self, name: str) -> List[str]:
+        """문자열 목록"""
+        entry = self._entry(name, 'vocabulary')
+        with open(os.path.join(self.path, entry['files'][0]), encoding='utf-8') as f:
+            return [line.rstrip('\n') for line in f]
+
+    def load_json(self, name: str) -> Any:
+        """설정/메타데이터"""
+        entry = self._entry(name, 'json')
+        with open(os.path.join(self.path, entry['files'][0]), encoding='utf-8') as f:
+            return json.load(f)
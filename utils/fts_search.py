@@ -0,0 +1,127 @@
+"""
+공고 키워드 검색 (SQLite FTS5)
+
+jobs_fts는 jobs 테이블의 title/description/requirements/preferred를 가리키는 외부 콘텐츠 FTS5 인덱스다.
+jobs의 INSERT/UPDATE/DELETE 트리거로 갱신되므로 ETL의 UPSERT/삭제와 같은 트랜잭션에 반영된다.
+
+한글/영문이 섞인 공고를 형태소 분석 없이 부분 문자열로 찾도록 trigram 토크나이저를 쓴다 (SQLite 3.34+).
+    - trigram은 3글자 미만 검색어를 MATCH로 찾을 수 없으므로 그런 검색어('Go', 'C', '앱')는 LIKE로 거른다.
+    - trigram이 없는 SQLite는 unicode61(공백/구두점 단위 + 접두어 검색), FTS5가 없으면 LIKE 검색만 쓴다.
+검색어는 공백으로 나눠 모두 포함된 공고를 찾고, MATCH가 있으면 bm25 순으로 정렬한다.
+"""
+import sqlite3
+from typing import List, Optional
+
+FTS_TABLE = 'jobs_fts'
+FTS_COLUMNS = ['title', 'description', 'requirements', 'preferred']
+TRIGRAM_MIN_LENGTH = 3
+
+_COLUMN_LIST = ', '.join(FTS_COLUMNS)
+_NEW_VALUES = ', '.join(f'new.{column}' for column in FTS_COLUMNS)
+_OLD_VALUES = ', '.join(f'old.{column}' for column in FTS_COLUMNS)
+
+FTS_TRIGGERS_SQL = f'''
+CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON jobs BEGIN
+    INSERT INTO {FTS_TABLE}(rowid, {_COLUMN_LIST}) VALUES (new.job_id, {_NEW_VALUES});
+END;
+CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON jobs BEGIN
+    INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_COLUMN_LIST}) VALUES ('delete', old.job_id, {_OLD_VALUES});
+END;
+CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF {_COLUMN_LIST} ON jobs BEGIN
+    INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_COLUMN_LIST}) VALUES ('delete', old.job_id, {_OLD_VALUES});
+    INSERT INTO {FTS_TABLE}(rowid, {_COLUMN_LIST}) VALUES (new.job_id, {_NEW_VALUES});
+END;
+'''
+
+
+def fts_tokenizer(conn) -> Optional[str]:
+    """jobs_fts의 토크나이저 이름 (인덱스가 없으면 None)"""
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (FTS_TABLE,)).fetchone()
+    if row is None:
+        return None
+    return 'trigram' if 'trigram' in row[0] else 'unicode61'
+
+
+def create_fts_index(cursor, tokenizer: str = 'trigram') -> Optional[str]:
+    """jobs_fts 인덱스/트리거 생성 (처음 만들 때 기존 공고로 채움)
+
+    Returns:
+        사용 중인 토크나이저 이름 (FTS5를 쓸 수 없으면 None)
+    """
+    existing = fts_tokenizer(cursor.connection)
+    if existing is not None:
+        cursor.executescript(FTS_TRIGGERS_SQL)
+        return existing
+
+    for candidate in dict.fromkeys([tokenizer, 'unicode61']):
+        try:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5({_COLUMN_LIST}, "
+                f"content='jobs', content_rowid='job_id', tokenize='{candidate}')"
+            )
+            break
+        except sqlite3.OperationalError:
+            continue
+    else:
+        print("경고: SQLite FTS5를 쓸 수 없어 키워드 검색은 LIKE 검색으로 대체됩니다.")
+        return None
+
+    if candidate != tokenizer:
+        print(f"경고: FTS5 토크나이저 '{tokenizer}'를 쓸 수 없어 '{candidate}'를 사용합니다.")
+    cursor.executescript(FTS_TRIGGERS_SQL)
+    cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+    return candidate
+
+
+def drop_fts_index(cursor):
+    """jobs_fts 인덱스/트리거 제거 (비활성화 시 공고 쓰기에 트리거 비용이 들지 않도록)"""
+    for suffix in ('ai', 'ad', 'au'):
+        cursor.execute(f'DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}')
+    cursor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+
+
+def _quote(term: str) -> str:
+    """FTS5 문자열 리터럴 (연산자/특수문자를 그대로 검색)"""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%{escaped}%'
+
+
+def search_job_ids(conn, query: str, limit: Optional[int] = None, ranked: bool = True) -> List[int]:
+    """검색어가 모두 포함된 공고 id (MATCH가 있으면 관련도순, LIKE만 쓰면 job_id순)
+
+    ranked=False면 정렬하지 않는다 (후보 필터처럼 순서가 필요 없을 때 흔한 검색어의 bm25 계산 생략).
+    """
+    terms = list(dict.fromkeys(query.split()))
+    if not terms:
+        return []
+
+    tokenizer = fts_tokenizer(conn)
+    if tokenizer == 'trigram':
+        match_terms = [term for term in terms if len(term) >= TRIGRAM_MIN_LENGTH]
+    elif tokenizer == 'unicode61':
+        match_terms = terms
+    else:
+        match_terms = []
+    like_terms = [term for term in terms if term not in match_terms]
+
+    conditions, params = [], []
+    for term in like_terms:
+        conditions.append('(' + ' OR '.join(f"{column} LIKE ? ESCAPE '\\'" for column in FTS_COLUMNS) + ')')
+        params.extend([_like_pattern(term)] * len(FTS_COLUMNS))
+
+    if match_terms:
+        suffix = ' *' if tokenizer == 'unicode61' else ''
+        expression = ' AND '.join(_quote(term) + suffix for term in match_terms)
+        sql = (f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH ?"
+               + ''.join(f' AND {condition}' for condition in conditions) + (' ORDER BY rank' if ranked else ''))
+        params.insert(0, expression)
+    else:
+        sql = 'SELECT job_id FROM jobs WHERE ' + ' AND '.join(conditions) + (' ORDER BY job_id' if ranked else '')
+    if limit is not None:
+        sql += ' LIMIT ?'
+        params.append(int(limit))
+    return [job_id for (job_id,) in conn.execute(sql, params)]
@@ -0,0 +1,33 @@
+"""
+앱 핫 리로드 신호
+
+ETL이 DB/아티팩트를 바꾼 실행을 마치면 스탬프 파일(JSON)을 원자적으로 교체한다.
+실행 중인 앱은 화면을 다시 그릴 때마다 스탬프 내용을 읽어, 매처를 만들 때 본 값과 다르면 매처를 다시 만든다.
+"""
+import json
+import os
+import time
+from typing import Any, Optional
+
+
+def write_reload_stamp(path: str, **payload: Any) -> str:
+    """스탬프 파일 교체 (내용: 기록 시각 + payload)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    stamp = json.dumps({'updated_at': time.strftime('%Y-%m-%dT%H:%M:%S'), 'stamp_ns': time.time_ns(),
+                        **payload}, ensure_ascii=False, sort_keys=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(stamp)
+    os.replace(tmp_path, path)
+    return stamp
+
+
+def read_reload_stamp(path: str) -> Optional[str]:
+    """현재 스탬프 내용 (없으면 None, 비교용 문자열 그대로)"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
@@ -0,0 +1,220 @@
+"""
+기술 스택 표기 정규화 (별칭 테이블 + 정규화 규칙)
+
+'Python'/'파이썬', 'Spring'/'SpringBoot'/'스프링', 'Java 17' 처럼 같은 기술이 여러 표기로
+집계되지 않도록 ETL 적재 시점과 사용자 입력 시점에 같은 규칙으로 대표 표기로 바꾼다.
+"""
+import re
+from typing import Dict, Iterable, List
+
+# 기술 스택 사전 (ETL 토큰화의 기술명 탐지, 별칭이 없는 기술의 대표 표기)
+TECH_KEYWORDS = [
+    # 프로그래밍 언어
+    'Python', '파이썬', 'Java', '자바', 'JavaScript', '자바스크립트', 'TypeScript', 'C', 'C++', '씨플러스플러스',
+    'C#', '씨샵', 'Go', 'Golang', 'Kotlin', 'Swift', 'Ruby', 'R', 'Scala', 'Dart', 'Objective-C', 'Perl',
+    'PHP', 'MATLAB', 'Rust', 'Groovy', 'Delphi', 'VBA',
+
+    # 프론트엔드 프레임워크/라이브러리
+    'React', 'Vue', 'Angular', 'Next.js', 'Nuxt.js', 'Svelte', 'jQuery', 'Bootstrap', 'TailwindCSS', 'Material-UI', 'Redux',
+    'Recoil', 'Styled-Components',
+
+    # 백엔드 프레임워크/라이브러리
+    'Spring', 'SpringBoot', '스프링', 'Express', 'Django', 'Flask', 'FastAPI', 'NestJS', 'Node.js', 'Koa', 'Ruby on Rails',
+    'ASP.NET', 'JSP', 'Tibero', 'nexacro',
+
+    # 데이터베이스
+    'MySQL', 'MariaDB', 'PostgreSQL', 'Oracle', 'MSSQL', 'MongoDB', 'Redis', 'Elasticsearch', 'Cassandra', 'DynamoDB',
+    'SQLite', 'Amazon RDS', 'Google BigQuery', 'HBase', 'CouchDB',
+
+    # DevOps/Infra/클라우드
+    'AWS', '에이더블유에스', 'Amazon Web Services', 'Azure', 'GCP', 'Google Cloud', 'Google Cloud Platform', 'Kubernetes',
+    'Docker', 'Jenkins', 'Git', 'GitHub', 'GitLab', 'Travis CI', 'CircleCI', 'Ansible', 'Terraform', 'Nginx', 'Apache',
+    'Tomcat', 'CI/CD', 'CDN', 'S3', 'EC2', 'ECS', 'Lambda', 'VPC', 'Firebase', 'CloudFront', 'ELB', 'Route53', 'SQS', 'Kafka',
+    'RabbitMQ', 'Zookeeper', 'Prometheus', 'Grafana', 'Logstash', 'Filebeat', 'Datadog', 'New Relic', 'OpenStack',
+
+    # 빅데이터/머신러닝/AI
+    'TensorFlow', '텐서플로우', 'PyTorch', '사이킷런', 'scikit-learn', 'Keras', 'XGBoost', 'LightGBM', 'CatBoost', 'HuggingFace',
+    'Transformers', 'OpenCV', 'MXNet', 'Torch', 'ONNX', 'DNN', 'MLlib', 'Pandas', 'NumPy', 'Matplotlib', 'Seaborn', 'Plotly',
+    'DataRobot', 'Dataiku', 'MLflow',
+
+    # 데이터 엔지니어링/분석/ETL
+    'Airflow', 'Luigi', 'NiFi', 'Talend', 'Pentaho', 'Informatica', 'Spark', '하둡', 'Hadoop', 'Hive', 'Pig', 'Presto', 'Superset',
+    'Tableau', 'PowerBI', 'QlikView', 'Metabase', 'Redash', 'Data Studio', 'Looker', 'Google Analytics',
+
+    # API/통신/보안
+    'REST', 'RESTful', 'GraphQL', 'gRPC', 'SOAP', 'WebSocket', 'JWT', 'OAuth', 'OpenAPI', 'Swagger', 'SAML', 'SFTP', 'SSL', 'TLS',
+
+    # 기타 도구/기술/용어
+    'Linux', 'Ubuntu', 'CentOS', 'RedHat', 'Windows Server', 'MacOS', 'VSCode', 'IntelliJ', 'PyCharm', 'Eclipse', 'JIRA',
+    'Confluence', 'Slack', 'Notion', 'Zoom', 'Teams', 'Figma', 'Zeplin', 'Sketch', 'Adobe XD', 'Photoshop', 'Illustrator',
+    'Firebase', 'Notion', 'GitBook', 'Trello', 'Asana', 'Miro',
+
+    # 테스트/품질/협업
+    'Jest', 'Mocha', 'Chai', 'JUnit', 'Mockito', 'Selenium', 'Cypress', 'Appium', 'TestNG', 'QUnit', 'SonarQube', 'Allure',
+
+    # 산업별 솔루션/ERP/CRM/특수 시스템 (예시)
+    'SAP', 'ERP', 'CRM', 'Salesforce', 'SAP HANA', 'Oracle EBS', 'PeopleSoft', 'Workday',
+
+    # 자연어처리/챗봇
+    'BERT', 'GPT', 'ChatGPT', 'KoBERT', 'ELECTRA', 'spaCy', 'NLTK', 'SentencePiece',
+
+    # 금융/핀테크 특화
+    'OpenBanking', 'ISO20022', 'FIDO', 'NICE', 'KISA', 'VAN', 'PG사', 'CMS', '핀테크', '제로페이'
+]
+
+# 대표 표기 -> 별칭 목록
+SKILL_ALIASES: Dict[str, List[str]] = {
+    # 프로그래밍 언어
+    'Python': ['파이썬', 'py'],
+    'Java': ['자바'],
+    'JavaScript': ['자바스크립트', 'js', 'ECMAScript'],
+    'TypeScript': ['타입스크립트', 'ts'],
+    'C++': ['씨플러스플러스', 'cpp'],
+    'C#': ['씨샵', 'csharp'],
+    'Go': ['Golang', '고랭'],
+    'Kotlin': ['코틀린'],
+    'Objective-C': ['objc'],
+    'HTML': ['HTML5'],
+    'CSS': ['CSS3'],
+
+    # 프레임워크/라이브러리
+    'Spring': ['SpringBoot', 'Spring Boot', 'Spring Framework', '스프링', '스프링부트'],
+    'React': ['React.js', 'ReactJS', '리액트'],
+    'Vue': ['Vue.js', 'VueJS'],
+    'Angular': ['AngularJS', 'Angular.js'],
+    'Next.js': ['NextJS'],
+    'Nuxt.js': ['NuxtJS'],
+    'Node.js': ['NodeJS', 'Node'],
+    'Express': ['Express.js', 'ExpressJS'],
+    'NestJS': ['Nest.js'],
+    'Ruby on Rails': ['Rails', 'RoR'],
+    'TailwindCSS': ['Tailwind', 'Tailwind CSS'],
+    'Material-UI': ['MUI'],
+    'scikit-learn': ['사이킷런', 'sklearn'],
+    'TensorFlow': ['텐서플로우', '텐서플로'],
+    'PyTorch': ['파이토치'],
+    'HuggingFace': ['Hugging Face'],
+
+    # 데이터베이스
+    'MySQL': ['마이에스큐엘'],
+    'PostgreSQL': ['Postgres', '포스트그레스'],
+    'MongoDB': ['Mongo', '몽고디비'],
+    'Redis': ['레디스'],
+    'Oracle': ['오라클', 'Oracle DB'],
+    'MSSQL': ['MS SQL', 'SQL Server'],
+
+    # 클라우드/인프라
+    'AWS': ['Amazon Web Services', '에이더블유에스'],
+    'GCP': ['Google Cloud', 'Google Cloud Platform'],
+    'Azure': ['Microsoft Azure', '애저'],
+    'Kubernetes': ['k8s', '쿠버네티스'],
+    'Docker': ['도커'],
+    'Jenkins': ['젠킨스'],
+    'Git': ['깃'],
+    'GitHub': ['깃허브'],
+    'Linux': ['리눅스'],
+    'CI/CD': ['CICD'],
+
+    # 데이터 엔지니어링
+    'Hadoop': ['하둡', 'Apache Hadoop'],
+    'Spark': ['Apache Spark', '스파크'],
+    'Kafka': ['Apache Kafka', '카프카'],
+    'Airflow': ['Apache Airflow', '에어플로우'],
+    'PowerBI': ['Power BI'],
+
+    # API/통신
+    'REST': ['RESTful', 'REST API', 'RESTful API'],
+}
+
+# 숫자까지가 이름인 기술 (버전 표기로 보고 떼어 내지 않는다): 대표 표기 -> 별칭 목록
+VERSIONED_SKILLS: Dict[str, List[str]] = {
+    'C89': ['ANSI C', 'C90'],
+    'C99': [],
+    'C11': [],
+    'C17': ['C18'],
+    'OAuth2': ['OAuth 2', 'OAuth 2.0', 'OAuth2.0'],
+    'GPT-3': [],
+    'GPT-3.5': [],
+    'GPT-4': [],
+    'TLS 1.2': [],
+    'TLS 1.3': [],
+    'HTTP/2': ['HTTP2'],
+    'HTTP/3': ['HTTP3'],
+}
+
+# 끝에 붙은 버전 표기: 'Java 17', 'Python3', 'Spring Boot 2.x', 'Python(3.x)', 'Angular v12', 'Java 8+'
+VERSION_SUFFIX_PATTERN = re.compile(
+    r'^(?P<base>.+?)(?P<sep>\s+v?|\s*\(\s*v?)?(?P<version>\d+(?:\.(?:\d+|[xX]))*\+?)\s*\)?$'
+)
+COMPACT_PATTERN = re.compile(r'[\s\-_.]+')
+
+
+def _compact(text: str) -> str:
+    """조회 키: 소문자 + 공백/하이픈/밑줄/마침표 제거 ('Spring Boot' == 'springboot')"""
+    return COMPACT_PATTERN.sub('', text.lower())
+
+
+class SkillCanonicalizer:
+    """별칭 테이블과 정규화 규칙으로 기술 스택 대표 표기 결정
+
+    known_skills는 별칭이 없는 기술의 대표 표기(대소문자)로 쓰이며, 별칭 테이블이 우선한다.
+    버전 표기는 떼어 낸 이름이 아는 기술일 때만 제거한다 (VERSIONED_SKILLS는 숫자까지 이름).
+    """
+
+    def __init__(self, aliases: Dict[str, List[str]] = None, known_skills: Iterable[str] = ()):
+        self._index: Dict[str, str] = {}
+        for skill in known_skills:
+            self._index.setdefault(_compact(skill), skill)
+        for canonical, names in (SKILL_ALIASES if aliases is None else aliases).items():
+            self._index[_compact(canonical)] = canonical
+            for name in names:
+                self._index[_compact(name)] = canonical
+        for canonical, names in VERSIONED_SKILLS.items():
+            for name in [canonical, *names]:
+                self._index[_compact(name)] = canonical
+
+    def canonicalize(self, skill: str) -> str:
+        """대표 표기 (아는 기술의 버전 표기는 제거, 모르는 기술은 공백만 정리)"""
+        text = ' '.join(str(skill).split())
+        if not text:
+            return text
+
+        canonical = self._index.get(_compact(text))
+        if canonical is not None:
+            return canonical
+
+        match = VERSION_SUFFIX_PATTERN.match(text)
+        if match:
+            base = match.group('base').strip()
+            canonical = self._index.get(_compact(base))
+            # 'R2', 'C4' 처럼 한 글자 이름에 붙은 숫자는 다른 제품명이므로 공백/괄호로 구분된 경우만 버전
+            if canonical is not None and (match.group('sep') or len(_compact(base)) > 1):
+                return canonical
+        return text
+
+    def canonicalize_skills(self, skills: Iterable[str]) -> List[str]:
+        """대표 표기로 바꾼 뒤 중복 제거 (대소문자 무시, 처음 나온 순서 유지)"""
+        result, seen = [], set()
+        for skill in skills:
+            if not isinstance(skill, str):
+                continue
+            canonical = self.canonicalize(skill)
+            key = canonical.casefold()
+            if canonical and key not in seen:
+                seen.add(key)
+                result.append(canonical)
+        return result
+
+
+# ETL 적재와 사용자 입력이 함께 쓰는 공용 인스턴스 (양쪽 대표 표기가 같아야 정확히 일치한다)
+SKILL_CANONICALIZER = SkillCanonicalizer(known_skills=TECH_KEYWORDS)
+
+
+def canonicalize_skill(skill: str) -> str:
+    """공용 규칙 기준 대표 표기"""
+    return SKILL_CANONICALIZER.canonicalize(skill)
+
+
+def canonicalize_skills(skills: Iterable[str]) -> List[str]:
+    """공용 규칙 기준 대표 표기 목록 (중복 제거)"""
+    return SKILL_CANONICALIZER.canonicalize_skills(skills)